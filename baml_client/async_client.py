@@ -85,18 +85,26 @@ class BamlAsyncClient:
         query: str,
         history: typing.List[str],
         baml_options: BamlCallOptions = {},
-    ) -> typing.Union[
-        "types.ReadFile",
-        "types.WriteFile",
-        "types.ListDirectoryContents",
-        "types.FindContentInFile",
-        "types.GetUserInput",
-        "types.ReviewAndConfirmChanges",
-        "types.CollectUserFeedback",
-        "types.RequestHumanIntervention",
-        "types.FinalAnswer",
-        "types.WebFetch",
-        "types.APIFetch",
+    ) -> typing.List[
+        typing.Union[
+            "types.ReadFile",
+            "types.WriteFile",
+            "types.EditFile",
+            "types.ReplaceLines",
+            "types.ApplyPatch",
+            "types.ListDirectoryContents",
+            "types.ListDirectoryTree",
+            "types.FindContentInFile",
+            "types.SearchWorkspace",
+            "types.GetUserInput",
+            "types.ReviewAndConfirmChanges",
+            "types.CollectUserFeedback",
+            "types.RequestHumanIntervention",
+            "types.FinalAnswer",
+            "types.WebFetch",
+            "types.APIFetch",
+            "types.ReadBlob",
+        ]
     ]:
         result = await self.__options.merge_options(baml_options).call_function_async(
             function_name="Orchestrate",
@@ -106,18 +114,26 @@ class BamlAsyncClient:
             },
         )
         return typing.cast(
-            typing.Union[
-                "types.ReadFile",
-                "types.WriteFile",
-                "types.ListDirectoryContents",
-                "types.FindContentInFile",
-                "types.GetUserInput",
-                "types.ReviewAndConfirmChanges",
-                "types.CollectUserFeedback",
-                "types.RequestHumanIntervention",
-                "types.FinalAnswer",
-                "types.WebFetch",
-                "types.APIFetch",
+            typing.List[
+                typing.Union[
+                    "types.ReadFile",
+                    "types.WriteFile",
+                    "types.EditFile",
+                    "types.ReplaceLines",
+                    "types.ApplyPatch",
+                    "types.ListDirectoryContents",
+                    "types.ListDirectoryTree",
+                    "types.FindContentInFile",
+                    "types.SearchWorkspace",
+                    "types.GetUserInput",
+                    "types.ReviewAndConfirmChanges",
+                    "types.CollectUserFeedback",
+                    "types.RequestHumanIntervention",
+                    "types.FinalAnswer",
+                    "types.WebFetch",
+                    "types.APIFetch",
+                    "types.ReadBlob",
+                ]
             ],
             result.cast_to(types, types, stream_types, False, __runtime__),
         )
@@ -150,59 +166,38 @@ class BamlStreamClient:
         history: typing.List[str],
         baml_options: BamlCallOptions = {},
     ) -> baml_py.BamlStream[
-        typing.Union[
-            "stream_types.ReadFile",
-            "stream_types.WriteFile",
-            "stream_types.ListDirectoryContents",
-            "stream_types.FindContentInFile",
-            "stream_types.GetUserInput",
-            "stream_types.ReviewAndConfirmChanges",
-            "stream_types.CollectUserFeedback",
-            "stream_types.RequestHumanIntervention",
-            "stream_types.FinalAnswer",
-            "stream_types.WebFetch",
-            "stream_types.APIFetch",
-        ],
-        typing.Union[
-            "types.ReadFile",
-            "types.WriteFile",
-            "types.ListDirectoryContents",
-            "types.FindContentInFile",
-            "types.GetUserInput",
-            "types.ReviewAndConfirmChanges",
-            "types.CollectUserFeedback",
-            "types.RequestHumanIntervention",
-            "types.FinalAnswer",
-            "types.WebFetch",
-            "types.APIFetch",
-        ],
-    ]:
-        ctx, result = self.__options.merge_options(baml_options).create_async_stream(
-            function_name="Orchestrate",
-            args={
-                "query": query,
-                "history": history,
-            },
-        )
-        return baml_py.BamlStream[
+        typing.List[
             typing.Union[
-                "stream_types.ReadFile",
-                "stream_types.WriteFile",
-                "stream_types.ListDirectoryContents",
-                "stream_types.FindContentInFile",
-                "stream_types.GetUserInput",
-                "stream_types.ReviewAndConfirmChanges",
-                "stream_types.CollectUserFeedback",
-                "stream_types.RequestHumanIntervention",
+                "types.ReadFile",
+                "types.WriteFile",
+                "types.EditFile",
+                "types.ReplaceLines",
+                "types.ApplyPatch",
+                "types.ListDirectoryContents",
+                "types.ListDirectoryTree",
+                "types.FindContentInFile",
+                "types.SearchWorkspace",
+                "types.GetUserInput",
+                "types.ReviewAndConfirmChanges",
+                "types.CollectUserFeedback",
+                "types.RequestHumanIntervention",
                 "stream_types.FinalAnswer",
-                "stream_types.WebFetch",
-                "stream_types.APIFetch",
-            ],
+                "types.WebFetch",
+                "types.APIFetch",
+                "types.ReadBlob",
+            ]
+        ],
+        typing.List[
             typing.Union[
                 "types.ReadFile",
                 "types.WriteFile",
+                "types.EditFile",
+                "types.ReplaceLines",
+                "types.ApplyPatch",
                 "types.ListDirectoryContents",
+                "types.ListDirectoryTree",
                 "types.FindContentInFile",
+                "types.SearchWorkspace",
                 "types.GetUserInput",
                 "types.ReviewAndConfirmChanges",
                 "types.CollectUserFeedback",
@@ -210,31 +205,50 @@ class BamlStreamClient:
                 "types.FinalAnswer",
                 "types.WebFetch",
                 "types.APIFetch",
-            ],
-        ](
-            result,
-            lambda x: typing.cast(
+                "types.ReadBlob",
+            ]
+        ],
+    ]:
+        ctx, result = self.__options.merge_options(baml_options).create_async_stream(
+            function_name="Orchestrate",
+            args={
+                "query": query,
+                "history": history,
+            },
+        )
+        return baml_py.BamlStream[
+            typing.List[
                 typing.Union[
-                    "stream_types.ReadFile",
-                    "stream_types.WriteFile",
-                    "stream_types.ListDirectoryContents",
-                    "stream_types.FindContentInFile",
-                    "stream_types.GetUserInput",
-                    "stream_types.ReviewAndConfirmChanges",
-                    "stream_types.CollectUserFeedback",
-                    "stream_types.RequestHumanIntervention",
+                    "types.ReadFile",
+                    "types.WriteFile",
+                    "types.EditFile",
+                    "types.ReplaceLines",
+                    "types.ApplyPatch",
+                    "types.ListDirectoryContents",
+                    "types.ListDirectoryTree",
+                    "types.FindContentInFile",
+                    "types.SearchWorkspace",
+                    "types.GetUserInput",
+                    "types.ReviewAndConfirmChanges",
+                    "types.CollectUserFeedback",
+                    "types.RequestHumanIntervention",
                     "stream_types.FinalAnswer",
-                    "stream_types.WebFetch",
-                    "stream_types.APIFetch",
-                ],
-                x.cast_to(types, types, stream_types, True, __runtime__),
-            ),
-            lambda x: typing.cast(
+                    "types.WebFetch",
+                    "types.APIFetch",
+                    "types.ReadBlob",
+                ]
+            ],
+            typing.List[
                 typing.Union[
                     "types.ReadFile",
                     "types.WriteFile",
+                    "types.EditFile",
+                    "types.ReplaceLines",
+                    "types.ApplyPatch",
                     "types.ListDirectoryContents",
+                    "types.ListDirectoryTree",
                     "types.FindContentInFile",
+                    "types.SearchWorkspace",
                     "types.GetUserInput",
                     "types.ReviewAndConfirmChanges",
                     "types.CollectUserFeedback",
@@ -242,6 +256,56 @@ class BamlStreamClient:
                     "types.FinalAnswer",
                     "types.WebFetch",
                     "types.APIFetch",
+                    "types.ReadBlob",
+                ]
+            ],
+        ](
+            result,
+            lambda x: typing.cast(
+                typing.List[
+                    typing.Union[
+                        "types.ReadFile",
+                        "types.WriteFile",
+                        "types.EditFile",
+                        "types.ReplaceLines",
+                        "types.ApplyPatch",
+                        "types.ListDirectoryContents",
+                        "types.ListDirectoryTree",
+                        "types.FindContentInFile",
+                        "types.SearchWorkspace",
+                        "types.GetUserInput",
+                        "types.ReviewAndConfirmChanges",
+                        "types.CollectUserFeedback",
+                        "types.RequestHumanIntervention",
+                        "stream_types.FinalAnswer",
+                        "types.WebFetch",
+                        "types.APIFetch",
+                        "types.ReadBlob",
+                    ]
+                ],
+                x.cast_to(types, types, stream_types, True, __runtime__),
+            ),
+            lambda x: typing.cast(
+                typing.List[
+                    typing.Union[
+                        "types.ReadFile",
+                        "types.WriteFile",
+                        "types.EditFile",
+                        "types.ReplaceLines",
+                        "types.ApplyPatch",
+                        "types.ListDirectoryContents",
+                        "types.ListDirectoryTree",
+                        "types.FindContentInFile",
+                        "types.SearchWorkspace",
+                        "types.GetUserInput",
+                        "types.ReviewAndConfirmChanges",
+                        "types.CollectUserFeedback",
+                        "types.RequestHumanIntervention",
+                        "types.FinalAnswer",
+                        "types.WebFetch",
+                        "types.APIFetch",
+                        "types.ReadBlob",
+                    ]
                 ],
                 x.cast_to(types, types, stream_types, False, __runtime__),
             ),
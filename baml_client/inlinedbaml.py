@@ -12,8 +12,8 @@
 
 _file_map = {
     "config.baml": 'client OpenRouter {\n  provider "openai-generic"\n  options {\n    api_key env.OPENROUTER_API_KEY\n    base_url "https://openrouter.ai/api/v1"\n    model "deepseek/deepseek-chat:free"\n  }\n}\n',
-    "functions.baml": 'function Orchestrate(query: string, history: string[]) -> ReadFile | WriteFile | ListDirectoryContents | FindContentInFile | GetUserInput | ReviewAndConfirmChanges | CollectUserFeedback | RequestHumanIntervention | FinalAnswer | WebFetch | APIFetch {\n  client OpenRouter\n  prompt #"\n    You are a helpful assistant. Your job is to help the user with their request.\n    You have the following tools at your disposal, defined as classes:\n    {{ ctx.output_format }}\n\n    Based on the user\'s query and the conversation history, which tool should you use? You must use a tool.\n\n    Query: {{ query }}\n    {% if history is defined and history|length > 0 %}\n    History:\n    {{ history | join("\\n") }}\n    {% endif %}\n\n    Choose the best tool for the query and fill in the parameters.\n  "#\n}\n\nfunction SummarizeText(text: string) -> string {\n  client OpenRouter\n  prompt #"\n    Summarize the following text, keeping the summary concise and under 200 words:\n\n    {{ text }}\n  "#\n}\n',
-    "types.baml": 'class ReadFile {\n  tool_name "read_file" @description("Reads the content of a given file path.")\n  file_path string @description("The path to the file to read.")\n  limit int @description("The maximum number of characters to return.")\n  offset int @description("The number of characters to skip before starting to collect the result set.")\n}\n\nclass WriteFile {\n  tool_name "write_file" @description("Writes the given content to a file at the specified path.")\n  file_path string @description("The path to the file to write to.")\n  content string @description("The content to write to the file.")\n}\n\nclass ListDirectoryContents {\n  tool_name "list_directory_contents" @description("Lists all non-hidden files and subdirectories within a given directory.")\n  directory_path string @description("The path to the directory to list. Defaults to .")\n}\n\nclass FindContentInFile {\n  tool_name "find_content_in_file" @description("Reads the content of a file and returns lines containing the search query.")\n  file_path string @description("The path to the file to search within.")\n  search_query string @description("The string to search for (case-insensitive).")\n}\n\nclass GetUserInput {\n  tool_name "get_user_text_input" @description("Gets free-form text input from the user via the CLI.")\n  prompt_message string @description("The message to display to the user.")\n}\n\nclass ReviewAndConfirmChanges {\n  tool_name "review_and_confirm_changes" @description("Displays a diff of proposed changes and asks for user confirmation to apply them.")\n  file_path string @description("The path to the file to be modified.")\n  new_content string @description("The proposed new content for the file.")\n}\n\nclass CollectUserFeedback {\n  tool_name "collect_feedback" @description("Logs feedback to the console and a file.")\n  task_id string @description("The ID of the task related to the feedback.")\n  feedback_type string @description("The type of feedback (e.g., \'info\', \'warning\', \'error\').")\n  message string @description("The feedback message.")\n}\n\nclass RequestHumanIntervention {\n  tool_name "request_human_intervention" @description("Pauses the agent and prompts the user for new instructions.")\n  reason string @description("The reason for requesting intervention.")\n}\n\nclass FinalAnswer {\n  tool_name "final_answer" @description("Provides the final answer to the user.")\n  answer string @description("The final answer to be provided to the user.")\n}\n\nclass WebFetch {\n  tool_name "fetch_page_content" @description("Fetches the full HTML content of a given URL using a headless browser.")\n  url string @description("The URL to fetch.")\n  limit int @description("The maximum number of characters to return.")\n  offset int @description("The number of characters to skip before starting to collect the result set.")\n  convert_to_text bool @description("If true, converts the HTML content to plain text using html2text.")\n}\n\nclass APIFetch {\n  tool_name "fetch_api_data" @description("Fetches data from a given API endpoint.")\n  url string @description("The URL of the API endpoint.")\n  method string @description("The HTTP method to use (GET, POST, PUT, DELETE, etc.). Defaults to GET.")\n  headers map<string, string> @description("A dictionary of HTTP headers to send with the request.")\n  data map<string, string> @description("A dictionary of data to send in the request body (for POST, PUT, etc.).")\n  limit int @description("The maximum number of bytes to return. Must be set to avoid exceeds maximum token")\n  offset int @description("The number of bytes to skip before starting to collect the result set.")\n}\n',
+    "functions.baml": 'function Orchestrate(query: string, history: string[]) -> (ReadFile | WriteFile | EditFile | ReplaceLines | ApplyPatch | ListDirectoryContents | ListDirectoryTree | FindContentInFile | SearchWorkspace | GetUserInput | ReviewAndConfirmChanges | CollectUserFeedback | RequestHumanIntervention | FinalAnswer | WebFetch | APIFetch | ReadBlob)[] {\n  client OpenRouter\n  prompt #"\n    You are a helpful assistant. Your job is to help the user with their request.\n    You have the following tools at your disposal, defined as classes:\n    {{ ctx.output_format }}\n\n    Based on the user\'s query and the conversation history, which tools should you use? You must use at least one tool.\n    Return a list of tool calls. When several calls do not depend on each other\'s results\n    (for example reading multiple files), return them together so they run in one step.\n    Calls run in the listed order. FinalAnswer must be the only call in its list.\n    Large results of earlier steps are shown as a preview with a blob handle; use ReadBlob\n    to read more of them instead of running the original tool again.\n    To change part of an existing file, use EditFile, ReplaceLines or ApplyPatch rather than\n    rewriting the whole file with WriteFile.\n\n    Query: {{ query }}\n    {% if history is defined and history|length > 0 %}\n    History:\n    {{ history | join("\\n") }}\n    {% endif %}\n\n    Choose the best tools for the query and fill in the parameters.\n  "#\n}\n\nfunction SummarizeText(text: string) -> string {\n  client OpenRouter\n  prompt #"\n    Summarize the following text, keeping the summary concise and under 200 words:\n\n    {{ text }}\n  "#\n}\n',
+    "types.baml": 'class ReadFile {\n  tool_name "read_file" @description("Reads the content of a given file path.")\n  file_path string @description("The path to the file to read.")\n  limit int @description("The maximum number of characters to return.")\n  offset int @description("The number of characters to skip before starting to collect the result set.")\n  @@stream.done\n}\n\nclass WriteFile {\n  tool_name "write_file" @description("Writes the given content to a file at the specified path.")\n  file_path string @description("The path to the file to write to.")\n  content string @description("The content to write to the file.")\n  @@stream.done\n}\n\nclass EditFile {\n  tool_name "edit_file" @description("Replaces exact text in an existing file. Prefer this, ReplaceLines or ApplyPatch over WriteFile to change part of a file.")\n  file_path string @description("The path to the file to edit.")\n  old_text string @description("The text to replace, copied exactly from the file including whitespace and indentation. It must occur exactly once unless replace_all is true.")\n  new_text string @description("The text to put in its place.")\n  replace_all bool @description("If true, replaces every occurrence of old_text.")\n  @@stream.done\n}\n\nclass ReplaceLines {\n  tool_name "replace_lines" @description("Replaces a range of lines of an existing file.")\n  file_path string @description("The path to the file to edit.")\n  start_line int @description("The first line to replace, counting from 1.")\n  end_line int @description("The last line to replace, inclusive. Use start_line - 1 to insert before start_line without replacing anything.")\n  expected_text string? @description("The current text of the lines being replaced. If given, the edit is rejected unless they match it exactly.")\n  new_text string @description("The text the lines are replaced with.")\n  @@stream.done\n}\n\nclass ApplyPatch {\n  tool_name "apply_patch" @description("Applies a unified diff to one file.")\n  file_path string @description("The path to the file to patch.")\n  patch string @description("A unified diff of this file with @@ hunk headers. Context and removed lines must match the file exactly.")\n  @@stream.done\n}\n\nclass ListDirectoryContents {\n  tool_name "list_directory_contents" @description("Lists all non-hidden files and subdirectories within a given directory.")\n  directory_path string @description("The path to the directory to list. Defaults to .")\n  @@stream.done\n}\n\nclass ListDirectoryTree {\n  tool_name "list_directory_tree" @description("Lists a directory recursively as a tree with directory markers and file sizes, skipping hidden and .gitignore\'d entries.")\n  directory_path string @description("The path to the directory to list. Defaults to .")\n  max_depth int @description("The number of directory levels to descend.")\n  max_entries int @description("The maximum number of entries to return.")\n  @@stream.done\n}\n\nclass FindContentInFile {\n  tool_name "find_content_in_file" @description("Reads the content of a file and returns lines containing the search query.")\n  file_path string @description("The path to the file to search within.")\n  search_query string @description("The string to search for (case-insensitive).")\n  @@stream.done\n}\n\nclass SearchWorkspace {\n  tool_name "search_workspace" @description("Searches every file under a directory for a literal string or regular expression and returns file:line matches with context.")\n  query string @description("The text or regular expression to search for.")\n  directory_path string @description("The directory to search. Defaults to .")\n  is_regex bool @description("If true, the query is a regular expression; otherwise it is matched literally.")\n  case_sensitive bool @description("If true, matching is case-sensitive.")\n  include string[] @description("Glob patterns of files to search, e.g. [\'*.py\']. Empty searches all files.")\n  exclude string[] @description("Glob patterns of files or directories to skip.")\n  context_lines int @description("The number of lines of context shown around each match.")\n  max_results_per_file int @description("The maximum number of matches returned per file.")\n  @@stream.done\n}\n\nclass GetUserInput {\n  tool_name "get_user_text_input" @description("Gets free-form text input from the user via the CLI.")\n  prompt_message string @description("The message to display to the user.")\n  @@stream.done\n}\n\nclass ReviewAndConfirmChanges {\n  tool_name "review_and_confirm_changes" @description("Displays a diff of proposed changes and asks for user confirmation to apply them.")\n  file_path string @description("The path to the file to be modified.")\n  new_content string @description("The proposed new content for the file.")\n  @@stream.done\n}\n\nclass CollectUserFeedback {\n  tool_name "collect_feedback" @description("Logs feedback to the console and a file.")\n  task_id string @description("The ID of the task related to the feedback.")\n  feedback_type string @description("The type of feedback (e.g., \'info\', \'warning\', \'error\').")\n  message string @description("The feedback message.")\n  @@stream.done\n}\n\nclass RequestHumanIntervention {\n  tool_name "request_human_intervention" @description("Pauses the agent and prompts the user for new instructions.")\n  reason string @description("The reason for requesting intervention.")\n  @@stream.done\n}\n\nclass FinalAnswer {\n  tool_name "final_answer" @description("Provides the final answer to the user.") @stream.not_null\n  answer string @description("The final answer to be provided to the user.")\n}\n\nclass WebFetch {\n  tool_name "fetch_page_content" @description("Fetches the full HTML content of a given URL using a headless browser.")\n  url string @description("The URL to fetch.")\n  limit int @description("The maximum number of characters to return.")\n  offset int @description("The number of characters to skip before starting to collect the result set.")\n  convert_to_text bool @description("If true, converts the HTML content to plain text using html2text.")\n  @@stream.done\n}\n\nclass APIFetch {\n  tool_name "fetch_api_data" @description("Fetches data from a given API endpoint.")\n  url string @description("The URL of the API endpoint.")\n  method string @description("The HTTP method to use (GET, POST, PUT, DELETE, etc.). Defaults to GET.")\n  headers map<string, string> @description("A dictionary of HTTP headers to send with the request.")\n  data map<string, string> @description("A dictionary of data to send in the request body (for POST, PUT, etc.).")\n  limit int @description("The maximum number of bytes to return. Must be set to avoid exceeds maximum token")\n  offset int @description("The number of bytes to skip before starting to collect the result set.")\n  @@stream.done\n}\n\nclass ReadBlob {\n  tool_name "read_blob" @description("Reads part of a large earlier tool result by its blob handle. History shows only a preview of such results.")\n  handle string @description("The blob handle shown in the history entry.")\n  limit int @description("The maximum number of characters to return.")\n  offset int @description("The number of characters to skip before starting to collect the result set.")\n  @@stream.done\n}\n',
 }
 
 
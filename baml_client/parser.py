@@ -27,35 +27,51 @@ class LlmResponseParser:
         self,
         llm_response: str,
         baml_options: BamlCallOptions = {},
-    ) -> typing.Union[
-        "types.ReadFile",
-        "types.WriteFile",
-        "types.ListDirectoryContents",
-        "types.FindContentInFile",
-        "types.GetUserInput",
-        "types.ReviewAndConfirmChanges",
-        "types.CollectUserFeedback",
-        "types.RequestHumanIntervention",
-        "types.FinalAnswer",
-        "types.WebFetch",
-        "types.APIFetch",
+    ) -> typing.List[
+        typing.Union[
+            "types.ReadFile",
+            "types.WriteFile",
+            "types.EditFile",
+            "types.ReplaceLines",
+            "types.ApplyPatch",
+            "types.ListDirectoryContents",
+            "types.ListDirectoryTree",
+            "types.FindContentInFile",
+            "types.SearchWorkspace",
+            "types.GetUserInput",
+            "types.ReviewAndConfirmChanges",
+            "types.CollectUserFeedback",
+            "types.RequestHumanIntervention",
+            "types.FinalAnswer",
+            "types.WebFetch",
+            "types.APIFetch",
+            "types.ReadBlob",
+        ]
     ]:
         result = self.__options.merge_options(baml_options).parse_response(
             function_name="Orchestrate", llm_response=llm_response, mode="request"
         )
         return typing.cast(
-            typing.Union[
-                "types.ReadFile",
-                "types.WriteFile",
-                "types.ListDirectoryContents",
-                "types.FindContentInFile",
-                "types.GetUserInput",
-                "types.ReviewAndConfirmChanges",
-                "types.CollectUserFeedback",
-                "types.RequestHumanIntervention",
-                "types.FinalAnswer",
-                "types.WebFetch",
-                "types.APIFetch",
+            typing.List[
+                typing.Union[
+                    "types.ReadFile",
+                    "types.WriteFile",
+                    "types.EditFile",
+                    "types.ReplaceLines",
+                    "types.ApplyPatch",
+                    "types.ListDirectoryContents",
+                    "types.ListDirectoryTree",
+                    "types.FindContentInFile",
+                    "types.SearchWorkspace",
+                    "types.GetUserInput",
+                    "types.ReviewAndConfirmChanges",
+                    "types.CollectUserFeedback",
+                    "types.RequestHumanIntervention",
+                    "types.FinalAnswer",
+                    "types.WebFetch",
+                    "types.APIFetch",
+                    "types.ReadBlob",
+                ]
             ],
             result,
         )
@@ -81,35 +97,51 @@ class LlmStreamParser:
         self,
         llm_response: str,
         baml_options: BamlCallOptions = {},
-    ) -> typing.Union[
-        "stream_types.ReadFile",
-        "stream_types.WriteFile",
-        "stream_types.ListDirectoryContents",
-        "stream_types.FindContentInFile",
-        "stream_types.GetUserInput",
-        "stream_types.ReviewAndConfirmChanges",
-        "stream_types.CollectUserFeedback",
-        "stream_types.RequestHumanIntervention",
-        "stream_types.FinalAnswer",
-        "stream_types.WebFetch",
-        "stream_types.APIFetch",
+    ) -> typing.List[
+        typing.Union[
+            "types.ReadFile",
+            "types.WriteFile",
+            "types.EditFile",
+            "types.ReplaceLines",
+            "types.ApplyPatch",
+            "types.ListDirectoryContents",
+            "types.ListDirectoryTree",
+            "types.FindContentInFile",
+            "types.SearchWorkspace",
+            "types.GetUserInput",
+            "types.ReviewAndConfirmChanges",
+            "types.CollectUserFeedback",
+            "types.RequestHumanIntervention",
+            "stream_types.FinalAnswer",
+            "types.WebFetch",
+            "types.APIFetch",
+            "types.ReadBlob",
+        ]
     ]:
         result = self.__options.merge_options(baml_options).parse_response(
             function_name="Orchestrate", llm_response=llm_response, mode="stream"
         )
         return typing.cast(
-            typing.Union[
-                "stream_types.ReadFile",
-                "stream_types.WriteFile",
-                "stream_types.ListDirectoryContents",
-                "stream_types.FindContentInFile",
-                "stream_types.GetUserInput",
-                "stream_types.ReviewAndConfirmChanges",
-                "stream_types.CollectUserFeedback",
-                "stream_types.RequestHumanIntervention",
-                "stream_types.FinalAnswer",
-                "stream_types.WebFetch",
-                "stream_types.APIFetch",
+            typing.List[
+                typing.Union[
+                    "types.ReadFile",
+                    "types.WriteFile",
+                    "types.EditFile",
+                    "types.ReplaceLines",
+                    "types.ApplyPatch",
+                    "types.ListDirectoryContents",
+                    "types.ListDirectoryTree",
+                    "types.FindContentInFile",
+                    "types.SearchWorkspace",
+                    "types.GetUserInput",
+                    "types.ReviewAndConfirmChanges",
+                    "types.CollectUserFeedback",
+                    "types.RequestHumanIntervention",
+                    "stream_types.FinalAnswer",
+                    "types.WebFetch",
+                    "types.APIFetch",
+                    "types.ReadBlob",
+                ]
             ],
             result,
         )
@@ -27,7 +27,7 @@ class StreamState(BaseModel, typing.Generic[StreamStateValueT]):
 
 
 # #########################################################################
-# Generated classes (11)
+# Generated classes (17)
 # #########################################################################
 
 
@@ -41,6 +41,12 @@ class APIFetch(BaseModel):
     offset: typing.Optional[int] = None
 
 
+class ApplyPatch(BaseModel):
+    tool_name: typing.Optional[str] = None
+    file_path: typing.Optional[str] = None
+    patch: typing.Optional[str] = None
+
+
 class CollectUserFeedback(BaseModel):
     tool_name: typing.Optional[str] = None
     task_id: typing.Optional[str] = None
@@ -48,8 +54,16 @@ class CollectUserFeedback(BaseModel):
     message: typing.Optional[str] = None
 
 
-class FinalAnswer(BaseModel):
+class EditFile(BaseModel):
     tool_name: typing.Optional[str] = None
+    file_path: typing.Optional[str] = None
+    old_text: typing.Optional[str] = None
+    new_text: typing.Optional[str] = None
+    replace_all: typing.Optional[bool] = None
+
+
+class FinalAnswer(BaseModel):
+    tool_name: str
     answer: typing.Optional[str] = None
 
 
@@ -69,6 +83,20 @@ class ListDirectoryContents(BaseModel):
     directory_path: typing.Optional[str] = None
 
 
+class ListDirectoryTree(BaseModel):
+    tool_name: typing.Optional[str] = None
+    directory_path: typing.Optional[str] = None
+    max_depth: typing.Optional[int] = None
+    max_entries: typing.Optional[int] = None
+
+
+class ReadBlob(BaseModel):
+    tool_name: typing.Optional[str] = None
+    handle: typing.Optional[str] = None
+    limit: typing.Optional[int] = None
+    offset: typing.Optional[int] = None
+
+
 class ReadFile(BaseModel):
     tool_name: typing.Optional[str] = None
     file_path: typing.Optional[str] = None
@@ -76,6 +104,15 @@ class ReadFile(BaseModel):
     offset: typing.Optional[int] = None
 
 
+class ReplaceLines(BaseModel):
+    tool_name: typing.Optional[str] = None
+    file_path: typing.Optional[str] = None
+    start_line: typing.Optional[int] = None
+    end_line: typing.Optional[int] = None
+    expected_text: typing.Optional[str] = None
+    new_text: typing.Optional[str] = None
+
+
 class RequestHumanIntervention(BaseModel):
     tool_name: typing.Optional[str] = None
     reason: typing.Optional[str] = None
@@ -87,6 +124,18 @@ class ReviewAndConfirmChanges(BaseModel):
     new_content: typing.Optional[str] = None
 
 
+class SearchWorkspace(BaseModel):
+    tool_name: typing.Optional[str] = None
+    query: typing.Optional[str] = None
+    directory_path: typing.Optional[str] = None
+    is_regex: typing.Optional[bool] = None
+    case_sensitive: typing.Optional[bool] = None
+    include: typing.List[str]
+    exclude: typing.List[str]
+    context_lines: typing.Optional[int] = None
+    max_results_per_file: typing.Optional[int] = None
+
+
 class WebFetch(BaseModel):
     tool_name: typing.Optional[str] = None
     url: typing.Optional[str] = None
@@ -98,18 +98,26 @@ class BamlSyncClient:
         query: str,
         history: typing.List[str],
         baml_options: BamlCallOptions = {},
-    ) -> typing.Union[
-        "types.ReadFile",
-        "types.WriteFile",
-        "types.ListDirectoryContents",
-        "types.FindContentInFile",
-        "types.GetUserInput",
-        "types.ReviewAndConfirmChanges",
-        "types.CollectUserFeedback",
-        "types.RequestHumanIntervention",
-        "types.FinalAnswer",
-        "types.WebFetch",
-        "types.APIFetch",
+    ) -> typing.List[
+        typing.Union[
+            "types.ReadFile",
+            "types.WriteFile",
+            "types.EditFile",
+            "types.ReplaceLines",
+            "types.ApplyPatch",
+            "types.ListDirectoryContents",
+            "types.ListDirectoryTree",
+            "types.FindContentInFile",
+            "types.SearchWorkspace",
+            "types.GetUserInput",
+            "types.ReviewAndConfirmChanges",
+            "types.CollectUserFeedback",
+            "types.RequestHumanIntervention",
+            "types.FinalAnswer",
+            "types.WebFetch",
+            "types.APIFetch",
+            "types.ReadBlob",
+        ]
     ]:
         result = self.__options.merge_options(baml_options).call_function_sync(
             function_name="Orchestrate",
@@ -119,18 +127,26 @@ class BamlSyncClient:
             },
         )
         return typing.cast(
-            typing.Union[
-                "types.ReadFile",
-                "types.WriteFile",
-                "types.ListDirectoryContents",
-                "types.FindContentInFile",
-                "types.GetUserInput",
-                "types.ReviewAndConfirmChanges",
-                "types.CollectUserFeedback",
-                "types.RequestHumanIntervention",
-                "types.FinalAnswer",
-                "types.WebFetch",
-                "types.APIFetch",
+            typing.List[
+                typing.Union[
+                    "types.ReadFile",
+                    "types.WriteFile",
+                    "types.EditFile",
+                    "types.ReplaceLines",
+                    "types.ApplyPatch",
+                    "types.ListDirectoryContents",
+                    "types.ListDirectoryTree",
+                    "types.FindContentInFile",
+                    "types.SearchWorkspace",
+                    "types.GetUserInput",
+                    "types.ReviewAndConfirmChanges",
+                    "types.CollectUserFeedback",
+                    "types.RequestHumanIntervention",
+                    "types.FinalAnswer",
+                    "types.WebFetch",
+                    "types.APIFetch",
+                    "types.ReadBlob",
+                ]
             ],
             result.cast_to(types, types, stream_types, False, __runtime__),
         )
@@ -163,59 +179,38 @@ class BamlStreamClient:
         history: typing.List[str],
         baml_options: BamlCallOptions = {},
     ) -> baml_py.BamlSyncStream[
-        typing.Union[
-            "stream_types.ReadFile",
-            "stream_types.WriteFile",
-            "stream_types.ListDirectoryContents",
-            "stream_types.FindContentInFile",
-            "stream_types.GetUserInput",
-            "stream_types.ReviewAndConfirmChanges",
-            "stream_types.CollectUserFeedback",
-            "stream_types.RequestHumanIntervention",
-            "stream_types.FinalAnswer",
-            "stream_types.WebFetch",
-            "stream_types.APIFetch",
-        ],
-        typing.Union[
-            "types.ReadFile",
-            "types.WriteFile",
-            "types.ListDirectoryContents",
-            "types.FindContentInFile",
-            "types.GetUserInput",
-            "types.ReviewAndConfirmChanges",
-            "types.CollectUserFeedback",
-            "types.RequestHumanIntervention",
-            "types.FinalAnswer",
-            "types.WebFetch",
-            "types.APIFetch",
-        ],
-    ]:
-        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(
-            function_name="Orchestrate",
-            args={
-                "query": query,
-                "history": history,
-            },
-        )
-        return baml_py.BamlSyncStream[
+        typing.List[
             typing.Union[
-                "stream_types.ReadFile",
-                "stream_types.WriteFile",
-                "stream_types.ListDirectoryContents",
-                "stream_types.FindContentInFile",
-                "stream_types.GetUserInput",
-                "stream_types.ReviewAndConfirmChanges",
-                "stream_types.CollectUserFeedback",
-                "stream_types.RequestHumanIntervention",
+                "types.ReadFile",
+                "types.WriteFile",
+                "types.EditFile",
+                "types.ReplaceLines",
+                "types.ApplyPatch",
+                "types.ListDirectoryContents",
+                "types.ListDirectoryTree",
+                "types.FindContentInFile",
+                "types.SearchWorkspace",
+                "types.GetUserInput",
+                "types.ReviewAndConfirmChanges",
+                "types.CollectUserFeedback",
+                "types.RequestHumanIntervention",
                 "stream_types.FinalAnswer",
-                "stream_types.WebFetch",
-                "stream_types.APIFetch",
-            ],
+                "types.WebFetch",
+                "types.APIFetch",
+                "types.ReadBlob",
+            ]
+        ],
+        typing.List[
             typing.Union[
                 "types.ReadFile",
                 "types.WriteFile",
+                "types.EditFile",
+                "types.ReplaceLines",
+                "types.ApplyPatch",
                 "types.ListDirectoryContents",
+                "types.ListDirectoryTree",
                 "types.FindContentInFile",
+                "types.SearchWorkspace",
                 "types.GetUserInput",
                 "types.ReviewAndConfirmChanges",
                 "types.CollectUserFeedback",
@@ -223,31 +218,50 @@ class BamlStreamClient:
                 "types.FinalAnswer",
                 "types.WebFetch",
                 "types.APIFetch",
-            ],
-        ](
-            result,
-            lambda x: typing.cast(
+                "types.ReadBlob",
+            ]
+        ],
+    ]:
+        ctx, result = self.__options.merge_options(baml_options).create_sync_stream(
+            function_name="Orchestrate",
+            args={
+                "query": query,
+                "history": history,
+            },
+        )
+        return baml_py.BamlSyncStream[
+            typing.List[
                 typing.Union[
-                    "stream_types.ReadFile",
-                    "stream_types.WriteFile",
-                    "stream_types.ListDirectoryContents",
-                    "stream_types.FindContentInFile",
-                    "stream_types.GetUserInput",
-                    "stream_types.ReviewAndConfirmChanges",
-                    "stream_types.CollectUserFeedback",
-                    "stream_types.RequestHumanIntervention",
+                    "types.ReadFile",
+                    "types.WriteFile",
+                    "types.EditFile",
+                    "types.ReplaceLines",
+                    "types.ApplyPatch",
+                    "types.ListDirectoryContents",
+                    "types.ListDirectoryTree",
+                    "types.FindContentInFile",
+                    "types.SearchWorkspace",
+                    "types.GetUserInput",
+                    "types.ReviewAndConfirmChanges",
+                    "types.CollectUserFeedback",
+                    "types.RequestHumanIntervention",
                     "stream_types.FinalAnswer",
-                    "stream_types.WebFetch",
-                    "stream_types.APIFetch",
-                ],
-                x.cast_to(types, types, stream_types, True, __runtime__),
-            ),
-            lambda x: typing.cast(
+                    "types.WebFetch",
+                    "types.APIFetch",
+                    "types.ReadBlob",
+                ]
+            ],
+            typing.List[
                 typing.Union[
                     "types.ReadFile",
                     "types.WriteFile",
+                    "types.EditFile",
+                    "types.ReplaceLines",
+                    "types.ApplyPatch",
                     "types.ListDirectoryContents",
+                    "types.ListDirectoryTree",
                     "types.FindContentInFile",
+                    "types.SearchWorkspace",
                     "types.GetUserInput",
                     "types.ReviewAndConfirmChanges",
                     "types.CollectUserFeedback",
@@ -255,6 +269,56 @@ class BamlStreamClient:
                     "types.FinalAnswer",
                     "types.WebFetch",
                     "types.APIFetch",
+                    "types.ReadBlob",
+                ]
+            ],
+        ](
+            result,
+            lambda x: typing.cast(
+                typing.List[
+                    typing.Union[
+                        "types.ReadFile",
+                        "types.WriteFile",
+                        "types.EditFile",
+                        "types.ReplaceLines",
+                        "types.ApplyPatch",
+                        "types.ListDirectoryContents",
+                        "types.ListDirectoryTree",
+                        "types.FindContentInFile",
+                        "types.SearchWorkspace",
+                        "types.GetUserInput",
+                        "types.ReviewAndConfirmChanges",
+                        "types.CollectUserFeedback",
+                        "types.RequestHumanIntervention",
+                        "stream_types.FinalAnswer",
+                        "types.WebFetch",
+                        "types.APIFetch",
+                        "types.ReadBlob",
+                    ]
+                ],
+                x.cast_to(types, types, stream_types, True, __runtime__),
+            ),
+            lambda x: typing.cast(
+                typing.List[
+                    typing.Union[
+                        "types.ReadFile",
+                        "types.WriteFile",
+                        "types.EditFile",
+                        "types.ReplaceLines",
+                        "types.ApplyPatch",
+                        "types.ListDirectoryContents",
+                        "types.ListDirectoryTree",
+                        "types.FindContentInFile",
+                        "types.SearchWorkspace",
+                        "types.GetUserInput",
+                        "types.ReviewAndConfirmChanges",
+                        "types.CollectUserFeedback",
+                        "types.RequestHumanIntervention",
+                        "types.FinalAnswer",
+                        "types.WebFetch",
+                        "types.APIFetch",
+                        "types.ReadBlob",
+                    ]
                 ],
                 x.cast_to(types, types, stream_types, False, __runtime__),
             ),
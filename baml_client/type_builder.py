@@ -22,14 +22,20 @@ class TypeBuilder(type_builder.TypeBuilder):
             classes=set(
                 [
                     "APIFetch",
+                    "ApplyPatch",
                     "CollectUserFeedback",
+                    "EditFile",
                     "FinalAnswer",
                     "FindContentInFile",
                     "GetUserInput",
                     "ListDirectoryContents",
+                    "ListDirectoryTree",
+                    "ReadBlob",
                     "ReadFile",
+                    "ReplaceLines",
                     "RequestHumanIntervention",
                     "ReviewAndConfirmChanges",
+                    "SearchWorkspace",
                     "WebFetch",
                     "WriteFile",
                 ]
@@ -43,17 +49,25 @@ class TypeBuilder(type_builder.TypeBuilder):
     # #########################################################################
 
     # #########################################################################
-    # Generated classes 11
+    # Generated classes 17
     # #########################################################################
 
     @property
     def APIFetch(self) -> "APIFetchViewer":
         return APIFetchViewer(self)
 
+    @property
+    def ApplyPatch(self) -> "ApplyPatchViewer":
+        return ApplyPatchViewer(self)
+
     @property
     def CollectUserFeedback(self) -> "CollectUserFeedbackViewer":
         return CollectUserFeedbackViewer(self)
 
+    @property
+    def EditFile(self) -> "EditFileViewer":
+        return EditFileViewer(self)
+
     @property
     def FinalAnswer(self) -> "FinalAnswerViewer":
         return FinalAnswerViewer(self)
@@ -70,10 +84,22 @@ class TypeBuilder(type_builder.TypeBuilder):
     def ListDirectoryContents(self) -> "ListDirectoryContentsViewer":
         return ListDirectoryContentsViewer(self)
 
+    @property
+    def ListDirectoryTree(self) -> "ListDirectoryTreeViewer":
+        return ListDirectoryTreeViewer(self)
+
+    @property
+    def ReadBlob(self) -> "ReadBlobViewer":
+        return ReadBlobViewer(self)
+
     @property
     def ReadFile(self) -> "ReadFileViewer":
         return ReadFileViewer(self)
 
+    @property
+    def ReplaceLines(self) -> "ReplaceLinesViewer":
+        return ReplaceLinesViewer(self)
+
     @property
     def RequestHumanIntervention(self) -> "RequestHumanInterventionViewer":
         return RequestHumanInterventionViewer(self)
@@ -82,6 +108,10 @@ class TypeBuilder(type_builder.TypeBuilder):
     def ReviewAndConfirmChanges(self) -> "ReviewAndConfirmChangesViewer":
         return ReviewAndConfirmChangesViewer(self)
 
+    @property
+    def SearchWorkspace(self) -> "SearchWorkspaceViewer":
+        return SearchWorkspaceViewer(self)
+
     @property
     def WebFetch(self) -> "WebFetchViewer":
         return WebFetchViewer(self)
@@ -97,7 +127,7 @@ class TypeBuilder(type_builder.TypeBuilder):
 
 
 # #########################################################################
-# Generated classes 11
+# Generated classes 17
 # #########################################################################
 
 
@@ -173,6 +203,58 @@ class APIFetchProperties:
         return type_builder.ClassPropertyViewer(self.__bldr.property("offset"))
 
 
+class ApplyPatchAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb  # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("ApplyPatch")
+        self._properties: typing.Set[str] = set(
+            [
+                "tool_name",
+                "file_path",
+                "patch",
+            ]
+        )
+        self._props = ApplyPatchProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "ApplyPatchProperties":
+        return self._props
+
+
+class ApplyPatchViewer(ApplyPatchAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    def list_properties(
+        self,
+    ) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [
+            (name, type_builder.ClassPropertyViewer(self._bldr.property(name)))
+            for name in self._properties
+        ]
+
+
+class ApplyPatchProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties  # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    @property
+    def tool_name(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("tool_name"))
+
+    @property
+    def file_path(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("file_path"))
+
+    @property
+    def patch(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("patch"))
+
+
 class CollectUserFeedbackAst:
     def __init__(self, tb: type_builder.TypeBuilder):
         _tb = tb._tb  # type: ignore (we know how to use this private attribute)
@@ -230,6 +312,68 @@ class CollectUserFeedbackProperties:
         return type_builder.ClassPropertyViewer(self.__bldr.property("message"))
 
 
+class EditFileAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb  # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("EditFile")
+        self._properties: typing.Set[str] = set(
+            [
+                "tool_name",
+                "file_path",
+                "old_text",
+                "new_text",
+                "replace_all",
+            ]
+        )
+        self._props = EditFileProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "EditFileProperties":
+        return self._props
+
+
+class EditFileViewer(EditFileAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    def list_properties(
+        self,
+    ) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [
+            (name, type_builder.ClassPropertyViewer(self._bldr.property(name)))
+            for name in self._properties
+        ]
+
+
+class EditFileProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties  # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    @property
+    def tool_name(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("tool_name"))
+
+    @property
+    def file_path(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("file_path"))
+
+    @property
+    def old_text(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("old_text"))
+
+    @property
+    def new_text(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("new_text"))
+
+    @property
+    def replace_all(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("replace_all"))
+
+
 class FinalAnswerAst:
     def __init__(self, tb: type_builder.TypeBuilder):
         _tb = tb._tb  # type: ignore (we know how to use this private attribute)
@@ -423,6 +567,120 @@ class ListDirectoryContentsProperties:
         return type_builder.ClassPropertyViewer(self.__bldr.property("directory_path"))
 
 
+class ListDirectoryTreeAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb  # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("ListDirectoryTree")
+        self._properties: typing.Set[str] = set(
+            [
+                "tool_name",
+                "directory_path",
+                "max_depth",
+                "max_entries",
+            ]
+        )
+        self._props = ListDirectoryTreeProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "ListDirectoryTreeProperties":
+        return self._props
+
+
+class ListDirectoryTreeViewer(ListDirectoryTreeAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    def list_properties(
+        self,
+    ) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [
+            (name, type_builder.ClassPropertyViewer(self._bldr.property(name)))
+            for name in self._properties
+        ]
+
+
+class ListDirectoryTreeProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties  # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    @property
+    def tool_name(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("tool_name"))
+
+    @property
+    def directory_path(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("directory_path"))
+
+    @property
+    def max_depth(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("max_depth"))
+
+    @property
+    def max_entries(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("max_entries"))
+
+
+class ReadBlobAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb  # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("ReadBlob")
+        self._properties: typing.Set[str] = set(
+            [
+                "tool_name",
+                "handle",
+                "limit",
+                "offset",
+            ]
+        )
+        self._props = ReadBlobProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "ReadBlobProperties":
+        return self._props
+
+
+class ReadBlobViewer(ReadBlobAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    def list_properties(
+        self,
+    ) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [
+            (name, type_builder.ClassPropertyViewer(self._bldr.property(name)))
+            for name in self._properties
+        ]
+
+
+class ReadBlobProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties  # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    @property
+    def tool_name(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("tool_name"))
+
+    @property
+    def handle(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("handle"))
+
+    @property
+    def limit(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("limit"))
+
+    @property
+    def offset(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("offset"))
+
+
 class ReadFileAst:
     def __init__(self, tb: type_builder.TypeBuilder):
         _tb = tb._tb  # type: ignore (we know how to use this private attribute)
@@ -480,6 +738,73 @@ class ReadFileProperties:
         return type_builder.ClassPropertyViewer(self.__bldr.property("offset"))
 
 
+class ReplaceLinesAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb  # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("ReplaceLines")
+        self._properties: typing.Set[str] = set(
+            [
+                "tool_name",
+                "file_path",
+                "start_line",
+                "end_line",
+                "expected_text",
+                "new_text",
+            ]
+        )
+        self._props = ReplaceLinesProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "ReplaceLinesProperties":
+        return self._props
+
+
+class ReplaceLinesViewer(ReplaceLinesAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    def list_properties(
+        self,
+    ) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [
+            (name, type_builder.ClassPropertyViewer(self._bldr.property(name)))
+            for name in self._properties
+        ]
+
+
+class ReplaceLinesProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties  # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    @property
+    def tool_name(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("tool_name"))
+
+    @property
+    def file_path(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("file_path"))
+
+    @property
+    def start_line(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("start_line"))
+
+    @property
+    def end_line(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("end_line"))
+
+    @property
+    def expected_text(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("expected_text"))
+
+    @property
+    def new_text(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("new_text"))
+
+
 class RequestHumanInterventionAst:
     def __init__(self, tb: type_builder.TypeBuilder):
         _tb = tb._tb  # type: ignore (we know how to use this private attribute)
@@ -579,6 +904,90 @@ class ReviewAndConfirmChangesProperties:
         return type_builder.ClassPropertyViewer(self.__bldr.property("new_content"))
 
 
+class SearchWorkspaceAst:
+    def __init__(self, tb: type_builder.TypeBuilder):
+        _tb = tb._tb  # type: ignore (we know how to use this private attribute)
+        self._bldr = _tb.class_("SearchWorkspace")
+        self._properties: typing.Set[str] = set(
+            [
+                "tool_name",
+                "query",
+                "directory_path",
+                "is_regex",
+                "case_sensitive",
+                "include",
+                "exclude",
+                "context_lines",
+                "max_results_per_file",
+            ]
+        )
+        self._props = SearchWorkspaceProperties(self._bldr, self._properties)
+
+    def type(self) -> baml_py.FieldType:
+        return self._bldr.field()
+
+    @property
+    def props(self) -> "SearchWorkspaceProperties":
+        return self._props
+
+
+class SearchWorkspaceViewer(SearchWorkspaceAst):
+    def __init__(self, tb: type_builder.TypeBuilder):
+        super().__init__(tb)
+
+    def list_properties(
+        self,
+    ) -> typing.List[typing.Tuple[str, type_builder.ClassPropertyViewer]]:
+        return [
+            (name, type_builder.ClassPropertyViewer(self._bldr.property(name)))
+            for name in self._properties
+        ]
+
+
+class SearchWorkspaceProperties:
+    def __init__(self, bldr: baml_py.ClassBuilder, properties: typing.Set[str]):
+        self.__bldr = bldr
+        self.__properties = properties  # type: ignore (we know how to use this private attribute) # noqa: F821
+
+    @property
+    def tool_name(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("tool_name"))
+
+    @property
+    def query(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("query"))
+
+    @property
+    def directory_path(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("directory_path"))
+
+    @property
+    def is_regex(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("is_regex"))
+
+    @property
+    def case_sensitive(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("case_sensitive"))
+
+    @property
+    def include(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("include"))
+
+    @property
+    def exclude(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("exclude"))
+
+    @property
+    def context_lines(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(self.__bldr.property("context_lines"))
+
+    @property
+    def max_results_per_file(self) -> type_builder.ClassPropertyViewer:
+        return type_builder.ClassPropertyViewer(
+            self.__bldr.property("max_results_per_file")
+        )
+
+
 class WebFetchAst:
     def __init__(self, tb: type_builder.TypeBuilder):
         _tb = tb._tb  # type: ignore (we know how to use this private attribute)
@@ -17,8 +17,12 @@ from . import stream_types
 type_map = {
     "types.APIFetch": types.APIFetch,
     "stream_types.APIFetch": stream_types.APIFetch,
+    "types.ApplyPatch": types.ApplyPatch,
+    "stream_types.ApplyPatch": stream_types.ApplyPatch,
     "types.CollectUserFeedback": types.CollectUserFeedback,
     "stream_types.CollectUserFeedback": stream_types.CollectUserFeedback,
+    "types.EditFile": types.EditFile,
+    "stream_types.EditFile": stream_types.EditFile,
     "types.FinalAnswer": types.FinalAnswer,
     "stream_types.FinalAnswer": stream_types.FinalAnswer,
     "types.FindContentInFile": types.FindContentInFile,
@@ -27,12 +31,20 @@ type_map = {
     "stream_types.GetUserInput": stream_types.GetUserInput,
     "types.ListDirectoryContents": types.ListDirectoryContents,
     "stream_types.ListDirectoryContents": stream_types.ListDirectoryContents,
+    "types.ListDirectoryTree": types.ListDirectoryTree,
+    "stream_types.ListDirectoryTree": stream_types.ListDirectoryTree,
+    "types.ReadBlob": types.ReadBlob,
+    "stream_types.ReadBlob": stream_types.ReadBlob,
     "types.ReadFile": types.ReadFile,
     "stream_types.ReadFile": stream_types.ReadFile,
+    "types.ReplaceLines": types.ReplaceLines,
+    "stream_types.ReplaceLines": stream_types.ReplaceLines,
     "types.RequestHumanIntervention": types.RequestHumanIntervention,
     "stream_types.RequestHumanIntervention": stream_types.RequestHumanIntervention,
     "types.ReviewAndConfirmChanges": types.ReviewAndConfirmChanges,
     "stream_types.ReviewAndConfirmChanges": stream_types.ReviewAndConfirmChanges,
+    "types.SearchWorkspace": types.SearchWorkspace,
+    "stream_types.SearchWorkspace": stream_types.SearchWorkspace,
     "types.WebFetch": types.WebFetch,
     "stream_types.WebFetch": stream_types.WebFetch,
     "types.WriteFile": types.WriteFile,
@@ -48,7 +48,7 @@ def all_succeeded(checks: typing.Dict[CheckName, Check]) -> bool:
 # #########################################################################
 
 # #########################################################################
-# Generated classes (11)
+# Generated classes (17)
 # #########################################################################
 
 
@@ -62,6 +62,12 @@ class APIFetch(BaseModel):
     offset: int
 
 
+class ApplyPatch(BaseModel):
+    tool_name: typing_extensions.Literal["apply_patch"]
+    file_path: str
+    patch: str
+
+
 class CollectUserFeedback(BaseModel):
     tool_name: typing_extensions.Literal["collect_feedback"]
     task_id: str
@@ -69,6 +75,14 @@ class CollectUserFeedback(BaseModel):
     message: str
 
 
+class EditFile(BaseModel):
+    tool_name: typing_extensions.Literal["edit_file"]
+    file_path: str
+    old_text: str
+    new_text: str
+    replace_all: bool
+
+
 class FinalAnswer(BaseModel):
     tool_name: typing_extensions.Literal["final_answer"]
     answer: str
@@ -90,6 +104,20 @@ class ListDirectoryContents(BaseModel):
     directory_path: str
 
 
+class ListDirectoryTree(BaseModel):
+    tool_name: typing_extensions.Literal["list_directory_tree"]
+    directory_path: str
+    max_depth: int
+    max_entries: int
+
+
+class ReadBlob(BaseModel):
+    tool_name: typing_extensions.Literal["read_blob"]
+    handle: str
+    limit: int
+    offset: int
+
+
 class ReadFile(BaseModel):
     tool_name: typing_extensions.Literal["read_file"]
     file_path: str
@@ -97,6 +125,15 @@ class ReadFile(BaseModel):
     offset: int
 
 
+class ReplaceLines(BaseModel):
+    tool_name: typing_extensions.Literal["replace_lines"]
+    file_path: str
+    start_line: int
+    end_line: int
+    expected_text: typing.Optional[str] = None
+    new_text: str
+
+
 class RequestHumanIntervention(BaseModel):
     tool_name: typing_extensions.Literal["request_human_intervention"]
     reason: str
@@ -108,6 +145,18 @@ class ReviewAndConfirmChanges(BaseModel):
     new_content: str
 
 
+class SearchWorkspace(BaseModel):
+    tool_name: typing_extensions.Literal["search_workspace"]
+    query: str
+    directory_path: str
+    is_regex: bool
+    case_sensitive: bool
+    include: typing.List[str]
+    exclude: typing.List[str]
+    context_lines: int
+    max_results_per_file: int
+
+
 class WebFetch(BaseModel):
     tool_name: typing_extensions.Literal["fetch_page_content"]
     url: str
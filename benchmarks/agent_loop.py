@@ -0,0 +1,390 @@
+"""
+End-to-end benchmark of the DevAgent loop against a local fake LLM.
+
+Usage:
+    python -m benchmarks.agent_loop
+    python -m benchmarks.agent_loop --scenario file_exploration --steps 50 --llm-delay 0.2
+"""
+
+import asyncio
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+import typer
+from baml_py import ClientRegistry
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.fake_llm_server import FakeLLMServer
+from src.agent_core import DevAgent
+from src.memory.history_compactor import estimate_tokens
+from src.tools.search_tool import iter_workspace_files
+
+SCENARIOS = ("file_exploration", "web_heavy")
+
+app = typer.Typer()
+
+
+def _final_answer() -> str:
+    return json.dumps([{"tool_name": "final_answer", "answer": "Benchmark done."}])
+
+
+def file_exploration_script(steps: int) -> list[str]:
+    """Cycles through listing, reading and searching the files under src/."""
+    files = sorted(iter_workspace_files("src", include=["*.py"]))
+    directories = sorted({os.path.dirname(path) for path in files})
+    script = []
+    for step in range(steps):
+        file_path = files[step % len(files)]
+        kind = step % 4
+        if kind == 0:
+            call = {
+                "tool_name": "list_directory_contents",
+                "directory_path": directories[step % len(directories)],
+            }
+        elif kind == 1:
+            call = {
+                "tool_name": "read_file",
+                "file_path": file_path,
+                "limit": 2000,
+                "offset": 0,
+            }
+        elif kind == 2:
+            call = {
+                "tool_name": "find_content_in_file",
+                "file_path": file_path,
+                "search_query": "def ",
+            }
+        else:
+            call = {
+                "tool_name": "search_workspace",
+                "query": "import",
+                "directory_path": "src",
+                "is_regex": False,
+                "case_sensitive": True,
+                "include": ["*.py"],
+                "exclude": [],
+                "context_lines": 0,
+                "max_results_per_file": 3,
+            }
+        script.append(json.dumps([call]))
+    script.append(_final_answer())
+    return script
+
+
+def web_heavy_pages(steps: int) -> dict[str, str]:
+    paragraph = "<p>" + "Benchmark page content. " * 40 + "</p>"
+    return {
+        f"/page/{step}": f"<html><body><h1>Page {step}</h1>{paragraph * 20}</body></html>"
+        for step in range(steps)
+    }
+
+
+def web_heavy_script(steps: int, base_url: str) -> list[str]:
+    """Alternates headless-browser fetches and API fetches of local pages."""
+    script = []
+    for step in range(steps):
+        url = f"{base_url}/page/{step}"
+        if step % 2 == 0:
+            call = {
+                "tool_name": "fetch_page_content",
+                "url": url,
+                "limit": 4000,
+                "offset": 0,
+                "convert_to_text": True,
+            }
+        else:
+            call = {
+                "tool_name": "fetch_api_data",
+                "url": url,
+                "method": "GET",
+                "headers": {},
+                "data": {},
+                "limit": 4000,
+                "offset": 0,
+            }
+        script.append(json.dumps([call]))
+    script.append(_final_answer())
+    return script
+
+
+class InstrumentedAgent(DevAgent):
+    """A DevAgent that records tool timings and approves every prompt."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tool_timings = []
+
+        async def approve(*args) -> bool:
+            return True
+
+        self.human_interaction.get_user_confirmation = approve
+
+    async def _execute_tool(self, tool_call, answer_rendered: bool = False):
+        start = time.perf_counter()
+        try:
+            return await super()._execute_tool(tool_call, answer_rendered)
+        finally:
+            self.tool_timings.append((tool_call.tool_name, time.perf_counter() - start))
+
+
+def _descendants(pid: int) -> list[int]:
+    """Returns the pids of a process's descendants, read from /proc."""
+    found = []
+    pending = [pid]
+    while pending:
+        parent = pending.pop()
+        try:
+            tasks = os.listdir(f"/proc/{parent}/task")
+        except OSError:
+            continue
+        for task in tasks:
+            try:
+                with open(f"/proc/{parent}/task/{task}/children") as f:
+                    children = [int(child) for child in f.read().split()]
+            except OSError:
+                continue
+            found.extend(children)
+            pending.extend(children)
+    return found
+
+
+def _process_memory_kb(pid: int) -> int:
+    # PSS splits shared pages between the processes mapping them, so the
+    # browser's many processes are not counted once per shared library.
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        return 0
+
+
+class TreeMemorySampler:
+    """
+    Samples the memory of this process and all its descendants, such as the
+    Playwright driver and the browser, on a background thread and keeps the
+    peak. Needs Linux's /proc; elsewhere the peak stays None.
+    """
+
+    def __init__(self, interval: float = 0.1):
+        """
+        Initializes the TreeMemorySampler.
+
+        Args:
+            interval: The seconds between samples.
+        """
+        self.interval = interval
+        self.peak_kb = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self) -> None:
+        pid = os.getpid()
+        total = sum(map(_process_memory_kb, [pid, *_descendants(pid)]))
+        self.peak_kb = max(self.peak_kb or 0, total)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        if os.path.isdir(f"/proc/{os.getpid()}"):
+            self._sample()
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+            self._sample()
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(len(ordered) * fraction), len(ordered) - 1)]
+
+
+async def _run_scenario(
+    scenario: str, steps: int, llm_delay: float, stream: bool
+) -> dict:
+    server = FakeLLMServer([], response_delay=llm_delay).start()
+    try:
+        if scenario == "file_exploration":
+            server.script = file_exploration_script(steps)
+        else:
+            server.pages = web_heavy_pages(steps)
+            server.script = web_heavy_script(steps, server.base_url)
+
+        registry = ClientRegistry()
+        registry.add_llm_client(
+            "Benchmark",
+            "openai-generic",
+            {"base_url": server.base_url, "model": "fake", "api_key": "benchmark"},
+        )
+        registry.set_primary("Benchmark")
+        agent = InstrumentedAgent(
+            session_id=f"benchmark-{scenario}",
+            max_loops=steps + 1,
+            stream=stream,
+            client_registry=registry,
+            interactive=False,
+        )
+
+        start = time.perf_counter()
+        with TreeMemorySampler() as memory:
+            try:
+                await agent.run("Explore the workspace.")
+            finally:
+                await agent.aclose()
+        wall_time = time.perf_counter() - start
+    finally:
+        server.stop()
+
+    orchestrate_requests = [
+        request
+        for request in server.requests
+        if "Summarize the following text" not in request[2]
+    ]
+    arrivals = [arrival for arrival, _, _ in orchestrate_requests]
+    loop_latencies = [later - earlier for earlier, later in zip(arrivals, arrivals[1:])]
+    prompt_bytes = [size for _, size, _ in orchestrate_requests]
+    prompt_tokens = [estimate_tokens(prompt) for _, _, prompt in orchestrate_requests]
+    tool_times = [duration for _, duration in agent.tool_timings]
+    return {
+        "scenario": scenario,
+        "stream": stream,
+        "llm_delay": llm_delay,
+        "steps": len(orchestrate_requests),
+        "wall_time_s": wall_time,
+        "loop_latency_p50_s": _percentile(loop_latencies, 0.5),
+        "loop_latency_p95_s": _percentile(loop_latencies, 0.95),
+        "tool_time_mean_s": statistics.fmean(tool_times) if tool_times else 0.0,
+        "tool_time_total_s": sum(tool_times),
+        "prompt_bytes_per_step": prompt_bytes,
+        "prompt_tokens_per_step": prompt_tokens,
+        "prompt_tokens_max": max(prompt_tokens, default=0),
+        "summarize_calls": len(server.requests) - len(orchestrate_requests),
+        "prefetch_hit_rate": agent.prefetcher.stats()["hit_rate"],
+        # The agent process only; ru_maxrss is reported in kilobytes on Linux.
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        # The agent with its child processes, the browser included.
+        "peak_tree_pss_mb": (
+            memory.peak_kb / 1024 if memory.peak_kb is not None else None
+        ),
+    }
+
+
+def _print_report(results: list[dict]) -> None:
+    table = Table(title="DevAgent loop benchmark")
+    for column in (
+        "Scenario",
+        "Steps",
+        "Wall (s)",
+        "Loop p50 (ms)",
+        "Loop p95 (ms)",
+        "Tool mean (ms)",
+        "Prompt max (tok)",
+        "Prompt total (KB)",
+        "Agent RSS (MB)",
+        "Tree PSS (MB)",
+    ):
+        table.add_column(column, justify="right" if column != "Scenario" else "left")
+    for result in results:
+        table.add_row(
+            result["scenario"] + (" (stream)" if result["stream"] else ""),
+            str(result["steps"]),
+            f"{result['wall_time_s']:.2f}",
+            f"{result['loop_latency_p50_s'] * 1000:.1f}",
+            f"{result['loop_latency_p95_s'] * 1000:.1f}",
+            f"{result['tool_time_mean_s'] * 1000:.1f}",
+            str(result["prompt_tokens_max"]),
+            f"{sum(result['prompt_bytes_per_step']) / 1024:.1f}",
+            f"{result['peak_rss_mb']:.1f}",
+            (
+                f"{result['peak_tree_pss_mb']:.1f}"
+                if result["peak_tree_pss_mb"] is not None
+                else "n/a"
+            ),
+        )
+    Console().print(table)
+
+
+@app.command()
+def main(
+    scenario: str = typer.Option(
+        "all", "--scenario", help=f"One of {', '.join(SCENARIOS)}, or 'all'."
+    ),
+    steps: int = typer.Option(50, "--steps", help="Tool steps per scenario."),
+    llm_delay: float = typer.Option(
+        0.0, "--llm-delay", help="Seconds the fake LLM waits before answering."
+    ),
+    stream: bool = typer.Option(False, "--stream", help="Use streaming mode."),
+    output: str = typer.Option(
+        "", "--output", help="Append the results as JSON lines to this file."
+    ),
+    as_json: bool = typer.Option(
+        False, "--json", help="Print the results as JSON instead of a table."
+    ),
+):
+    """
+    Runs the agent loop against a local fake LLM and reports per-step timings,
+    prompt sizes and peak memory.
+    """
+    if scenario == "all":
+        # Each scenario runs in its own process so peak RSS is not shared.
+        results = []
+        for name in SCENARIOS:
+            command = [
+                sys.executable,
+                "-m",
+                "benchmarks.agent_loop",
+                "--scenario",
+                name,
+                "--steps",
+                str(steps),
+                "--llm-delay",
+                str(llm_delay),
+                "--output",
+                output,
+                "--json",
+            ]
+            if stream:
+                command.append("--stream")
+            completed = subprocess.run(
+                command, capture_output=True, text=True, check=True
+            )
+            results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+        _print_report(results)
+        return
+
+    if scenario not in SCENARIOS:
+        raise typer.BadParameter(f"Unknown scenario '{scenario}'.")
+    result = asyncio.run(_run_scenario(scenario, steps, llm_delay, stream))
+    if output:
+        os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+        with open(output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(result) + "\n")
+    if as_json:
+        print(json.dumps(result))
+    else:
+        _print_report([result])
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,164 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Chunk size, in characters, of streamed responses.
+STREAM_CHUNK_SIZE = 8
+
+
+class FakeLLMServer:
+    """
+    A local OpenAI-compatible chat completions endpoint that replays scripted
+    responses, for benchmarking the agent without a real model.
+
+    Orchestrate calls consume the script in order; SummarizeText calls are
+    answered with a fixed summary. Every request is recorded with its arrival
+    time and prompt size.
+    """
+
+    def __init__(
+        self,
+        script: list[str],
+        response_delay: float = 0.0,
+        chunk_delay: float = 0.0,
+        pages: dict[str, str] | None = None,
+    ):
+        """
+        Initializes the FakeLLMServer.
+
+        Args:
+            script: The raw model outputs returned to successive Orchestrate calls.
+            response_delay: Seconds to wait before answering, simulating latency.
+            chunk_delay: Seconds between chunks of a streamed response.
+            pages: Static documents served on GET, keyed by path, for tools
+                that fetch URLs.
+        """
+        self.script = list(script)
+        self.response_delay = response_delay
+        self.chunk_delay = chunk_delay
+        self.pages = pages or {}
+        # (arrival time, prompt bytes, prompt text) per completion request.
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "FakeLLMServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _next_response(self, prompt: str) -> str:
+        with self._lock:
+            if "Summarize the following text" in prompt:
+                return "Earlier steps explored the workspace."
+            if self.script:
+                return self.script.pop(0)
+        return json.dumps([{"tool_name": "final_answer", "answer": "Done."}])
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, content_type: str, body: bytes) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                page = server.pages.get(self.path)
+                if page is None:
+                    self._send(404, "text/plain", b"Not found")
+                else:
+                    self._send(200, "text/html; charset=utf-8", page.encode("utf-8"))
+
+            def do_POST(self):
+                if not self.path.endswith("/chat/completions"):
+                    self._send(404, "text/plain", b"Not found")
+                    return
+                raw = self.rfile.read(int(self.headers["Content-Length"]))
+                request = json.loads(raw)
+                prompt = "\n".join(
+                    part["text"] if isinstance(part, dict) else part
+                    for message in request["messages"]
+                    for part in (
+                        message["content"]
+                        if isinstance(message["content"], list)
+                        else [message["content"]]
+                    )
+                )
+                with server._lock:
+                    server.requests.append(
+                        (time.perf_counter(), len(prompt.encode("utf-8")), prompt)
+                    )
+                content = server._next_response(prompt)
+                time.sleep(server.response_delay)
+                if request.get("stream"):
+                    self._stream(content)
+                else:
+                    self._complete(content, prompt)
+
+            def _complete(self, content: str, prompt: str) -> None:
+                body = {
+                    "id": "fake",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": "fake",
+                    "choices": [
+                        {
+                            "index": 0,
+                            "message": {"role": "assistant", "content": content},
+                            "finish_reason": "stop",
+                        }
+                    ],
+                    "usage": {
+                        "prompt_tokens": len(prompt) // 4,
+                        "completion_tokens": len(content) // 4,
+                        "total_tokens": (len(prompt) + len(content)) // 4,
+                    },
+                }
+                self._send(200, "application/json", json.dumps(body).encode("utf-8"))
+
+            def _stream(self, content: str) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                for start in range(0, len(content), STREAM_CHUNK_SIZE):
+                    self._event({"content": content[start : start + STREAM_CHUNK_SIZE]})
+                    time.sleep(server.chunk_delay)
+                self._event({}, finish_reason="stop")
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+                self.close_connection = True
+
+            def _event(self, delta: dict, finish_reason: str | None = None) -> None:
+                chunk = {
+                    "id": "fake",
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": "fake",
+                    "choices": [
+                        {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                    ],
+                }
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+
+        return Handler
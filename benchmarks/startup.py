@@ -0,0 +1,134 @@
+"""
+Cold-start benchmark: how long importing the CLI takes, from `-X importtime`.
+
+Usage:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --budget-ms 500
+"""
+
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+# The module whose import is measured; importing it is what `python -m src.cli`
+# pays before the first prompt.
+TARGET_MODULE = "src.cli"
+
+# import time: self [us] | cumulative | imported package
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+app = typer.Typer()
+
+
+def measure_once(module: str) -> tuple[float, float, dict]:
+    """
+    Imports a module in a fresh interpreter with `-X importtime`.
+
+    Returns:
+        The wall time of the process in milliseconds, the cumulative import
+        time of the module in milliseconds, and the cumulative time of each of
+        its direct imports, keyed by module.
+    """
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    if completed.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{completed.stderr}")
+
+    # Lines are printed once an import finishes, so a module's own imports
+    # come right before it, indented one level (two spaces) deeper.
+    import_ms = 0.0
+    children = {}
+    direct_imports = {}
+    for line in completed.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match is None:
+            continue
+        _, cumulative_us, indent, name = match.groups()
+        ms = int(cumulative_us) / 1000
+        if indent == "":
+            if name == module:
+                import_ms = ms
+                direct_imports = children
+            children = {}
+        elif len(indent) == 2:
+            children[name] = ms
+    return wall_ms, import_ms, direct_imports
+
+
+@app.command()
+def main(
+    runs: int = typer.Option(5, "--runs", "-n", help="The number of cold starts."),
+    top: int = typer.Option(
+        10, "--top", help="The number of slowest direct imports listed."
+    ),
+    budget_ms: float = typer.Option(
+        None,
+        "--budget-ms",
+        help="Fail when the median import time of the CLI exceeds this.",
+    ),
+    as_json: bool = typer.Option(
+        False, "--json", help="Print the results as JSON instead of a table."
+    ),
+):
+    """
+    Reports the median cold-start import time of the CLI and its slowest imports.
+    """
+    wall_times = []
+    import_times = []
+    samples = {}
+    for _ in range(runs):
+        wall_ms, import_ms, direct_imports = measure_once(TARGET_MODULE)
+        wall_times.append(wall_ms)
+        import_times.append(import_ms)
+        for name, ms in direct_imports.items():
+            samples.setdefault(name, []).append(ms)
+
+    import_ms = statistics.median(import_times)
+    medians = {name: statistics.median(values) for name, values in samples.items()}
+    slowest = sorted(medians.items(), key=lambda item: -item[1])[:top]
+    result = {
+        "module": TARGET_MODULE,
+        "runs": runs,
+        "import_ms": round(import_ms, 1),
+        "wall_ms": round(statistics.median(wall_times), 1),
+        "budget_ms": budget_ms,
+        "slowest": [{"module": name, "ms": round(ms, 1)} for name, ms in slowest],
+    }
+
+    if as_json:
+        print(json.dumps(result, indent=2))
+    else:
+        console = Console()
+        table = Table(title=f"Slowest imports under {TARGET_MODULE} (median)")
+        table.add_column("Module")
+        table.add_column("Cumulative ms", justify="right")
+        for name, ms in slowest:
+            table.add_row(name, f"{ms:.1f}")
+        console.print(table)
+        console.print(
+            f"import {TARGET_MODULE}: {import_ms:.1f} ms; "
+            f"process wall time: {result['wall_ms']:.1f} ms ({runs} runs)"
+        )
+
+    if budget_ms is not None and import_ms > budget_ms:
+        print(
+            f"Cold start of {import_ms:.1f} ms exceeds the budget of {budget_ms:.1f} ms.",
+            file=sys.stderr,
+        )
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
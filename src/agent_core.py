@@ -1,179 +1,643 @@
-from baml_client.sync_client import b as baml_client
-from baml_client.types import (
-    ReadFile,
-    WriteFile,
-    ListDirectoryContents,
-    FindContentInFile,
-    GetUserInput,
-    ReviewAndConfirmChanges,
-    CollectUserFeedback,
-    RequestHumanIntervention,
-    FinalAnswer,
-    WebFetch,
-    APIFetch,
-)
+from baml_client.async_client import b as baml_client
+from baml_client import stream_types
 from .memory.short_term_memory import ShortTermMemory
+from .memory.history_entry import BLOB_THRESHOLD_CHARS, MAX_ARGUMENT_CHARS, HistoryEntry
+from .memory.blob_store import BlobStore
+from .memory.session_store import SessionStore
+from .memory.history_compactor import HistoryCompactor
+from .memory.tool_cache import ToolResultCache
 from .tools.file_manager import FileManagerTools
 from .tools.human_interaction import HumanInteractionTools
 from .tools.response_provider import ResponseProviderTools
-from .tools.web_fetch_tool import WebFetchTools
-from .tools.api_fetch_tool import APIFetchTools
+from .tools.trigram_index import TrigramIndex
+from .tools.prefetcher import FilePrefetcher
+from .tools.registry import ToolRegistry, ToolSpec
+from .tools.text_edits import apply_patch, replace_lines, replace_text
+from .tools.write_transaction import TransactionalWriter
+from .run_trace import RunTrace
 from rich.console import Console
 from rich.markdown import Markdown
-import json
+import asyncio
+import os
+import time
+
+# Added to the result of a paged tool when it fills the requested limit.
+TRUNCATED_HINT = "The response was truncated. To get more data, you can use the 'offset' parameter in your next call."
+
+
+def _describe(tool_call) -> str:
+    """The markdown action shown to the user for a tool call."""
+    action = f"**[Agent Action]:** {type(tool_call).__name__}"
+    for name, value in tool_call.model_dump(exclude={"tool_name"}).items():
+        if value is None or value is False or value == [] or value == {}:
+            continue
+        if isinstance(value, str) and len(value) > MAX_ARGUMENT_CHARS:
+            value = value[:MAX_ARGUMENT_CHARS] + "..."
+        action += f"\n- {name}: `{value}`"
+    return action
+
+
+def _is_get_request(tool_call) -> bool:
+    return (tool_call.method or "GET").upper() == "GET"
 
 
 class DevAgent:
-    def __init__(self, session_id: str, max_loops: int = 10):
+    def __init__(
+        self,
+        session_id: str,
+        max_loops: int = 10,
+        stream: bool = False,
+        token_budget: int = 8000,
+        keep_recent: int = 6,
+        client_registry=None,
+        trace: bool = False,
+        persist: bool = False,
+        approval_policy=None,
+        interactive: bool = True,
+    ):
         self.session_id = session_id
-        self.short_term_memory = ShortTermMemory(session_id)
-        self.file_manager = FileManagerTools()
-        self.human_interaction = HumanInteractionTools()
+        # Per-step LLM and tool metrics, written to a JSONL trace when enabled.
+        self.trace = RunTrace(session_id) if trace else None
+        options = {}
+        if client_registry is not None:
+            # A baml_py.ClientRegistry overrides the LLM client from config.baml,
+            # e.g. to point the agent at a local OpenAI-compatible endpoint.
+            options["client_registry"] = client_registry
+        if self.trace is not None:
+            options["collector"] = self.trace.collector
+        self.baml_client = (
+            baml_client.with_options(**options) if options else baml_client
+        )
+        # Persisted sessions are appended to data/sessions/ and resumed from
+        # there when the agent is created again with the same session_id.
+        self.short_term_memory = ShortTermMemory(
+            session_id, SessionStore(session_id) if persist else None
+        )
+        self.history_compactor = HistoryCompactor(
+            token_budget, keep_recent, self.baml_client
+        )
+        self.tool_cache = ToolResultCache()
+        self.blob_store = BlobStore()
+        # Writes are atomic, and the writes of one step land together.
+        self.writer = TransactionalWriter()
+        self.human_interaction = HumanInteractionTools(
+            approval_policy, interactive, self.writer
+        )
+        self.search_index = TrigramIndex()
+        self.prefetcher = FilePrefetcher()
+        self.file_manager = FileManagerTools(
+            self.human_interaction, self.search_index, self.prefetcher, self.writer
+        )
         self.response_provider = ResponseProviderTools()
-        self.web_fetch_tool = WebFetchTools()
-        self.api_fetch_tool = APIFetchTools()
+        # Providers with heavy imports (browser, HTTP client) load on first use.
+        self.tools = ToolRegistry()
+        self.tools.register_provider(
+            "web_fetch", "src.tools.web_fetch_tool", "WebFetchTools"
+        )
+        self.tools.register_provider(
+            "api_fetch", "src.tools.api_fetch_tool", "APIFetchTools"
+        )
+        self.tools.register_provider(
+            "search",
+            "src.tools.search_tool",
+            "WorkspaceSearchTools",
+            index=self.search_index,
+        )
+        self._register_tools()
         self.max_loops = max_loops
-        self.console = Console()
+        self.stream = stream
+        # Unattended agents neither prompt nor print.
+        self.console = Console(quiet=not interactive)
+        for console in (
+            self.file_manager.console,
+            self.human_interaction.console,
+            self.response_provider.console,
+        ):
+            console.quiet = not interactive
+        if self.writer.recovered:
+            self.console.print(
+                Markdown(
+                    "*Rolled back an interrupted write of: "
+                    f"{', '.join(self.writer.recovered)}.*"
+                )
+            )
+        self.steps_taken = 0
 
-    def _add_to_short_term_memory(
-        self, action: str, result: str, hint: str | None = None
-    ):
-        entry = {"action": action, "result": result}
-        if hint:
-            entry["hint"] = hint
-        self.short_term_memory.add_entry(json.dumps(entry))
+    @property
+    def web_fetch_tool(self):
+        return self.tools.provider("web_fetch")
+
+    @property
+    def api_fetch_tool(self):
+        return self.tools.provider("api_fetch")
 
-    async def run(self, query: str):
+    @property
+    def search_tool(self):
+        return self.tools.provider("search")
+
+    async def aclose(self):
+        """
+        Releases long-lived resources held by the agent's tools and memory.
+        """
+        for provider in self.tools.loaded_providers():
+            if hasattr(provider, "aclose"):
+                await provider.aclose()
+        self.short_term_memory.close()
+        self.prefetcher.close()
+
+    async def run(self, query: str) -> str | None:
+        """
+        Runs the agent loop on a query until it gives a final answer or runs
+        out of loops. The number of loops run is kept in `steps_taken`.
+
+        Args:
+            query: The user's query.
+
+        Returns:
+            The final answer, or None if the agent did not give one.
+        """
+        if self.trace is not None:
+            self.trace.start_run(query)
+        self.prefetcher.set_query(query)
+        answer = None
+        self.steps_taken = 0
         for i in range(self.max_loops):
+            self.steps_taken = i + 1
+            if await self.history_compactor.compact(self.short_term_memory):
+                self.console.print(
+                    Markdown("*Older history was summarized to stay within budget.*")
+                )
             history = self.short_term_memory.get_history()
-            tool_call = baml_client.Orchestrate(query=query, history=history)
-            result = None
-            action = None
-
-            if isinstance(tool_call, FinalAnswer):
-                action = (
-                    f"**[Agent Action]:** FinalAnswer\n- answer: `{tool_call.answer}`"
+            if self.stream:
+                answer = await self._run_streaming_step(query, history)
+            else:
+                tool_calls = await self.baml_client.Orchestrate(
+                    query=query, history=history
                 )
-                if action:
-                    self.console.print(Markdown(action))
-                self.response_provider.final_answer(tool_call.answer)
-                result = tool_call.answer
-                self._add_to_short_term_memory(action, result)
+                answer = await self._execute_tools(tool_calls)
+            if self.trace is not None:
+                self.trace.end_step()
+            if answer is not None:
                 break
-            elif isinstance(tool_call, ReadFile):
-                action = f"**[Agent Action]:** ReadFile\n- file_path: `{tool_call.file_path}`"
-                if tool_call.limit is not None:
-                    action += f"\n- limit: `{tool_call.limit}`"
-                if tool_call.offset is not None:
-                    action += f"\n- offset: `{tool_call.offset}`"
-                content = self.file_manager.read_file(
-                    tool_call.file_path, tool_call.limit, tool_call.offset
-                )
-                result = content
-                hint = None
-                if tool_call.limit and len(content) == tool_call.limit:
-                    hint = "The response was truncated. To get more data, you can use the 'offset' parameter in your next call."
-                self._add_to_short_term_memory(action, result, hint=hint)
-            elif isinstance(tool_call, WriteFile):
-                action = f"**[Agent Action]:** WriteFile\n- file_path: `{tool_call.file_path}`\n- content: `{tool_call.content[:100]}...`"
-                success = self.file_manager.write_file(
-                    tool_call.file_path, tool_call.content
-                )
-                result = (
-                    "File saved successfully." if success else "Failed to save file."
-                )
-                self._add_to_short_term_memory(action, result)
-            elif isinstance(tool_call, ListDirectoryContents):
-                action = f"**[Agent Action]:** ListDirectoryContents\n- directory_path: `{tool_call.directory_path}`"
-                contents = self.file_manager.list_directory_contents(
-                    tool_call.directory_path
-                )
-                result = "\n".join(contents)
-                self._add_to_short_term_memory(action, result)
-            elif isinstance(tool_call, FindContentInFile):
-                action = f"**[Agent Action]:** FindContentInFile\n- file_path: `{tool_call.file_path}`\n- search_query: `{tool_call.search_query}`"
-                results = self.file_manager.find_content_in_file(
-                    tool_call.file_path, tool_call.search_query
-                )
-                result = "\n".join(results)
-                self._add_to_short_term_memory(action, result)
-            elif isinstance(tool_call, GetUserInput):
-                action = f"**[Agent Action]:** GetUserInput\n- prompt_message: `{tool_call.prompt_message}`"
-                user_input = self.human_interaction.get_user_text_input(
-                    tool_call.prompt_message
-                )
-                result = user_input
-                self._add_to_short_term_memory(action, result)
-            elif isinstance(tool_call, ReviewAndConfirmChanges):
-                action = f"**[Agent Action]:** ReviewAndConfirmChanges\n- file_path: `{tool_call.file_path}`\n- new_content: `{tool_call.new_content[:100]}...`"
-                success = self.human_interaction.review_and_confirm_changes(
-                    tool_call.file_path, tool_call.new_content
-                )
-                result = "Changes applied." if success else "Changes rejected."
-                self._add_to_short_term_memory(action, result)
-            elif isinstance(tool_call, CollectUserFeedback):
-                action = f"**[Agent Action]:** CollectUserFeedback\n- task_id: `{tool_call.task_id}`\n- feedback_type: `{tool_call.feedback_type}`\n- message: `{tool_call.message}`"
-                self.human_interaction.collect_feedback(
-                    tool_call.task_id, tool_call.feedback_type, tool_call.message
-                )
-                result = "Feedback collected."
-                self._add_to_short_term_memory(action, result)
-            elif isinstance(tool_call, RequestHumanIntervention):
-                action = f"**[Agent Action]:** RequestHumanIntervention\n- reason: `{tool_call.reason}`"
-                user_input = self.human_interaction.request_human_intervention(
-                    tool_call.reason
-                )
-                result = user_input
-                self._add_to_short_term_memory(action, result)
-            elif isinstance(tool_call, WebFetch):
-                action = f"**[Agent Action]:** WebFetch\n- url: `{tool_call.url}`"
-                if tool_call.limit is not None:
-                    action += f"\n- limit: `{tool_call.limit}`"
-                if tool_call.offset is not None:
-                    action += f"\n- offset: `{tool_call.offset}`"
-                if tool_call.convert_to_text is not None:
-                    action += f"\n- convert_to_text: `{tool_call.convert_to_text}`"
-                content = await self.web_fetch_tool.fetch_page_content(
-                    tool_call.url,
-                    tool_call.limit,
-                    tool_call.offset,
-                    tool_call.convert_to_text,
-                )
-                result = content
-                hint = None
-                if tool_call.limit and len(content) == tool_call.limit:
-                    hint = "The response was truncated. To get more data, you can use the 'offset' parameter in your next call."
-                self._add_to_short_term_memory(action, result, hint=hint)
-            elif isinstance(tool_call, APIFetch):
-                action = f"**[Agent Action]:** APIFetch\n- url: `{tool_call.url}`"
-                if tool_call.method is not None:
-                    action += f"\n- method: `{tool_call.method}`"
-                if tool_call.headers is not None:
-                    action += f"\n- headers: `{tool_call.headers}`"
-                if tool_call.data is not None:
-                    action += f"\n- data: `{tool_call.data}`"
-                if tool_call.limit is not None:
-                    action += f"\n- limit: `{tool_call.limit}`"
-                if tool_call.offset is not None:
-                    action += f"\n- offset: `{tool_call.offset}`"
-                content = self.api_fetch_tool.fetch_api_data(
-                    tool_call.url,
-                    tool_call.method,
-                    tool_call.headers,
-                    tool_call.data,
-                    tool_call.limit,
-                    tool_call.offset,
-                )
-                result = content
-                hint = None
-                if tool_call.limit and len(content) == tool_call.limit:
-                    hint = "The response was truncated. To get more data, you can use the 'offset' parameter in your next call."
-                self._add_to_short_term_memory(action, result, hint=hint)
-            else:
-                action = "**[Agent Action]:** Unknown Tool\n- tool_call: `{tool_call}`"
-                self.console.print(Markdown(action))
 
+        else:
+            self.console.print(Markdown("Max loops reached. Exiting."))
+        if self.trace is not None:
+            self.trace.print_summary()
+        return answer
+
+    async def _run_streaming_step(self, query: str, history: list[str]) -> str | None:
+        """
+        Streams one Orchestrate call, rendering a FinalAnswer as it arrives and
+        starting leading read-only tool calls as soon as they are complete.
+
+        Returns:
+            The final answer if the agent gave one, None otherwise.
+        """
+        stream = self.baml_client.stream.Orchestrate(query=query, history=history)
+        started = []
+        answer_rendered = False
+        stream_start = time.perf_counter()
+        first_partial = True
+        try:
+            async for partial in stream:
+                if first_partial and self.trace is not None:
+                    self.trace.record_time_to_first_token(
+                        time.perf_counter() - stream_start
+                    )
+                first_partial = False
+                for tool_call in partial[len(started) :]:
+                    # Tool classes are streamed only once they are done, so a
+                    # read-only call can start while the response finishes.
+                    spec = self.tools.spec(tool_call)
+                    if spec is None or not (
+                        spec.is_read_only(tool_call)
+                        and spec.is_parallel_safe(tool_call)
+                    ):
+                        break
+                    task = asyncio.create_task(self._execute_tool(tool_call))
+                    started.append((tool_call, task))
+
+                for tool_call in partial:
+                    if isinstance(tool_call, stream_types.FinalAnswer) and (
+                        tool_call.answer
+                    ):
+                        if not answer_rendered:
+                            self.response_provider.start_final_answer_stream()
+                            answer_rendered = True
+                        self.response_provider.update_final_answer_stream(
+                            tool_call.answer
+                        )
+            tool_calls = await stream.get_final_response()
+        except BaseException:
+            # Calls started early must not outlive a failed step, nor lose
+            # their errors.
+            for _, task in started:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in started), return_exceptions=True)
+            raise
+        finally:
+            if answer_rendered:
+                self.response_provider.end_final_answer_stream()
+
+        if [tool_call for tool_call, _ in started] != tool_calls[: len(started)]:
+            # The final parse disagreed with the stream; the early calls were
+            # read-only, so drop their results and run the final list instead.
+            await asyncio.gather(*(task for _, task in started))
+            started = []
+        return await self._execute_tools(
+            tool_calls,
+            started=[task for _, task in started],
+            answer_rendered=answer_rendered,
+        )
+
+    async def _execute_tools(
+        self, tool_calls, started=(), answer_rendered: bool = False
+    ) -> str | None:
+        """
+        Executes the tool calls of one Orchestrate response in order. Runs of
+        consecutive parallel-safe calls are executed concurrently, runs of
+        consecutive writes are committed as one transaction, and all results
+        are recorded in short-term memory together once every call is done.
+        A FinalAnswer ends the step: calls after it are not executed.
+
+        Args:
+            tool_calls: The tool calls returned by Orchestrate.
+            started: Tasks already running for the leading tool calls.
+            answer_rendered: Whether a FinalAnswer was already shown to the user
+                while streaming.
+
+        Returns:
+            The final answer if the response gave one, None otherwise.
+        """
+        final_index = next(
+            (
+                index
+                for index, spec in enumerate(map(self.tools.spec, tool_calls))
+                if spec is not None and spec.final
+            ),
+            None,
+        )
+        if final_index is not None:
+            tool_calls = tool_calls[: final_index + 1]
+        entries = list(await asyncio.gather(*started))
+        batch = []
+        writes = []
+        for tool_call in tool_calls[len(started) :]:
+            spec = self.tools.spec(tool_call)
+            if spec is not None and spec.writes is not None:
+                entries.extend(await asyncio.gather(*batch))
+                batch = []
+                writes.append(tool_call)
+                continue
+            entries.extend(await self._execute_writes(writes))
+            writes = []
+            if spec is not None and spec.is_parallel_safe(tool_call):
+                batch.append(self._execute_tool(tool_call))
+                continue
+            entries.extend(await asyncio.gather(*batch))
+            batch = []
+            entries.append(await self._execute_tool(tool_call, answer_rendered))
+        entries.extend(await asyncio.gather(*batch))
+        entries.extend(await self._execute_writes(writes))
+        # There is one entry per call, in order.
+        answer = entries[final_index].result if final_index is not None else None
+
+        # Earlier large results were seen in full once; from now on the model
+        # gets their preview and pages the blob with ReadBlob if needed.
+        self.short_term_memory.collapse_results()
+        entries = [entry for entry in entries if entry is not None]
+        for entry in entries:
+            self.short_term_memory.add_entry(entry)
+        # Files the next step is likely to read are loaded while the next
+        # Orchestrate call is in flight.
+        self.prefetcher.prefetch(entries)
+        return answer
+
+    async def _execute_writes(self, tool_calls) -> list[HistoryEntry | None]:
+        """
+        Executes consecutive writing calls as one transaction. Each call shows
+        its diff and is confirmed on its own, but the files are written
+        together once every call is done, or not at all.
+
+        Args:
+            tool_calls: The writing tool calls, in order.
+
+        Returns:
+            The entries of the calls.
+        """
+        if not tool_calls:
+            return []
+        self.writer.begin()
+        try:
+            entries = [await self._execute_tool(tool_call) for tool_call in tool_calls]
+        except BaseException:
+            self.writer.rollback()
+            raise
+        staged = set(self.writer.staged_paths())
+        try:
+            await asyncio.to_thread(self.writer.commit)
+        except OSError as e:
+            for tool_call, entry in zip(tool_calls, entries):
+                path = getattr(tool_call, self.tools.spec(tool_call).writes)
+                if entry is not None and os.path.realpath(path) in staged:
+                    entry.result = (
+                        "ERROR: The files written in this step could not be "
+                        f"saved, so none of them were changed: {e}"
+                    )
+        return entries
+
+    async def _execute_tool(
+        self, tool_call, answer_rendered: bool = False
+    ) -> HistoryEntry | None:
+        """
+        Executes a single tool call, recording its duration and result size
+        when tracing is enabled.
+
+        Args:
+            tool_call: A tool call returned by Orchestrate.
+            answer_rendered: Whether a FinalAnswer was already shown to the user
+                while streaming.
+
+        Returns:
+            The entry to record in short-term memory, or None if the tool is
+            unknown.
+        """
+        start = time.perf_counter()
+        executed = await self._run_tool(tool_call, answer_rendered)
+        if self.trace is not None:
+            self.trace.record_tool(
+                getattr(tool_call, "tool_name", type(tool_call).__name__),
+                time.perf_counter() - start,
+                executed[1] if executed is not None else None,
+            )
+        if executed is None:
+            return None
+        _, result, hint = executed
+        entry = HistoryEntry.from_tool_call(tool_call, result, hint)
+        if (
+            len(result) > BLOB_THRESHOLD_CHARS
+            and self.tools.spec(tool_call).large_output
+        ):
+            entry.attach_blob(await asyncio.to_thread(self.blob_store.put, result))
+        return entry
+
+    async def _run_tool(
+        self, tool_call, answer_rendered: bool = False
+    ) -> tuple[str, str, str | None] | None:
+        """
+        Executes a single tool call through its registered handler and
+        displays it.
+
+        Args:
+            tool_call: A tool call returned by Orchestrate.
+            answer_rendered: Whether a FinalAnswer was already shown to the user
+                while streaming.
+
+        Returns:
+            The markdown action shown to the user, the result and an optional
+            hint, or None if the tool is unknown.
+        """
+        spec = self.tools.spec(tool_call)
+        if spec is None:
+            action = f"**[Agent Action]:** Unknown Tool\n- tool_call: `{tool_call}`"
             self.console.print(Markdown(action))
+            return None
 
+        cache_key = self.tool_cache.key(tool_call) if spec.cacheable else None
+        if cache_key is not None:
+            cached = self.tool_cache.get(cache_key)
+            if cached is not None:
+                self.console.print(Markdown(cached[0] + "\n- cached: `true`"))
+                return cached
+            fingerprint = self.tool_cache.fingerprint(cache_key)
+
+        action = _describe(tool_call)
+        if spec.blocking:
+            output = await asyncio.to_thread(spec.handler, tool_call)
         else:
-            self.console.print(Markdown("Max loops reached. Exiting."))
+            output = await spec.handler(tool_call)
+        result, hint = output if isinstance(output, tuple) else (output, None)
+        if spec.writes is not None:
+            self.tool_cache.invalidate(getattr(tool_call, spec.writes))
+        if (
+            spec.paged
+            and tool_call.limit
+            and len(result) == tool_call.limit
+            and not result.startswith(("ERROR:", "INFO:"))
+        ):
+            hint = f"{TRUNCATED_HINT} {hint}" if hint else TRUNCATED_HINT
+
+        self.console.print(Markdown(action))
+        if spec.final and not answer_rendered:
+            self.response_provider.final_answer(result)
+        if cache_key is not None and not result.startswith(("ERROR:", "INFO:")):
+            self.tool_cache.put(cache_key, fingerprint, (action, result, hint))
+        return action, result, hint
+
+    def _register_tools(self) -> None:
+        """Declares every tool Orchestrate can call and how it is run."""
+        for spec in (
+            ToolSpec(
+                "read_file",
+                self._read_file,
+                read_only=True,
+                cacheable=True,
+                large_output=True,
+                paged=True,
+            ),
+            ToolSpec("write_file", self._write_file, writes="file_path"),
+            ToolSpec("edit_file", self._edit_file, writes="file_path"),
+            ToolSpec("replace_lines", self._replace_lines, writes="file_path"),
+            ToolSpec("apply_patch", self._apply_patch, writes="file_path"),
+            ToolSpec(
+                "list_directory_contents",
+                self._list_directory_contents,
+                read_only=True,
+                cacheable=True,
+                blocking=True,
+                large_output=True,
+            ),
+            ToolSpec(
+                "list_directory_tree",
+                self._list_directory_tree,
+                read_only=True,
+                blocking=True,
+                large_output=True,
+            ),
+            ToolSpec(
+                "find_content_in_file",
+                self._find_content_in_file,
+                read_only=True,
+                cacheable=True,
+                blocking=True,
+                large_output=True,
+            ),
+            ToolSpec(
+                "search_workspace",
+                self._search_workspace,
+                read_only=True,
+                blocking=True,
+                large_output=True,
+            ),
+            ToolSpec("get_user_text_input", self._get_user_text_input),
+            ToolSpec(
+                "review_and_confirm_changes",
+                self._review_and_confirm_changes,
+                writes="file_path",
+            ),
+            ToolSpec("collect_feedback", self._collect_feedback, blocking=True),
+            ToolSpec("request_human_intervention", self._request_human_intervention),
+            ToolSpec("final_answer", self._final_answer, final=True),
+            ToolSpec(
+                "fetch_page_content",
+                self._fetch_page_content,
+                read_only=True,
+                large_output=True,
+                paged=True,
+            ),
+            ToolSpec(
+                "fetch_api_data",
+                self._fetch_api_data,
+                read_only=_is_get_request,
+                large_output=True,
+                paged=True,
+            ),
+            # Blobs are paged from the store, so their pages are not stored again.
+            ToolSpec(
+                "read_blob", self._read_blob, read_only=True, blocking=True, paged=True
+            ),
+        ):
+            self.tools.add(spec)
+
+    async def _read_file(self, tool_call) -> tuple[str, str | None]:
+        content = await self.file_manager.read_file(
+            tool_call.file_path, tool_call.limit, tool_call.offset
+        )
+        paged = (tool_call.limit or -1) > -1 or (tool_call.offset or 0) > 0
+        if not paged or content.startswith(("ERROR:", "INFO:")):
+            return content, None
+        info = await asyncio.to_thread(
+            self.file_manager.get_file_info, tool_call.file_path
+        )
+        return (
+            content,
+            f"The file has {info['size_bytes']} bytes and {info['line_count']} lines.",
+        )
+
+    async def _write_file(self, tool_call) -> str:
+        success = await self.file_manager.write_file(
+            tool_call.file_path, tool_call.content
+        )
+        return "File saved successfully." if success else "Failed to save file."
+
+    async def _edit_file(self, tool_call) -> str:
+        return await self.file_manager.edit_file(
+            tool_call.file_path,
+            lambda content: replace_text(
+                content, tool_call.old_text, tool_call.new_text, tool_call.replace_all
+            ),
+        )
+
+    async def _replace_lines(self, tool_call) -> str:
+        return await self.file_manager.edit_file(
+            tool_call.file_path,
+            lambda content: replace_lines(
+                content,
+                tool_call.start_line,
+                tool_call.end_line,
+                tool_call.new_text,
+                tool_call.expected_text,
+            ),
+        )
+
+    async def _apply_patch(self, tool_call) -> str:
+        # A patch may create the file, e.g. from --- /dev/null.
+        return await self.file_manager.edit_file(
+            tool_call.file_path,
+            lambda content: apply_patch(content, tool_call.patch),
+            missing_ok=True,
+        )
+
+    def _list_directory_contents(self, tool_call) -> str:
+        return "\n".join(
+            self.file_manager.list_directory_contents(tool_call.directory_path)
+        )
+
+    def _list_directory_tree(self, tool_call) -> str:
+        return "\n".join(
+            self.file_manager.list_directory_tree(
+                tool_call.directory_path or ".",
+                tool_call.max_depth,
+                tool_call.max_entries,
+            )
+        )
+
+    def _find_content_in_file(self, tool_call) -> str:
+        return "\n".join(
+            self.file_manager.find_content_in_file(
+                tool_call.file_path, tool_call.search_query
+            )
+        )
+
+    def _search_workspace(self, tool_call) -> str:
+        results = self.search_tool.search_workspace(
+            tool_call.query,
+            tool_call.directory_path or ".",
+            tool_call.is_regex,
+            tool_call.case_sensitive,
+            tool_call.include,
+            tool_call.exclude,
+            tool_call.context_lines,
+            tool_call.max_results_per_file,
+        )
+        return "\n".join(results) if results else "No matches found."
+
+    async def _get_user_text_input(self, tool_call) -> str:
+        return await self.human_interaction.get_user_text_input(
+            tool_call.prompt_message
+        )
+
+    async def _review_and_confirm_changes(self, tool_call) -> str:
+        success = await self.human_interaction.review_and_confirm_changes(
+            tool_call.file_path, tool_call.new_content
+        )
+        return "Changes applied." if success else "Changes rejected."
+
+    def _collect_feedback(self, tool_call) -> str:
+        self.human_interaction.collect_feedback(
+            tool_call.task_id, tool_call.feedback_type, tool_call.message
+        )
+        return "Feedback collected."
+
+    async def _request_human_intervention(self, tool_call) -> str:
+        return await self.human_interaction.request_human_intervention(tool_call.reason)
+
+    async def _final_answer(self, tool_call) -> str:
+        return tool_call.answer
+
+    async def _fetch_page_content(self, tool_call) -> str:
+        return await self.web_fetch_tool.fetch_page_content(
+            tool_call.url,
+            tool_call.limit,
+            tool_call.offset,
+            tool_call.convert_to_text,
+        )
+
+    async def _fetch_api_data(self, tool_call) -> str:
+        return await self.api_fetch_tool.fetch_api_data(
+            tool_call.url,
+            tool_call.method,
+            tool_call.headers,
+            tool_call.data,
+            tool_call.limit,
+            tool_call.offset,
+        )
+
+    def _read_blob(self, tool_call) -> str:
+        content = self.blob_store.get(
+            tool_call.handle, tool_call.offset, tool_call.limit
+        )
+        if content is None:
+            return f"ERROR: No blob with handle '{tool_call.handle}'. It may have been evicted; run the tool that produced it again."
+        return content
@@ -1,7 +1,14 @@
 import typer
 import asyncio
+import json
+import os
 import sys
+import threading
+import time
+from datetime import datetime
 from src.agent_core import DevAgent
+from src.tools.approval_policy import DEFAULT_POLICY_PATH, ApprovalPolicy
+from src.tools.trigram_index import DEFAULT_INDEX_PATH, TrigramIndex
 
 app = typer.Typer()
 
@@ -13,25 +20,251 @@ def chat(
         "--max-loops",
         "-l",
         help="The maximum number of loops to run the agent for.",
-    )
+    ),
+    stream: bool = typer.Option(
+        False,
+        "--stream",
+        "-s",
+        help="Stream model output, rendering the final answer as it arrives.",
+    ),
+    token_budget: int = typer.Option(
+        8000,
+        "--token-budget",
+        help="Estimated history tokens above which older entries are summarized.",
+    ),
+    keep_recent: int = typer.Option(
+        6,
+        "--keep-recent",
+        help="The number of most recent history entries kept verbatim.",
+    ),
+    session_id: str = typer.Option(
+        None,
+        "--session-id",
+        help="Resume a saved session instead of starting a new one.",
+    ),
+    approval_policy: str = typer.Option(
+        DEFAULT_POLICY_PATH,
+        "--approval-policy",
+        help="A TOML file of rules that approve or deny reads and writes without asking.",
+    ),
+    trace: bool = typer.Option(
+        False,
+        "--trace",
+        help="Record per-step LLM and tool metrics to data/traces/ and print a summary after each query.",
+    ),
 ):
     """
     Starts an interactive chat session with the Dev Agent.
     """
-    agent = DevAgent(session_id="default_session", max_loops=max_loops)
+    if session_id is None:
+        session_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+    agent = DevAgent(
+        session_id=session_id,
+        max_loops=max_loops,
+        stream=stream,
+        token_budget=token_budget,
+        keep_recent=keep_recent,
+        trace=trace,
+        persist=True,
+        approval_policy=ApprovalPolicy.from_file(approval_policy),
+    )
     print("Welcome to the Dev Agent chat! Type 'exit' to end the session.")
+    if agent.short_term_memory.store.exists():
+        print(
+            f"Resumed session {session_id} with "
+            f"{len(agent.short_term_memory.history)} recent history entries."
+        )
+    else:
+        print(f"Session {session_id}; resume it with --session-id {session_id}.")
+
+    # One event loop serves the whole session, so the browser, HTTP pools
+    # and caches stay warm between queries.
+    try:
+        asyncio.run(_chat_session(agent))
+    except KeyboardInterrupt:
+        # asyncio.run cancels the session on Ctrl+C; its cleanup has run.
+        print("\nCaught Ctrl+C, exiting...")
+        sys.exit(0)
+
+
+@app.command()
+def index(
+    directory_path: str = typer.Argument(".", help="The workspace to index."),
+    index_path: str = typer.Option(
+        DEFAULT_INDEX_PATH, "--index-path", help="Where the index is stored."
+    ),
+):
+    """
+    Builds or incrementally updates the trigram index used by searches.
+    """
+    stats = TrigramIndex(index_path).update(directory_path)
+    print(
+        f"Indexed {directory_path}: {stats['added']} added, {stats['updated']} updated, "
+        f"{stats['removed']} removed, {stats['unchanged']} unchanged."
+    )
 
-    while True:
+
+@app.command("run-batch")
+def run_batch(
+    queries_path: str = typer.Argument(
+        ..., help='A JSONL file of {"query": ..., "id": ...} objects.'
+    ),
+    output_path: str = typer.Option(
+        "data/batch_results.jsonl",
+        "--output",
+        "-o",
+        help="The JSONL file results are appended to.",
+    ),
+    concurrency: int = typer.Option(
+        4, "--concurrency", "-c", help="The number of queries run at once."
+    ),
+    max_loops: int = typer.Option(
+        10,
+        "--max-loops",
+        "-l",
+        help="The maximum number of loops to run the agent for on each query.",
+    ),
+    approval_policy: str = typer.Option(
+        DEFAULT_POLICY_PATH,
+        "--approval-policy",
+        help="A TOML file of rules that approve or deny reads and writes. Anything it does not decide is denied.",
+    ),
+):
+    """
+    Runs every query of a JSONL file in its own unattended agent session.
+    """
+    with open(queries_path, "r", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    queries = []
+    # A bad line is reported and skipped rather than failing the whole batch.
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
         try:
-            query = input("> ")
+            item = json.loads(line)
+        except json.JSONDecodeError as e:
+            print(f"Skipping line {number} of {queries_path}: invalid JSON ({e}).")
+            continue
+        if isinstance(item, str):
+            item = {"query": item}
+        if not isinstance(item, dict) or not isinstance(item.get("query"), str):
+            print(
+                f"Skipping line {number} of {queries_path}: expected a string "
+                'or an object with a "query" string.'
+            )
+            continue
+        queries.append((str(item.get("id", number)), item["query"]))
+
+    policy = ApprovalPolicy.from_file(approval_policy)
+    print(f"Running {len(queries)} queries with concurrency {concurrency}.")
+    results = asyncio.run(
+        _run_batch(queries, output_path, concurrency, max_loops, policy)
+    )
+    answered = sum(1 for result in results if result["answer"] is not None)
+    failed = sum(1 for result in results if result["error"] is not None)
+    print(
+        f"Done: {answered} answered, {failed} failed, "
+        f"{len(results) - answered - failed} without an answer. "
+        f"Results are in {output_path}."
+    )
+
+
+async def _run_batch(
+    queries: list[tuple[str, str]],
+    output_path: str,
+    concurrency: int,
+    max_loops: int,
+    policy: ApprovalPolicy | None,
+) -> list[dict]:
+    semaphore = asyncio.Semaphore(concurrency)
+    batch_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+
+    with open(output_path, "a", encoding="utf-8") as output:
+
+        async def run_one(query_id: str, query: str) -> dict:
+            async with semaphore:
+                agent = DevAgent(
+                    session_id=f"batch-{batch_id}-{query_id}",
+                    max_loops=max_loops,
+                    approval_policy=policy,
+                    interactive=False,
+                )
+                result = {"id": query_id, "query": query, "answer": None}
+                start = time.perf_counter()
+                try:
+                    result["answer"] = await agent.run(query)
+                    result["error"] = None
+                except Exception as e:
+                    result["error"] = f"{type(e).__name__}: {e}"
+                finally:
+                    await agent.aclose()
+                result["steps"] = agent.steps_taken
+                result["wall_time_s"] = round(time.perf_counter() - start, 3)
+            # Results are written as they finish, so an interrupted batch
+            # keeps everything completed so far.
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+            status = "failed" if result["error"] else f"{result['steps']} steps"
+            print(f"[{query_id}] {status} in {result['wall_time_s']:.1f}s")
+            return result
+
+        return await asyncio.gather(
+            *(run_one(query_id, query) for query_id, query in queries)
+        )
+
+
+async def _read_line(prompt: str) -> str:
+    """
+    Reads a line from stdin without blocking the event loop. The read runs on
+    a daemon thread, so a prompt left waiting never holds up shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(callback, value):
+        if not future.done():
+            callback(value)
+
+    def read():
+        try:
+            line = input(prompt)
+        except BaseException as e:
+            loop.call_soon_threadsafe(resolve, future.set_exception, e)
+        else:
+            loop.call_soon_threadsafe(resolve, future.set_result, line)
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
+async def _chat_session(agent: DevAgent):
+    try:
+        while True:
+            try:
+                query = await _read_line("> ")
+            except EOFError:
+                query = "exit"
             if query.lower() == "exit":
                 print("Ending chat session.")
                 break
+            await agent.run(query)
+    finally:
+        await agent.aclose()
+        _print_cache_stats(agent)
+
 
-            asyncio.run(agent.run(query))
-        except KeyboardInterrupt:
-            print("\nCaught Ctrl+C, exiting...")
-            sys.exit(0)
+def _print_cache_stats(agent: DevAgent):
+    stats = agent.tool_cache.stats()
+    print(
+        f"Tool cache: {stats['hits']} hits, {stats['misses']} misses "
+        f"({stats['hit_rate']:.0%} hit rate)."
+    )
+    stats = agent.prefetcher.stats()
+    print(
+        f"Prefetch: {stats['prefetched']} files prefetched, {stats['hits']} reads "
+        f"served ({stats['hit_rate']:.0%} hit rate)."
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,129 @@
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+
+DEFAULT_BLOB_DIR = "data/blobs"
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+_HANDLE_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+
+class BlobStore:
+    """
+    A content-addressed store of large tool results on disk. A blob is named
+    by the hash of its content, so identical results are stored once. When
+    the store grows past its size limit, the least recently used blobs are
+    evicted.
+    """
+
+    def __init__(
+        self, blob_dir: str = DEFAULT_BLOB_DIR, max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """
+        Initializes the BlobStore.
+
+        Args:
+            blob_dir: The directory holding the blobs.
+            max_bytes: The total size above which blobs are evicted.
+        """
+        self.blob_dir = blob_dir
+        self.max_bytes = max_bytes
+        # Handle -> size in bytes, least recently used first. Loaded from the
+        # directory on first use, ordered by modification time.
+        self._index = None
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def _path(self, handle: str) -> str:
+        return os.path.join(self.blob_dir, handle)
+
+    def _load_index(self) -> OrderedDict:
+        if self._index is None:
+            entries = []
+            try:
+                with os.scandir(self.blob_dir) as it:
+                    for entry in it:
+                        if entry.is_file() and _HANDLE_PATTERN.fullmatch(entry.name):
+                            stat = entry.stat()
+                            entries.append((stat.st_mtime_ns, entry.name, stat.st_size))
+            except FileNotFoundError:
+                pass
+            entries.sort()
+            self._index = OrderedDict((name, size) for _, name, size in entries)
+            self._total_bytes = sum(self._index.values())
+        return self._index
+
+    def _touch(self, handle: str) -> None:
+        self._index.move_to_end(handle)
+        try:
+            # The mtime keeps the LRU order across restarts.
+            os.utime(self._path(handle))
+        except OSError:
+            pass
+
+    def put(self, content: str) -> str:
+        """
+        Stores content and returns its handle.
+
+        Args:
+            content: The content to store.
+
+        Returns:
+            The handle of the blob.
+        """
+        data = content.encode("utf-8")
+        handle = hashlib.sha256(data).hexdigest()[:32]
+        with self._lock:
+            index = self._load_index()
+            if handle in index:
+                self._touch(handle)
+                return handle
+
+            os.makedirs(self.blob_dir, exist_ok=True)
+            temp_path = f"{self._path(handle)}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self._path(handle))
+            index[handle] = len(data)
+            self._total_bytes += len(data)
+
+            while self._total_bytes > self.max_bytes and len(index) > 1:
+                evicted, size = index.popitem(last=False)
+                self._total_bytes -= size
+                try:
+                    os.remove(self._path(evicted))
+                except OSError:
+                    pass
+        return handle
+
+    def get(
+        self, handle: str, offset: int | None = None, limit: int | None = None
+    ) -> str | None:
+        """
+        Reads a blob, or part of it.
+
+        Args:
+            handle: The handle returned by `put`.
+            offset: The number of characters to skip.
+            limit: The maximum number of characters to return.
+
+        Returns:
+            The content, or None if there is no blob with that handle.
+        """
+        if not _HANDLE_PATTERN.fullmatch(handle or ""):
+            return None
+        with self._lock:
+            index = self._load_index()
+            if handle not in index:
+                return None
+            self._touch(handle)
+        try:
+            with open(self._path(handle), "r", encoding="utf-8", newline="") as f:
+                content = f.read()
+        except OSError:
+            return None
+        start = offset or 0
+        end = start + limit if limit is not None and limit > -1 else None
+        return content[start:end]
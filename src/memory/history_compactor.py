@@ -0,0 +1,57 @@
+from baml_client.async_client import b as baml_client
+from .short_term_memory import ShortTermMemory
+
+# Rough average for English text and code; good enough for budgeting.
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheaply estimates the number of tokens in `text`."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+class HistoryCompactor:
+    """
+    Keeps the history sent to Orchestrate under a token budget by folding
+    older entries into a rolling summary produced by SummarizeText.
+    """
+
+    def __init__(self, token_budget: int = 8000, keep_recent: int = 6, client=None):
+        """
+        Initializes the HistoryCompactor.
+
+        Args:
+            token_budget: The estimated number of history tokens above which
+                older entries are summarized.
+            keep_recent: The number of most recent entries kept verbatim.
+            client: The BAML client used to call SummarizeText. Defaults to
+                the generated async client.
+        """
+        self.token_budget = token_budget
+        self.keep_recent = keep_recent
+        self.client = client or baml_client
+
+    def history_tokens(self, memory: ShortTermMemory) -> int:
+        return sum(estimate_tokens(entry) for entry in memory.get_history())
+
+    async def compact(self, memory: ShortTermMemory) -> bool:
+        """
+        Summarizes everything but the most recent entries if the history is
+        over budget. The previous summary is folded into the new one.
+
+        Args:
+            memory: The short-term memory to compact.
+
+        Returns:
+            True if the history was compacted, False otherwise.
+        """
+        if self.history_tokens(memory) <= self.token_budget:
+            return False
+        if len(memory.history) <= self.keep_recent:
+            return False
+
+        history = memory.get_history()
+        older = history[: len(history) - self.keep_recent]
+        summary = await self.client.SummarizeText(text="\n".join(older))
+        memory.fold(summary, self.keep_recent)
+        return True
@@ -0,0 +1,99 @@
+import json
+
+# Longer string arguments, such as file contents being written, are cut to
+# this many characters; the result of the call is what the model needs.
+MAX_ARGUMENT_CHARS = 100
+# Results longer than this are kept in the blob store, and only a preview of
+# PREVIEW_CHARS stays in the history once the step that produced them is over.
+BLOB_THRESHOLD_CHARS = 2000
+PREVIEW_CHARS = 500
+
+
+def _compact_json(value) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class HistoryEntry:
+    """
+    One executed tool call in the agent's history: the tool name, its
+    arguments and its result. Entries are rendered into the prompt format
+    only when the history is sent to Orchestrate.
+
+    A large result is also saved in the blob store; once collapsed, the
+    entry holds only a preview and the blob handle.
+    """
+
+    __slots__ = ("tool", "args", "result", "hint", "blob", "size")
+
+    def __init__(
+        self,
+        tool: str,
+        args: dict,
+        result: str,
+        hint: str | None = None,
+        blob: str | None = None,
+        size: int | None = None,
+    ):
+        """
+        Initializes the HistoryEntry.
+
+        Args:
+            tool: The name of the tool that was called.
+            args: The arguments of the call.
+            result: The result returned by the tool, or its preview.
+            hint: An optional note for the model about the result.
+            blob: The handle of the full result in the blob store, if any.
+            size: The length of the full result in characters, if it has a blob.
+        """
+        self.tool = tool
+        self.args = args
+        self.result = result
+        self.hint = hint
+        self.blob = blob
+        self.size = size
+
+    @classmethod
+    def from_tool_call(
+        cls, tool_call, result: str, hint: str | None = None
+    ) -> "HistoryEntry":
+        args = {}
+        for name, value in tool_call.model_dump(exclude={"tool_name"}).items():
+            if value is None or value == [] or value == {}:
+                continue
+            if isinstance(value, str) and len(value) > MAX_ARGUMENT_CHARS:
+                value = value[:MAX_ARGUMENT_CHARS] + "..."
+            args[name] = value
+        return cls(tool_call.tool_name, args, result, hint)
+
+    def attach_blob(self, handle: str) -> None:
+        self.blob = handle
+        self.size = len(self.result)
+
+    def collapse(self) -> None:
+        """Replaces a result saved in the blob store with its preview."""
+        if self.blob is not None and len(self.result) > PREVIEW_CHARS:
+            self.result = self.result[:PREVIEW_CHARS]
+
+    def to_dict(self) -> dict:
+        data = {"tool": self.tool, "args": self.args, "result": self.result}
+        if self.hint:
+            data["hint"] = self.hint
+        if self.blob is not None:
+            data["blob"] = self.blob
+            data["size"] = self.size
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HistoryEntry":
+        return cls(
+            data["tool"],
+            data["args"],
+            data["result"],
+            data.get("hint"),
+            data.get("blob"),
+            data.get("size"),
+        )
+
+    def render(self) -> str:
+        """Renders the entry as one line of compact JSON for the prompt."""
+        return _compact_json(self.to_dict())
@@ -0,0 +1,84 @@
+import json
+import os
+from typing import Iterator
+
+DEFAULT_SESSION_DIR = "data/sessions"
+# Bytes read at a time when scanning a session file from its end.
+READ_BLOCK_SIZE = 64 * 1024
+
+
+class SessionStore:
+    """
+    An append-only JSON lines file holding the history of one session.
+
+    Each line is a record: `{"entry": ...}` for a history entry, or
+    `{"summary": ..., "kept": n}` when the history was folded into a summary
+    with the `n` entries before it kept verbatim. Appends never rewrite the
+    file, and resuming reads it backwards only as far as the latest summary.
+    """
+
+    def __init__(self, session_id: str, session_dir: str = DEFAULT_SESSION_DIR):
+        """
+        Initializes the SessionStore.
+
+        Args:
+            session_id: The session to store; names the file.
+            session_dir: The directory holding session files.
+        """
+        self.path = os.path.join(session_dir, f"{session_id}.jsonl")
+        self._file = None
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.path)
+
+    def append(self, record: dict) -> None:
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "a+b")
+            # A crash can leave a partial last line; start on a fresh one.
+            if self._file.tell() > 0:
+                self._file.seek(-1, os.SEEK_END)
+                if self._file.read(1) != b"\n":
+                    self._file.write(b"\n")
+        self._file.write(json.dumps(record).encode("utf-8") + b"\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def iter_records_reversed(self) -> Iterator[dict]:
+        """
+        Yields the records of the session from newest to oldest, reading the
+        file in blocks from its end. Lines that are not valid JSON, such as
+        one cut short by a crash, are skipped.
+        """
+        if not self.exists():
+            return
+        with open(self.path, "rb") as f:
+            position = f.seek(0, os.SEEK_END)
+            remainder = b""
+            while position > 0:
+                size = min(READ_BLOCK_SIZE, position)
+                position -= size
+                f.seek(position)
+                lines = (f.read(size) + remainder).split(b"\n")
+                # The first piece may continue in the previous block.
+                remainder = lines.pop(0)
+                for line in reversed(lines):
+                    record = self._parse(line)
+                    if record is not None:
+                        yield record
+            record = self._parse(remainder)
+            if record is not None:
+                yield record
+
+    @staticmethod
+    def _parse(line: bytes) -> dict | None:
+        if not line.strip():
+            return None
+        try:
+            return json.loads(line)
+        except ValueError:
+            return None
@@ -1,10 +1,89 @@
+import json
+from collections import deque
+from .history_entry import PREVIEW_CHARS, HistoryEntry
+from .session_store import SessionStore
+
+# The most entries held in memory; older ones stay in the session store.
+DEFAULT_MAX_WINDOW = 200
+
+
 class ShortTermMemory:
-    def __init__(self, session_id: str):
+    def __init__(
+        self,
+        session_id: str,
+        store: SessionStore | None = None,
+        max_window: int = DEFAULT_MAX_WINDOW,
+    ):
+        """
+        Initializes the ShortTermMemory.
+
+        Args:
+            session_id: The ID of the session.
+            store: Where entries are persisted. If the store already holds the
+                session, its latest summary and recent entries are loaded.
+            max_window: The maximum number of entries kept in memory.
+        """
         self.session_id = session_id
-        self.history = []
+        self.store = store
+        self.history = deque(maxlen=max_window)
+        self.summary = None
+        if store is not None:
+            self._load()
+
+    def _load(self):
+        # Walk back from the newest record to the latest summary and the
+        # entries it kept, without reading anything older. Entries beyond the
+        # window are skipped, but the summary is still needed.
+        entries = []
+        kept = None
+        for record in self.store.iter_records_reversed():
+            if "summary" in record:
+                if kept is None:
+                    self.summary = record["summary"]
+                    kept = record.get("kept", 0)
+            elif "entry" in record:
+                if kept is not None:
+                    if kept == 0:
+                        break
+                    kept -= 1
+                if len(entries) < self.history.maxlen:
+                    entries.append(HistoryEntry.from_dict(record["entry"]))
+            if kept is not None and (kept == 0 or len(entries) == self.history.maxlen):
+                break
+        self.history.extend(reversed(entries))
+
+    def get_history(self) -> list[str]:
+        """Renders the summary, if any, and the entries in the prompt format."""
+        history = [entry.render() for entry in self.history]
+        if self.summary is None:
+            return history
+        summary = json.dumps(
+            {"summary": self.summary}, ensure_ascii=False, separators=(",", ":")
+        )
+        return [summary] + history
+
+    def add_entry(self, entry: HistoryEntry):
+        self.history.append(entry)
+        if self.store is not None:
+            # Results with a blob are persisted as their preview.
+            record = entry.to_dict()
+            if entry.blob is not None:
+                record["result"] = entry.result[:PREVIEW_CHARS]
+            self.store.append({"entry": record})
+
+    def collapse_results(self):
+        """Collapses every result saved in the blob store to its preview."""
+        for entry in self.history:
+            entry.collapse()
 
-    def get_history(self):
-        return self.history
+    def fold(self, summary: str, keep_recent: int):
+        """Replaces all but the `keep_recent` newest entries with `summary`."""
+        kept = list(self.history)[-keep_recent:] if keep_recent > 0 else []
+        self.summary = summary
+        self.history = deque(kept, maxlen=self.history.maxlen)
+        if self.store is not None:
+            self.store.append({"summary": summary, "kept": len(kept)})
 
-    def add_entry(self, data):
-        self.history.append(data)
+    def close(self):
+        if self.store is not None:
+            self.store.close()
@@ -0,0 +1,111 @@
+import os
+from collections import OrderedDict
+
+
+def _normalize_path(path: str) -> str:
+    return os.path.normcase(os.path.abspath(path or "."))
+
+
+class ToolResultCache:
+    """
+    A session-scoped cache of tool results keyed by tool name and normalized
+    arguments. Entries are validated against the mtime and size of the path
+    they were produced from, and dropped when that path is written.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Initializes the ToolResultCache.
+
+        Args:
+            max_entries: The maximum number of results kept; the least recently
+                used one is evicted first.
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, tool_call) -> tuple | None:
+        """
+        Builds the cache key for a tool call.
+
+        Returns:
+            The key, or None if the tool call is not cacheable.
+        """
+        tool_name = getattr(tool_call, "tool_name", None)
+        if tool_name == "read_file":
+            limit = tool_call.limit if tool_call.limit is not None else -1
+            offset = tool_call.offset or 0
+            return (tool_name, _normalize_path(tool_call.file_path), limit, offset)
+        if tool_name == "list_directory_contents":
+            return (tool_name, _normalize_path(tool_call.directory_path))
+        if tool_name == "find_content_in_file":
+            # The search is case-insensitive, so the query is too.
+            return (
+                tool_name,
+                _normalize_path(tool_call.file_path),
+                tool_call.search_query.lower(),
+            )
+        return None
+
+    def fingerprint(self, key: tuple) -> tuple | None:
+        """
+        Returns the (mtime, size) of the path a key depends on, or None if it
+        cannot be read.
+        """
+        try:
+            stat = os.stat(key[1])
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self, key: tuple):
+        """
+        Returns the cached value for a key if its path is unchanged, or None.
+        """
+        cached = self._entries.get(key)
+        if cached is not None:
+            fingerprint, value = cached
+            if fingerprint == self.fingerprint(key):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: tuple, fingerprint: tuple | None, value) -> None:
+        """
+        Stores a value with the fingerprint taken before the tool ran.
+        """
+        if fingerprint is None:
+            return
+        self._entries[key] = (fingerprint, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, path: str) -> None:
+        """
+        Drops every entry for `path` and listings of its parent directory.
+        """
+        path = _normalize_path(path)
+        parent = os.path.dirname(path)
+        for key in list(self._entries):
+            if key[1] == path or (
+                key[0] == "list_directory_contents" and key[1] == parent
+            ):
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        """
+        Returns the hit and miss counters and the number of cached entries.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
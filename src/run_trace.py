@@ -0,0 +1,139 @@
+import json
+import os
+import time
+from baml_py import Collector
+from rich.console import Console
+from rich.table import Table
+
+DEFAULT_TRACE_DIR = "data/traces"
+
+
+class RunTrace:
+    """
+    Records per-step metrics of agent runs: the latency and token usage of
+    each Orchestrate call, taken from a BAML collector, and the duration and
+    result size of each tool it called.
+
+    Steps are appended to `<trace_dir>/<session_id>.jsonl` as they finish.
+    """
+
+    def __init__(self, session_id: str, trace_dir: str = DEFAULT_TRACE_DIR):
+        """
+        Initializes the RunTrace.
+
+        Args:
+            session_id: The session the trace belongs to; names the trace file.
+            trace_dir: The directory holding trace files.
+        """
+        self.session_id = session_id
+        self.trace_path = os.path.join(trace_dir, f"{session_id}.jsonl")
+        self.collector = Collector(name=session_id)
+        self.console = Console()
+        self.query = None
+        self.steps = []
+        self._tools = []
+        self._time_to_first_token = None
+
+    def start_run(self, query: str) -> None:
+        self.query = query
+        self.steps = []
+        self._tools = []
+        self._time_to_first_token = None
+
+    def record_time_to_first_token(self, seconds: float) -> None:
+        # The collector does not time streamed calls to their first token, so
+        # the agent reports when the first partial response arrived.
+        self._time_to_first_token = round(seconds * 1000)
+
+    def record_tool(self, tool_name: str, duration: float, result: str | None) -> None:
+        self._tools.append(
+            {
+                "tool": tool_name,
+                "duration_ms": round(duration * 1000, 2),
+                "result_bytes": len(result.encode("utf-8")) if result else 0,
+            }
+        )
+
+    def end_step(self) -> None:
+        """
+        Appends a step made of the last Orchestrate call and the tools run
+        since the previous step.
+        """
+        step = {
+            "session_id": self.session_id,
+            "query": self.query,
+            "step": len(self.steps) + 1,
+            "timestamp": time.time(),
+            "llm_latency_ms": None,
+            "time_to_first_token_ms": self._time_to_first_token,
+            "input_tokens": None,
+            "output_tokens": None,
+            "tools": self._tools,
+        }
+        # The collector also sees SummarizeText calls made by compaction.
+        log = next(
+            (
+                log
+                for log in reversed(self.collector.logs)
+                if log.function_name == "Orchestrate"
+            ),
+            None,
+        )
+        if log is not None:
+            step["llm_latency_ms"] = log.timing.duration_ms
+            step["input_tokens"] = log.usage.input_tokens
+            step["output_tokens"] = log.usage.output_tokens
+        self.steps.append(step)
+        self._tools = []
+        self._time_to_first_token = None
+
+        os.makedirs(os.path.dirname(self.trace_path) or ".", exist_ok=True)
+        with open(self.trace_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(step) + "\n")
+
+    def print_summary(self) -> None:
+        """
+        Prints a table of the steps of the current run with a totals row.
+        """
+        if not self.steps:
+            return
+        table = Table(title=f"Run trace ({self.trace_path})")
+        table.add_column("Step", justify="right")
+        table.add_column("LLM (ms)", justify="right")
+        table.add_column("TTFT (ms)", justify="right")
+        table.add_column("In tok", justify="right")
+        table.add_column("Out tok", justify="right")
+        table.add_column("Tools")
+        table.add_column("Tool (ms)", justify="right")
+        table.add_column("Result (B)", justify="right")
+
+        def cell(value) -> str:
+            return "-" if value is None else f"{value:,}"
+
+        for step in self.steps:
+            table.add_row(
+                str(step["step"]),
+                cell(step["llm_latency_ms"]),
+                cell(step["time_to_first_token_ms"]),
+                cell(step["input_tokens"]),
+                cell(step["output_tokens"]),
+                ", ".join(tool["tool"] for tool in step["tools"]),
+                f"{sum(tool['duration_ms'] for tool in step['tools']):,.1f}",
+                cell(sum(tool["result_bytes"] for tool in step["tools"])),
+            )
+
+        def total(key: str) -> int:
+            return sum(step[key] or 0 for step in self.steps)
+
+        table.add_section()
+        table.add_row(
+            "Total",
+            f"{total('llm_latency_ms'):,}",
+            "",
+            f"{total('input_tokens'):,}",
+            f"{total('output_tokens'):,}",
+            str(sum(len(step["tools"]) for step in self.steps)),
+            f"{sum(t['duration_ms'] for s in self.steps for t in s['tools']):,.1f}",
+            f"{sum(t['result_bytes'] for s in self.steps for t in s['tools']):,}",
+        )
+        self.console.print(table)
@@ -1,17 +1,69 @@
 from typing import Optional
-import requests
+import asyncio
+import importlib.util
+import httpx
+
+# Methods that can be retried without risking a duplicated side effect.
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
 
 
 class APIFetchTools:
     """
     A class for fetching data from APIs.
+
+    Requests go through one pooled async HTTP client, so repeated calls to the
+    same host reuse their connections and never block the event loop.
     """
 
-    def __init__(self):
-        """Initializes the APIFetchTools."""
-        pass
+    def __init__(
+        self,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        max_retries: int = 2,
+        backoff_factor: float = 0.5,
+        max_connections: int = 20,
+        http2: Optional[bool] = None,
+    ):
+        """
+        Initializes the APIFetchTools.
+
+        Args:
+            connect_timeout: Seconds allowed to establish a connection.
+            read_timeout: Seconds allowed between bytes of the response.
+            max_retries: How many times an idempotent request is retried after a
+                transport error or a retryable status code.
+            backoff_factor: Base delay in seconds; doubled after each retry.
+            max_connections: The maximum number of pooled connections.
+            http2: Whether to negotiate HTTP/2. Defaults to enabled when the
+                optional `h2` package is installed.
+        """
+        self.timeout = httpx.Timeout(
+            read_timeout, connect=connect_timeout, read=read_timeout
+        )
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        if http2 is None:
+            http2 = importlib.util.find_spec("h2") is not None
+        self.http2 = http2
+        self._client = None
+        self._loop = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            # Pooled connections belong to the loop that opened them.
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout, limits=self.limits, http2=self.http2
+            )
+            self._loop = loop
+        return self._client
 
-    def fetch_api_data(
+    async def fetch_api_data(
         self,
         url: str,
         method: str = "GET",
@@ -34,21 +86,43 @@ class APIFetchTools:
         Returns:
             The response from the API as a string, or an error message.
         """
-        try:
-            if headers is not None and len(headers) == 0:
-                headers = None
-            if data is not None and len(data) == 0:
-                data = None
-
-            response = requests.request(method, url, headers=headers, json=data)
-            response.raise_for_status()  # Raise an exception for HTTP errors
-            content = response.text
-
-            if offset is not None:
-                content = content[offset:]
-            if limit is not None:
-                content = content[:limit]
-
-            return content
-        except requests.exceptions.RequestException as e:
-            return f"Error fetching API data from {url}: {e}"
+        if headers is not None and len(headers) == 0:
+            headers = None
+        if data is not None and len(data) == 0:
+            data = None
+        method = (method or "GET").upper()
+        attempts = 1 + (self.max_retries if method in IDEMPOTENT_METHODS else 0)
+
+        client = self._get_client()
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                response = await client.request(method, url, headers=headers, json=data)
+                if response.status_code in RETRYABLE_STATUS_CODES and not last_attempt:
+                    await asyncio.sleep(self.backoff_factor * 2**attempt)
+                    continue
+                response.raise_for_status()  # Raise an exception for HTTP errors
+                content = response.text
+                break
+            except httpx.TransportError as e:
+                if last_attempt:
+                    return f"Error fetching API data from {url}: {e}"
+                await asyncio.sleep(self.backoff_factor * 2**attempt)
+            except (httpx.HTTPError, httpx.InvalidURL) as e:
+                return f"Error fetching API data from {url}: {e}"
+
+        if offset is not None:
+            content = content[offset:]
+        if limit is not None:
+            content = content[:limit]
+
+        return content
+
+    async def aclose(self) -> None:
+        """
+        Closes the pooled HTTP client. A later request opens a new one.
+        """
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
@@ -0,0 +1,137 @@
+import fnmatch
+import os
+import tomllib
+from datetime import datetime
+
+DEFAULT_POLICY_PATH = "approval_policy.toml"
+DEFAULT_DECISION_LOG = "data/approvals.log"
+OPERATIONS = ("read", "write")
+DEFAULTS = ("ask", "allow", "deny")
+
+
+class ApprovalPolicy:
+    """
+    Decides confirmations without asking the user, from glob rules per
+    operation. Deny rules win over allow rules; anything unmatched falls back
+    to the operation's default, which is to ask.
+
+    The policy file is TOML, one table per operation:
+
+        [read]
+        allow_workspace = true      # approve reads inside the workspace
+        deny = [".env", "*.pem"]
+
+        [write]
+        allow = ["src/*", "docs/*"]
+        default = "deny"            # "ask", "allow" or "deny"
+
+    Patterns are matched against paths relative to the workspace, and `*`
+    also matches `/`. Paths outside the workspace only match absolute
+    patterns.
+    """
+
+    def __init__(
+        self,
+        rules: dict | None = None,
+        workspace: str = ".",
+        decision_log: str = DEFAULT_DECISION_LOG,
+    ):
+        """
+        Initializes the ApprovalPolicy.
+
+        Args:
+            rules: The parsed policy, keyed by operation.
+            workspace: The directory relative patterns are matched against.
+            decision_log: The file every automatic decision is appended to.
+        """
+        self.rules = rules or {}
+        self.workspace = os.path.realpath(workspace)
+        self.decision_log = decision_log
+        for operation, rule in self.rules.items():
+            if operation not in OPERATIONS:
+                raise ValueError(f"Unknown operation '{operation}' in approval policy.")
+            if rule.get("default", "ask") not in DEFAULTS:
+                raise ValueError(
+                    f"Invalid default '{rule['default']}' for '{operation}' in "
+                    f"approval policy; expected one of {', '.join(DEFAULTS)}."
+                )
+
+    @classmethod
+    def from_file(cls, policy_path: str = DEFAULT_POLICY_PATH, **kwargs):
+        """
+        Loads a policy from a TOML file.
+
+        Args:
+            policy_path: The path of the policy file.
+            **kwargs: Passed on to the constructor.
+
+        Returns:
+            The policy, or None if the file does not exist.
+        """
+        try:
+            with open(policy_path, "rb") as f:
+                rules = tomllib.load(f)
+        except FileNotFoundError:
+            return None
+        return cls(rules, **kwargs)
+
+    def _relative_path(self, path: str) -> str | None:
+        """The path relative to the workspace, or None if it is outside."""
+        # Symlinks are resolved so a link cannot lead out of the workspace.
+        relative_path = os.path.relpath(os.path.realpath(path), self.workspace)
+        if relative_path == os.pardir or relative_path.startswith(os.pardir + os.sep):
+            return None
+        return relative_path.replace(os.sep, "/")
+
+    def _matches(self, path: str, patterns: list[str]) -> str | None:
+        absolute_path = os.path.realpath(path)
+        relative_path = self._relative_path(path)
+        for pattern in patterns:
+            if os.path.isabs(pattern):
+                if fnmatch.fnmatch(absolute_path, pattern):
+                    return pattern
+            elif relative_path is not None and (
+                fnmatch.fnmatch(relative_path, pattern)
+                or fnmatch.fnmatch(os.path.basename(absolute_path), pattern)
+            ):
+                return pattern
+        return None
+
+    def decide(self, operation: str, path: str) -> tuple[bool | None, str]:
+        """
+        Decides an operation on a path.
+
+        Args:
+            operation: The operation, "read" or "write".
+            path: The path the operation applies to.
+
+        Returns:
+            True to approve, False to deny, or None to ask the user, with the
+            reason for the decision.
+        """
+        rule = self.rules.get(operation, {})
+        pattern = self._matches(path, rule.get("deny", []))
+        if pattern is not None:
+            return False, f"deny rule '{pattern}'"
+        pattern = self._matches(path, rule.get("allow", []))
+        if pattern is not None:
+            return True, f"allow rule '{pattern}'"
+        if operation == "read" and rule.get("allow_workspace", False):
+            if self._relative_path(path) is not None:
+                return True, "read inside the workspace"
+        default = rule.get("default", "ask")
+        if default == "ask":
+            return None, "no matching rule"
+        return default == "allow", f"default '{default}'"
+
+    def log_decision(
+        self, operation: str, path: str, approved: bool, reason: str
+    ) -> None:
+        decision = "APPROVED" if approved else "DENIED"
+        log_message = (
+            f"{datetime.now().isoformat(timespec='seconds')} [{decision}] "
+            f"{operation} {path}: {reason}"
+        )
+        os.makedirs(os.path.dirname(self.decision_log) or ".", exist_ok=True)
+        with open(self.decision_log, "a", encoding="utf-8") as f:
+            f.write(log_message + "\n")
@@ -0,0 +1,322 @@
+from bisect import bisect_left
+
+# Edit distance above which the Myers search gives up on a region and shows it
+# as replaced outright; bounds the time spent on heavily changed files.
+MAX_EDIT_COST = 1000
+# Lines of unified diff shown before the rest is summarized.
+MAX_RENDERED_LINES = 500
+
+
+def _unique_anchors(a, a_lo, a_hi, b, b_lo, b_hi) -> list[tuple[int, int]]:
+    """
+    Pairs lines that occur exactly once in both ranges, keeping the longest
+    run of pairs that is in order on both sides (patience diff).
+    """
+    a_positions = {}
+    for i in range(a_lo, a_hi):
+        a_positions[a[i]] = -1 if a[i] in a_positions else i
+    b_positions = {}
+    for j in range(b_lo, b_hi):
+        line = b[j]
+        if a_positions.get(line, -1) >= 0:
+            b_positions[line] = -1 if line in b_positions else j
+    pairs = [(a_positions[line], j) for line, j in b_positions.items() if j >= 0]
+    if not pairs:
+        return []
+    pairs.sort()
+
+    # Longest increasing subsequence of the b positions, by patience sorting.
+    tops = []
+    top_indexes = []
+    previous = [-1] * len(pairs)
+    for index, (_, j) in enumerate(pairs):
+        pile = bisect_left(tops, j)
+        if pile == len(tops):
+            tops.append(j)
+            top_indexes.append(index)
+        else:
+            tops[pile] = j
+            top_indexes[pile] = index
+        previous[index] = top_indexes[pile - 1] if pile else -1
+    anchors = []
+    index = top_indexes[-1]
+    while index >= 0:
+        anchors.append(pairs[index])
+        index = previous[index]
+    anchors.reverse()
+    return anchors
+
+
+def _myers(a, a_lo, a_hi, b, b_lo, b_hi) -> list[tuple[int, int, int]] | None:
+    """
+    Finds a shortest edit script between two ranges with Myers' O(ND)
+    algorithm.
+
+    Returns:
+        The matching blocks as (i, j, size), or None if more than
+        MAX_EDIT_COST edits are needed.
+    """
+    n = a_hi - a_lo
+    m = b_hi - b_lo
+    max_cost = min(n + m, MAX_EDIT_COST)
+    offset = max_cost + 1
+    v = [0] * (2 * max_cost + 3)
+    trace = []
+    for d in range(max_cost + 1):
+        # Only diagonals -d - 1 to d + 1 are read when backtracking from step d.
+        trace.append(v[offset - d - 1 : offset + d + 2])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[a_lo + x] == b[b_lo + y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                return _backtrack(trace, n, m, a_lo, b_lo)
+    return None
+
+
+def _backtrack(trace, x, y, a_lo, b_lo) -> list[tuple[int, int, int]]:
+    """Walks the saved frontiers back from the end to recover the snakes."""
+    blocks = []
+    for d in range(len(trace) - 1, 0, -1):
+        v = trace[d]
+        offset = d + 1
+        k = x - y
+        if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+            previous_x = v[offset + k + 1]
+            previous_y = previous_x - k - 1
+            # An insertion: one step down from the previous endpoint.
+            snake_x, snake_y = previous_x, previous_y + 1
+        else:
+            previous_x = v[offset + k - 1]
+            previous_y = previous_x - k + 1
+            # A deletion: one step right from the previous endpoint.
+            snake_x, snake_y = previous_x + 1, previous_y
+        if x > snake_x:
+            blocks.append((a_lo + snake_x, b_lo + snake_y, x - snake_x))
+        x, y = previous_x, previous_y
+    if x > 0:
+        blocks.append((a_lo, b_lo, x))
+    return blocks
+
+
+def matching_blocks(a: list, b: list) -> list[tuple[int, int, int]]:
+    """
+    Finds the lines two sequences have in common.
+
+    Common prefixes and suffixes are stripped first, then lines unique to both
+    sides anchor the match and the gaps between anchors are diffed with Myers'
+    algorithm. Regions too different for it are treated as replaced.
+
+    Args:
+        a: The old lines, as hashable values.
+        b: The new lines, as hashable values.
+
+    Returns:
+        Blocks (i, j, size) with a[i:i + size] == b[j:j + size], in order and
+        followed by the (len(a), len(b), 0) sentinel, like
+        difflib.SequenceMatcher.get_matching_blocks.
+    """
+    blocks = []
+    regions = [(0, len(a), 0, len(b))]
+    while regions:
+        a_lo, a_hi, b_lo, b_hi = regions.pop()
+        start = 0
+        while a_lo + start < a_hi and b_lo + start < b_hi:
+            if a[a_lo + start] != b[b_lo + start]:
+                break
+            start += 1
+        if start:
+            blocks.append((a_lo, b_lo, start))
+            a_lo += start
+            b_lo += start
+        end = 0
+        while a_hi - end > a_lo and b_hi - end > b_lo:
+            if a[a_hi - end - 1] != b[b_hi - end - 1]:
+                break
+            end += 1
+        if end:
+            blocks.append((a_hi - end, b_hi - end, end))
+            a_hi -= end
+            b_hi -= end
+        if a_lo == a_hi or b_lo == b_hi:
+            continue
+
+        anchors = _unique_anchors(a, a_lo, a_hi, b, b_lo, b_hi)
+        if anchors:
+            for i, j in anchors:
+                blocks.append((i, j, 1))
+                regions.append((a_lo, i, b_lo, j))
+                a_lo, b_lo = i + 1, j + 1
+            regions.append((a_lo, a_hi, b_lo, b_hi))
+        elif not set(a[a_lo:a_hi]).isdisjoint(b[b_lo:b_hi]):
+            # Without a line in common the region is replaced outright.
+            blocks.extend(_myers(a, a_lo, a_hi, b, b_lo, b_hi) or ())
+
+    blocks.sort()
+    merged = []
+    for i, j, size in blocks:
+        if (
+            merged
+            and merged[-1][0] + merged[-1][2] == i
+            and (merged[-1][1] + merged[-1][2] == j)
+        ):
+            merged[-1] = (merged[-1][0], merged[-1][1], merged[-1][2] + size)
+        else:
+            merged.append((i, j, size))
+    merged.append((len(a), len(b), 0))
+    return merged
+
+
+def _format_range(start: int, length: int) -> str:
+    # Unified diff ranges are 1-based; an empty range names the line before it.
+    beginning = start + 1
+    if length == 1:
+        return str(beginning)
+    if length == 0:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+class TextDiff:
+    """
+    The line differences between two versions of a text.
+
+    Lines are interned to integers so comparisons are cheap, and identical
+    texts are recognized without diffing at all.
+    """
+
+    def __init__(self, old: str, new: str):
+        """
+        Initializes the TextDiff.
+
+        Args:
+            old: The current content.
+            new: The proposed content.
+        """
+        self.old_lines = old.splitlines(keepends=True)
+        self.new_lines = new.splitlines(keepends=True)
+        self.opcodes = [] if old == new else self._opcodes()
+        self.added = sum(
+            j2 - j1 for tag, _, _, j1, j2 in self.opcodes if tag != "equal"
+        )
+        self.removed = sum(
+            i2 - i1 for tag, i1, i2, _, _ in self.opcodes if tag != "equal"
+        )
+
+    @property
+    def changed(self) -> bool:
+        return self.added > 0 or self.removed > 0
+
+    def _opcodes(self) -> list[tuple[str, int, int, int, int]]:
+        ids = {}
+        a = [ids.setdefault(line, len(ids)) for line in self.old_lines]
+        b = [ids.setdefault(line, len(ids)) for line in self.new_lines]
+        opcodes = []
+        i = j = 0
+        for block_i, block_j, size in matching_blocks(a, b):
+            if i < block_i and j < block_j:
+                opcodes.append(("replace", i, block_i, j, block_j))
+            elif i < block_i:
+                opcodes.append(("delete", i, block_i, j, j))
+            elif j < block_j:
+                opcodes.append(("insert", i, i, j, block_j))
+            if size:
+                opcodes.append(
+                    ("equal", block_i, block_i + size, block_j, block_j + size)
+                )
+            i, j = block_i + size, block_j + size
+        return opcodes
+
+    def _hunks(self, context: int):
+        """
+        Groups the opcodes into hunks with `context` unchanged lines around
+        each change, like difflib.SequenceMatcher.get_grouped_opcodes.
+        """
+        codes = list(self.opcodes)
+        if codes[0][0] == "equal":
+            tag, i1, i2, j1, j2 = codes[0]
+            codes[0] = tag, max(i1, i2 - context), i2, max(j1, j2 - context), j2
+        if codes[-1][0] == "equal":
+            tag, i1, i2, j1, j2 = codes[-1]
+            codes[-1] = tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)
+        hunk = []
+        for tag, i1, i2, j1, j2 in codes:
+            # Long unchanged runs end one hunk and start the next.
+            if tag == "equal" and i2 - i1 > 2 * context:
+                hunk.append((tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)))
+                yield hunk
+                hunk = []
+                i1, j1 = max(i1, i2 - context), max(j1, j2 - context)
+            hunk.append((tag, i1, i2, j1, j2))
+        if hunk and not (len(hunk) == 1 and hunk[0][0] == "equal"):
+            yield hunk
+
+    def unified(self, fromfile: str = "", tofile: str = "", context: int = 3):
+        """
+        Yields the diff in unified format, line by line, like
+        difflib.unified_diff.
+
+        Args:
+            fromfile: The name shown for the current content.
+            tofile: The name shown for the proposed content.
+            context: The number of unchanged lines shown around each change.
+        """
+        if not self.changed:
+            return
+        yield f"--- {fromfile}\n"
+        yield f"+++ {tofile}\n"
+        for hunk in self._hunks(context):
+            first, last = hunk[0], hunk[-1]
+            old_range = _format_range(first[1], last[2] - first[1])
+            new_range = _format_range(first[3], last[4] - first[3])
+            yield f"@@ -{old_range} +{new_range} @@\n"
+            for tag, i1, i2, j1, j2 in hunk:
+                if tag == "equal":
+                    for line in self.old_lines[i1:i2]:
+                        yield " " + line
+                    continue
+                for line in self.old_lines[i1:i2]:
+                    yield "-" + line
+                for line in self.new_lines[j1:j2]:
+                    yield "+" + line
+
+    def render(
+        self,
+        fromfile: str = "",
+        tofile: str = "",
+        max_lines: int = MAX_RENDERED_LINES,
+        offset: int = 0,
+    ) -> str:
+        """
+        Renders one page of the unified diff.
+
+        Args:
+            fromfile: The name shown for the current content.
+            tofile: The name shown for the proposed content.
+            max_lines: The most diff lines rendered; -1 renders all of them.
+            offset: The number of diff lines skipped before the page.
+
+        Returns:
+            The page, ending with a note on how much was left out, if anything.
+        """
+        page = []
+        remaining = 0
+        for number, line in enumerate(self.unified(fromfile, tofile)):
+            if number < offset:
+                continue
+            if max_lines > -1 and len(page) >= max_lines:
+                remaining += 1
+                continue
+            page.append(line if line.endswith("\n") else line + "\n")
+        if remaining:
+            page.append(
+                f"... {remaining} more diff lines not shown "
+                f"(+{self.added} -{self.removed} lines in total)\n"
+            )
+        return "".join(page)
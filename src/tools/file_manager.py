@@ -1,49 +1,176 @@
+import asyncio
+import bisect
 import os
-from pathlib import Path
-import difflib
+from collections import deque
+from .diff_engine import TextDiff
+from .gitignore import GitIgnore
 from .human_interaction import HumanInteractionTools
+from .write_transaction import TransactionalWriter
 from rich.console import Console
 from rich.syntax import Syntax
 
+# Characters between remembered seek positions for ranged reads.
+SEEK_CHECKPOINT_INTERVAL = 1 << 20
+# Bytes read at a time when counting lines.
+LINE_COUNT_CHUNK_SIZE = 1 << 20
+
+
+# Directories skipped when listing or searching the workspace.
+IGNORED_DIRS = {"__pycache__", "node_modules", ".git", ".venv", "venv", "dist"}
+
+
+def _entry_size(entry: os.DirEntry) -> int:
+    # A dangling or unreadable symlink is listed with the size of the link.
+    try:
+        return entry.stat().st_size
+    except OSError:
+        pass
+    try:
+        return entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        return 0
+
+
+def _fingerprint(stat: os.stat_result) -> tuple:
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _format_size(size: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
 
 class FileManagerTools:
     """
     A class to manage file operations like reading, writing, and listing directory contents.
     """
 
-    def __init__(self):
-        """Initializes the FileManagerTools."""
-        self.human_interaction = HumanInteractionTools()
+    def __init__(
+        self,
+        human_interaction: HumanInteractionTools | None = None,
+        search_index=None,
+        prefetcher=None,
+        writer: TransactionalWriter | None = None,
+    ):
+        """
+        Initializes the FileManagerTools.
+
+        Args:
+            human_interaction: The tools used to ask for confirmations. Sharing
+                the agent's instance keeps concurrent prompts serialized.
+            search_index: An optional TrigramIndex used to answer searches in
+                files that cannot match without reading them.
+            prefetcher: An optional FilePrefetcher whose speculatively read
+                contents are served before reading from disk.
+            writer: The TransactionalWriter files are written with. Defaults
+                to the one of human_interaction.
+        """
+        self.human_interaction = human_interaction or HumanInteractionTools()
+        self.writer = writer or self.human_interaction.writer
+        self.search_index = search_index
+        self.prefetcher = prefetcher
         self.console = Console()
+        # path -> (fingerprint, [(character offset, text-mode seek cookie)])
+        self._seek_checkpoints = {}
+        # path -> (fingerprint, file info)
+        self._file_info = {}
+        # directory path -> (mtime, [(name, is_dir, size)])
+        self._directory_cache = {}
 
-    def read_file(self, file_path: str, limit: int = -1, offset: int = 0) -> str:
+    async def read_file(self, file_path: str, limit: int = -1, offset: int = 0) -> str:
         """
         Reads the content of a given file path after getting user approval.
 
+        Only the requested range is read: the file is seeked close to `offset`
+        using positions remembered from earlier reads of the same file, so
+        paging through a large file does not re-read it from the start.
+
         Args:
             file_path: The path to the file to read.
+            limit: The maximum number of characters to return, or -1 for all.
+            offset: The number of characters to skip.
 
         Returns:
             The content of the file as a string, or an error message if it fails.
         """
-        if not self.human_interaction.get_user_confirmation(
-            f"Proceed with reading file: '{file_path}'?"
+        if not await self.human_interaction.get_user_confirmation(
+            f"Proceed with reading file: '{file_path}'?", "read", file_path
         ):
             return "INFO: File read operation was cancelled by the user."
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-            if offset > 0:
-                content = content[offset:]
-            if limit > -1:
-                content = content[:limit]
-            return content
+            return await asyncio.to_thread(self._read_range, file_path, limit, offset)
         except FileNotFoundError:
             return f"ERROR: File not found at '{file_path}'."
         except IOError as e:
             return f"ERROR: Could not read file at '{file_path}': {e}"
 
-    def write_file(self, file_path: str, content: str) -> bool:
+    def _read_range(self, file_path: str, limit: int = -1, offset: int = 0) -> str:
+        if limit is None:
+            limit = -1
+        offset = max(offset or 0, 0)
+        if self.prefetcher is not None:
+            content = self.prefetcher.get(file_path)
+            if content is not None:
+                return content[offset : offset + limit if limit > -1 else None]
+        key = os.path.abspath(file_path)
+        with open(file_path, "r", encoding="utf-8") as f:
+            fingerprint = _fingerprint(os.fstat(f.fileno()))
+            cached = self._seek_checkpoints.get(key)
+            if cached is None or cached[0] != fingerprint:
+                cached = (fingerprint, [(0, 0)])
+                self._seek_checkpoints[key] = cached
+            checkpoints = cached[1]
+
+            # UTF-8 has no fixed width, so character offsets are mapped to
+            # positions by decoding forward from the closest checkpoint.
+            index = bisect.bisect_right(checkpoints, (offset, float("inf"))) - 1
+            position, cookie = checkpoints[index]
+            f.seek(cookie)
+            while position < offset:
+                next_checkpoint = (
+                    position // SEEK_CHECKPOINT_INTERVAL + 1
+                ) * SEEK_CHECKPOINT_INTERVAL
+                step = min(next_checkpoint, offset) - position
+                skipped = len(f.read(step))
+                position += skipped
+                if skipped < step:
+                    return ""
+                if position == next_checkpoint and position > checkpoints[-1][0]:
+                    checkpoints.append((position, f.tell()))
+            return f.read(limit) if limit > -1 else f.read()
+
+    def get_file_info(self, file_path: str) -> dict:
+        """
+        Returns the size in bytes and the number of lines of a file. Lines are
+        counted once per file version, without decoding the content.
+
+        Args:
+            file_path: The path to the file.
+
+        Returns:
+            A dictionary with `size_bytes` and `line_count`.
+        """
+        key = os.path.abspath(file_path)
+        fingerprint = _fingerprint(os.stat(file_path))
+        cached = self._file_info.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+
+        line_count = 0
+        last_chunk = b""
+        with open(file_path, "rb") as f:
+            while chunk := f.read(LINE_COUNT_CHUNK_SIZE):
+                line_count += chunk.count(b"\n")
+                last_chunk = chunk
+        if last_chunk and not last_chunk.endswith(b"\n"):
+            line_count += 1
+        info = {"size_bytes": fingerprint[1], "line_count": line_count}
+        self._file_info[key] = (fingerprint, info)
+        return info
+
+    async def write_file(self, file_path: str, content: str) -> bool:
         """
         Writes the given content to a file at the specified path after getting user approval.
         Shows a diff of the changes before asking for confirmation.
@@ -57,44 +184,72 @@ class FileManagerTools:
             True if the write was successful, False otherwise.
         """
         try:
-            original_content = ""
-            if os.path.exists(file_path):
-                with open(file_path, "r", encoding="utf-8") as f:
-                    original_content = f.read()
-
-            diff = list(
-                difflib.unified_diff(
-                    original_content.splitlines(keepends=True),
-                    content.splitlines(keepends=True),
-                    fromfile="original",
-                    tofile="new",
+            try:
+                original_content = await asyncio.to_thread(
+                    self.writer.read_text, file_path
                 )
-            )
+            except FileNotFoundError:
+                original_content = ""
 
-            if not diff:
-                print("No changes to apply.")
+            diff = await asyncio.to_thread(TextDiff, original_content, content)
+            if not diff.changed:
+                self.console.print("No changes to apply.")
                 return True
 
-            print("The following changes are proposed:")
-            syntax = Syntax("".join(diff), "diff", theme="monokai", line_numbers=True)
+            self.console.print("The following changes are proposed:")
+            syntax = Syntax(
+                diff.render("original", "new"),
+                "diff",
+                theme="monokai",
+                line_numbers=True,
+            )
             self.console.print(syntax)
 
-            if not self.human_interaction.get_user_confirmation(
-                f"Apply changes to '{file_path}'?"
+            if not await self.human_interaction.get_user_confirmation(
+                f"Apply changes to '{file_path}'?", "write", file_path
             ):
                 return False
 
-            # Create parent directories if they don't exist
-            parent_dir = Path(file_path).parent
-            os.makedirs(parent_dir, exist_ok=True)
-
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            await asyncio.to_thread(self.writer.write_text, file_path, content)
             return True
         except IOError as e:
-            print(f"Error writing to file '{file_path}': {e}")
+            self.console.print(
+                f"Error writing to file '{file_path}': {e}", markup=False
+            )
             return False
 
+    async def edit_file(self, file_path: str, edit, missing_ok: bool = False) -> str:
+        """
+        Applies an edit to a file, then shows the diff and asks for approval
+        like write_file. The model sends only the edit, not the whole new
+        content.
+
+        Args:
+            file_path: The path to the file to edit.
+            edit: A function from the current content to the new content. It
+                raises ValueError if the edit does not match the file.
+            missing_ok: If True, a missing file is edited as an empty one.
+
+        Returns:
+            A message saying whether the edit was saved, or an error message.
+        """
+        try:
+            content = await asyncio.to_thread(self.writer.read_text, file_path)
+        except FileNotFoundError:
+            if not missing_ok:
+                return f"ERROR: File not found at '{file_path}'."
+            content = ""
+        except IOError as e:
+            return f"ERROR: Could not read file at '{file_path}': {e}"
+        try:
+            new_content = edit(content)
+        except ValueError as e:
+            return f"ERROR: {e}"
+        if new_content == content:
+            return "INFO: The edit does not change the file."
+        success = await self.write_file(file_path, new_content)
+        return "File saved successfully." if success else "Failed to save file."
+
     def list_directory_contents(self, directory_path: str = ".") -> list[str]:
         """
         Lists all non-hidden files and subdirectories within a given directory.
@@ -107,7 +262,6 @@ class FileManagerTools:
         Returns:
             A list of file and directory names, or a list with an error message if it fails.
         """
-        ignored_dirs = {"__pycache__", "node_modules", ".git", ".venv", "venv", "dist"}
         try:
             if not os.path.isdir(directory_path):
                 raise NotADirectoryError(
@@ -116,7 +270,7 @@ class FileManagerTools:
 
             entries = []
             for entry in os.listdir(directory_path):
-                if not entry.startswith(".") and entry not in ignored_dirs:
+                if not entry.startswith(".") and entry not in IGNORED_DIRS:
                     entries.append(entry)
             return sorted(entries)
         except FileNotFoundError:
@@ -126,6 +280,95 @@ class FileManagerTools:
         except Exception as e:
             return [f"ERROR: An unexpected error occurred: {e}"]
 
+    def _scan_directory(self, directory_path: str) -> list[tuple[str, bool, int]]:
+        key = os.path.abspath(directory_path)
+        mtime = os.stat(directory_path).st_mtime_ns
+        cached = self._directory_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        entries = []
+        with os.scandir(directory_path) as it:
+            for entry in it:
+                # scandir reports the type without a stat; only file sizes
+                # need one.
+                is_dir = entry.is_dir()
+                size = 0 if is_dir else _entry_size(entry)
+                entries.append((entry.name, is_dir, size))
+        entries.sort()
+        self._directory_cache[key] = (mtime, entries)
+        return entries
+
+    def list_directory_tree(
+        self, directory_path: str = ".", max_depth: int = 3, max_entries: int = 200
+    ) -> list[str]:
+        """
+        Lists a directory recursively as an indented tree with directory
+        markers and file sizes.
+
+        Skips hidden entries, the same directories as `list_directory_contents`
+        and anything matched by `.gitignore` files. Entries are picked
+        breadth-first, so hitting `max_entries` trims the deepest levels.
+        Each directory listing is cached until the directory's mtime changes,
+        so file sizes may lag behind in-place edits.
+
+        Args:
+            directory_path: The path to the directory to list. Defaults to ".".
+            max_depth: The number of directory levels to descend.
+            max_entries: The maximum number of entries returned.
+
+        Returns:
+            The lines of the tree, or a list with an error message if it fails.
+        """
+        if not os.path.isdir(directory_path):
+            return [f"ERROR: Path '{directory_path}' is not a directory."]
+        max_depth = max(max_depth or 1, 1)
+        max_entries = max(max_entries or 1, 1)
+
+        children = {}
+        count = 0
+        omitted = 0
+        queue = deque([(directory_path, 1, GitIgnore())])
+        try:
+            while queue:
+                path, depth, gitignore = queue.popleft()
+                entries = self._scan_directory(path)
+                if any(name == ".gitignore" for name, _, _ in entries):
+                    gitignore = gitignore.extended(path)
+                children[path] = []
+                for name, is_dir, size in entries:
+                    child_path = os.path.join(path, name)
+                    if name.startswith(".") or (is_dir and name in IGNORED_DIRS):
+                        continue
+                    if gitignore.is_ignored(child_path, is_dir):
+                        continue
+                    if count >= max_entries:
+                        omitted += 1
+                        continue
+                    count += 1
+                    children[path].append((name, is_dir, size))
+                    if is_dir and depth < max_depth:
+                        queue.append((child_path, depth + 1, gitignore))
+        except PermissionError as e:
+            return [f"ERROR: Permission denied while listing '{directory_path}': {e}"]
+        except OSError as e:
+            return [f"ERROR: Could not list '{directory_path}': {e}"]
+
+        lines = []
+
+        def render(path: str, indent: str) -> None:
+            for name, is_dir, size in children.get(path, []):
+                if is_dir:
+                    lines.append(f"{indent}{name}/")
+                    render(os.path.join(path, name), indent + "  ")
+                else:
+                    lines.append(f"{indent}{name} ({_format_size(size)})")
+
+        render(directory_path, "")
+        if omitted:
+            lines.append(f"... {omitted} more entries not shown (max_entries reached)")
+        return lines
+
     def find_content_in_file(self, file_path: str, search_query: str) -> list[str]:
         """
         Reads the content of a file and returns lines containing the search query.
@@ -137,6 +380,9 @@ class FileManagerTools:
         Returns:
             A list of lines containing the query, or a list with an error message.
         """
+        if self.search_index is not None and os.path.isfile(file_path):
+            if not self.search_index.may_contain(file_path, [search_query]):
+                return []
         try:
             with open(file_path, "r", encoding="utf-8") as f:
                 lines = f.readlines()
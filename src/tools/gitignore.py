@@ -0,0 +1,60 @@
+import fnmatch
+import os
+
+
+class GitIgnore:
+    """
+    A minimal `.gitignore` matcher covering comments, negation, directory-only
+    patterns and patterns anchored to the directory of their `.gitignore`.
+    """
+
+    def __init__(self, rules: tuple = ()):
+        # Each rule is (base directory, pattern, negated, directory only, anchored).
+        self.rules = rules
+
+    def extended(self, directory_path: str) -> "GitIgnore":
+        """
+        Returns a matcher with the rules of `directory_path/.gitignore` added,
+        or this matcher if the directory has no `.gitignore`.
+        """
+        try:
+            with open(
+                os.path.join(directory_path, ".gitignore"), "r", encoding="utf-8"
+            ) as f:
+                lines = f.read().splitlines()
+        except (OSError, UnicodeDecodeError):
+            return self
+
+        rules = []
+        for line in lines:
+            line = line.rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negated = line.startswith("!")
+            if negated:
+                line = line[1:]
+            directory_only = line.endswith("/")
+            line = line.rstrip("/")
+            anchored = "/" in line
+            rules.append(
+                (directory_path, line.lstrip("/"), negated, directory_only, anchored)
+            )
+        if not rules:
+            return self
+        return GitIgnore(self.rules + tuple(rules))
+
+    def is_ignored(self, path: str, is_dir: bool) -> bool:
+        """Whether `path` is ignored; the last matching rule wins."""
+        ignored = False
+        name = os.path.basename(path)
+        for base, pattern, negated, directory_only, anchored in self.rules:
+            if directory_only and not is_dir:
+                continue
+            if anchored:
+                relative_path = os.path.relpath(path, base).replace(os.sep, "/")
+                matched = fnmatch.fnmatch(relative_path, pattern)
+            else:
+                matched = fnmatch.fnmatch(name, pattern)
+            if matched:
+                ignored = not negated
+        return ignored
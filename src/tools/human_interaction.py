@@ -1,5 +1,8 @@
-import questionary
-import difflib
+import asyncio
+from rich.console import Console
+from .approval_policy import ApprovalPolicy
+from .diff_engine import TextDiff
+from .write_transaction import TransactionalWriter
 
 
 class HumanInteractionTools:
@@ -7,23 +10,78 @@ class HumanInteractionTools:
     A class for handling human-in-the-loop interactions.
     """
 
-    def __init__(self):
-        """Initializes the HumanInteractionTools."""
-        pass
+    def __init__(
+        self,
+        policy: ApprovalPolicy | None = None,
+        interactive: bool = True,
+        writer: TransactionalWriter | None = None,
+    ):
+        """
+        Initializes the HumanInteractionTools.
 
-    def get_user_confirmation(self, prompt_message: str) -> bool:
+        Args:
+            policy: An optional ApprovalPolicy consulted before asking for a
+                confirmation.
+            interactive: Whether a user is there to answer. If not, requests
+                for text input get no answer and confirmations the policy does
+                not decide are denied.
+            writer: The TransactionalWriter confirmed changes are written
+                with. Sharing the agent's instance lets them join its batches.
+        """
+        self.policy = policy
+        self.interactive = interactive
+        self.writer = writer or TransactionalWriter()
+        self.console = Console()
+        self._prompt_lock = None
+        self._prompt_lock_loop = None
+
+    def _get_prompt_lock(self) -> asyncio.Lock:
+        # Concurrent tool calls may prompt at the same time, so prompts are
+        # serialized. asyncio locks are bound to a loop, hence one per loop.
+        loop = asyncio.get_running_loop()
+        if self._prompt_lock_loop is not loop:
+            self._prompt_lock = asyncio.Lock()
+            self._prompt_lock_loop = loop
+        return self._prompt_lock
+
+    async def get_user_confirmation(
+        self,
+        prompt_message: str,
+        operation: str | None = None,
+        path: str | None = None,
+    ) -> bool:
         """
-        Asks the user for a yes/no confirmation via the CLI.
+        Asks the user for a yes/no confirmation via the CLI, unless the approval
+        policy decides the operation; automatic decisions are logged.
 
         Args:
             prompt_message: The message to display to the user.
+            operation: The operation being confirmed, "read" or "write".
+            path: The path the operation applies to.
 
         Returns:
-            True if the user confirms, False otherwise.
+            True if the user or the policy confirms, False otherwise.
         """
-        return questionary.confirm(prompt_message).ask()
-
-    def get_user_text_input(self, prompt_message: str) -> str:
+        if self.policy is not None and operation is not None and path is not None:
+            approved, reason = self.policy.decide(operation, path)
+            if approved is not None:
+                self.policy.log_decision(operation, path, approved, reason)
+                decision = "Auto-approved" if approved else "Auto-denied"
+                self.console.print(
+                    f"[dim]{decision} {operation} of {path} ({reason}).[/dim]"
+                )
+                return approved
+        if not self.interactive:
+            if self.policy is not None and operation is not None and path is not None:
+                self.policy.log_decision(operation, path, False, "no user to ask")
+            return False
+        async with self._get_prompt_lock():
+            # prompt_toolkit is slow to import and unused by unattended runs.
+            import questionary
+
+            return await questionary.confirm(prompt_message).ask_async()
+
+    async def get_user_text_input(self, prompt_message: str) -> str:
         """
         Gets free-form text input from the user via the CLI.
 
@@ -33,9 +91,16 @@ class HumanInteractionTools:
         Returns:
             The text input from the user.
         """
-        return questionary.text(prompt_message).ask()
+        if not self.interactive:
+            return "INFO: No user is available; continue without user input."
+        async with self._get_prompt_lock():
+            import questionary
+
+            return await questionary.text(prompt_message).ask_async()
 
-    def review_and_confirm_changes(self, file_path: str, new_content: str) -> bool:
+    async def review_and_confirm_changes(
+        self, file_path: str, new_content: str
+    ) -> bool:
         """
         Displays a diff of proposed changes and asks for user confirmation to apply them.
 
@@ -47,29 +112,27 @@ class HumanInteractionTools:
             True if the user confirms and the changes are applied, False otherwise.
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                existing_content = f.read()
+            existing_content = await asyncio.to_thread(self.writer.read_text, file_path)
         except FileNotFoundError:
             existing_content = ""
 
-        diff = difflib.unified_diff(
-            existing_content.splitlines(keepends=True),
-            new_content.splitlines(keepends=True),
-            fromfile=f"Original: {file_path}",
-            tofile=f"Proposed: {file_path}",
+        diff = await asyncio.to_thread(TextDiff, existing_content, new_content)
+        self.console.print("\nProposed changes:\n")
+        self.console.print(
+            diff.render(f"Original: {file_path}", f"Proposed: {file_path}"),
+            end="",
+            markup=False,
+            highlight=False,
         )
 
-        print("\nProposed changes:\n")
-        for line in diff:
-            print(line, end="")
-
-        if self.get_user_confirmation("\nApply these changes?"):
+        if await self.get_user_confirmation(
+            "\nApply these changes?", "write", file_path
+        ):
             try:
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(new_content)
+                await asyncio.to_thread(self.writer.write_text, file_path, new_content)
                 return True
             except IOError as e:
-                print(f"Error writing to file: {e}")
+                self.console.print(f"Error writing to file: {e}", markup=False)
                 return False
         return False
 
@@ -83,11 +146,11 @@ class HumanInteractionTools:
             message: The feedback message.
         """
         log_message = f"[{feedback_type.upper()}] Task {task_id}: {message}"
-        print(log_message)
+        self.console.print(log_message, markup=False)
         with open("data/feedback.log", "a", encoding="utf-8") as f:
             f.write(log_message + "\n")
 
-    def request_human_intervention(self, reason: str) -> str:
+    async def request_human_intervention(self, reason: str) -> str:
         """
         Pauses the agent and prompts the user for new instructions.
 
@@ -97,7 +160,7 @@ class HumanInteractionTools:
         Returns:
             The user's input.
         """
-        print(f"\nAgent paused: {reason}")
-        return self.get_user_text_input(
+        self.console.print(f"\nAgent paused: {reason}", markup=False)
+        return await self.get_user_text_input(
             "Please provide new instructions or type 'continue':"
         )
@@ -0,0 +1,206 @@
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+# File names read first when a directory is listed.
+LIKELY_NAMES = {
+    "readme",
+    "readme.md",
+    "readme.rst",
+    "readme.txt",
+    "main.py",
+    "__main__.py",
+    "app.py",
+    "cli.py",
+    "setup.py",
+    "pyproject.toml",
+    "package.json",
+    "index.js",
+    "index.ts",
+    "cargo.toml",
+    "go.mod",
+}
+
+_SEARCH_RESULT = re.compile(r"^(.+?):(\d+): ")
+_QUERY_TERM = re.compile(r"[A-Za-z0-9_]{3,}")
+
+
+def _fingerprint(stat: os.stat_result) -> tuple:
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+class FilePrefetcher:
+    """
+    Speculatively reads small files the agent is likely to read next, on a
+    background thread while the next Orchestrate call is in flight.
+
+    Candidates come from the last step: files in a listed directory whose
+    names are common entry points or mention a query term, and files with
+    search matches. Contents are kept in a bounded LRU cache and are only
+    served while the file is unchanged.
+    """
+
+    def __init__(
+        self,
+        max_file_bytes: int = 64 * 1024,
+        budget_bytes: int = 2 * 1024 * 1024,
+        max_files_per_step: int = 4,
+    ):
+        """
+        Initializes the FilePrefetcher.
+
+        Args:
+            max_file_bytes: Files larger than this are never prefetched.
+            budget_bytes: The total size of prefetched contents kept in memory.
+            max_files_per_step: The most files prefetched after one step.
+        """
+        self.max_file_bytes = max_file_bytes
+        self.budget_bytes = budget_bytes
+        self.max_files_per_step = max_files_per_step
+        self.query_terms = set()
+        # path -> (fingerprint, content), least recently used first.
+        self._contents = OrderedDict()
+        self._pending = {}
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+        self._executor = None
+        self.prefetched = 0
+        self.hits = 0
+        self.misses = 0
+
+    def set_query(self, query: str) -> None:
+        self.query_terms = {term.lower() for term in _QUERY_TERM.findall(query)}
+
+    def _score(self, path: str) -> int:
+        name = os.path.basename(path).lower()
+        score = 2 if name in LIKELY_NAMES else 0
+        stem = os.path.splitext(name)[0]
+        score += sum(2 for term in self.query_terms if term in stem)
+        return score
+
+    def candidates(self, entries) -> list[str]:
+        """
+        Picks the files worth prefetching after a step.
+
+        Args:
+            entries: The history entries recorded for the step.
+
+        Returns:
+            Paths of small files, most likely first.
+        """
+        scores = {}
+        for entry in entries:
+            if entry.tool == "list_directory_contents":
+                directory_path = entry.args.get("directory_path") or "."
+                for name in entry.result.splitlines():
+                    path = os.path.join(directory_path, name)
+                    scores[path] = max(scores.get(path, 0), self._score(path))
+            elif entry.tool == "search_workspace":
+                for line in entry.result.splitlines():
+                    match = _SEARCH_RESULT.match(line)
+                    if match:
+                        path = match.group(1)
+                        scores[path] = scores.get(path, self._score(path)) + 1
+
+        ranked = sorted(
+            (path for path, score in scores.items() if score > 0),
+            key=lambda path: -scores[path],
+        )
+        selected = []
+        for path in ranked:
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                continue
+            if os.path.isfile(path) and 0 < size <= self.max_file_bytes:
+                selected.append(path)
+                if len(selected) == self.max_files_per_step:
+                    break
+        return selected
+
+    def prefetch(self, entries) -> None:
+        """
+        Starts reading the candidates of a step in the background.
+
+        Args:
+            entries: The history entries recorded for the step.
+        """
+        for path in self.candidates(entries):
+            key = os.path.abspath(path)
+            with self._lock:
+                if key in self._contents or key in self._pending:
+                    continue
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=2, thread_name_prefix="prefetch"
+                    )
+                self._pending[key] = self._executor.submit(self._load, key)
+
+    def _load(self, key: str) -> None:
+        try:
+            with open(key, "r", encoding="utf-8") as f:
+                fingerprint = _fingerprint(os.fstat(f.fileno()))
+                content = f.read()
+        except (OSError, UnicodeDecodeError):
+            content = None
+
+        with self._lock:
+            self._pending.pop(key, None)
+            if content is None:
+                return
+            self._contents[key] = (fingerprint, content)
+            self._cached_bytes += len(content)
+            self.prefetched += 1
+            while self._cached_bytes > self.budget_bytes and self._contents:
+                _, (_, evicted) = self._contents.popitem(last=False)
+                self._cached_bytes -= len(evicted)
+
+    def get(self, file_path: str) -> str | None:
+        """
+        Returns the prefetched content of a file, waiting for a read already in
+        progress, or None if it was not prefetched or changed since.
+
+        Args:
+            file_path: The path to the file.
+        """
+        key = os.path.abspath(file_path)
+        with self._lock:
+            pending: Future | None = self._pending.get(key)
+        if pending is not None:
+            wait([pending])
+
+        with self._lock:
+            cached = self._contents.get(key)
+            if cached is not None:
+                try:
+                    current = _fingerprint(os.stat(key))
+                except OSError:
+                    current = None
+                if current == cached[0]:
+                    self._contents.move_to_end(key)
+                    self.hits += 1
+                    return cached[1]
+                del self._contents[key]
+                self._cached_bytes -= len(cached[1])
+            self.misses += 1
+        return None
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "prefetched": self.prefetched,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "cached_bytes": self._cached_bytes,
+        }
+
+    def close(self) -> None:
+        """Stops background reads that have not started yet."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        with self._lock:
+            self._pending.clear()
@@ -0,0 +1,133 @@
+import importlib
+
+
+class ToolSpec:
+    """
+    Declares how the agent runs one tool: its handler and the properties the
+    scheduler relies on to parallelize, cache, offload and page its calls.
+    """
+
+    __slots__ = (
+        "name",
+        "handler",
+        "read_only",
+        "parallel_safe",
+        "cacheable",
+        "blocking",
+        "large_output",
+        "paged",
+        "writes",
+        "final",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        handler,
+        read_only=False,
+        parallel_safe=None,
+        cacheable: bool = False,
+        blocking: bool = False,
+        large_output: bool = False,
+        paged: bool = False,
+        writes: str | None = None,
+        final: bool = False,
+    ):
+        """
+        Initializes the ToolSpec.
+
+        Args:
+            name: The tool_name of the BAML tool class.
+            handler: Called with the tool call; returns the result, or the
+                result and a hint for the model.
+            read_only: Whether calls have no side effects, or a function of
+                the call deciding it. Read-only calls may start while a
+                streamed response is still arriving.
+            parallel_safe: Whether calls may run concurrently with other such
+                calls, or a function of the call deciding it. Defaults to
+                read_only.
+            cacheable: Whether results are cached by arguments for the session.
+            blocking: Whether the handler is synchronous; it then runs on a
+                worker thread.
+            large_output: Whether results can be large. Large results are kept
+                in the blob store with only a preview in the history.
+            paged: Whether calls take limit and offset; a result that fills
+                the limit gets a hint to page on.
+            writes: The argument holding a path the call writes; cached results
+                for that path are dropped after it runs.
+            final: Whether the call ends the run, its result being the answer.
+        """
+        self.name = name
+        self.handler = handler
+        self.read_only = read_only
+        self.parallel_safe = read_only if parallel_safe is None else parallel_safe
+        self.cacheable = cacheable
+        self.blocking = blocking
+        self.large_output = large_output
+        self.paged = paged
+        self.writes = writes
+        self.final = final
+
+    def is_read_only(self, tool_call) -> bool:
+        if callable(self.read_only):
+            return self.read_only(tool_call)
+        return self.read_only
+
+    def is_parallel_safe(self, tool_call) -> bool:
+        if callable(self.parallel_safe):
+            return self.parallel_safe(tool_call)
+        return self.parallel_safe
+
+
+class ToolRegistry:
+    """
+    The tools the agent can call, keyed by tool_name, and the providers that
+    implement them.
+
+    Providers are created on first use. A provider's module, and everything
+    it imports, is only loaded when a tool call first needs it, so sessions
+    that never fetch a web page never import the browser stack.
+    """
+
+    def __init__(self):
+        """Initializes the ToolRegistry."""
+        self._specs = {}
+        self._factories = {}
+        self._instances = {}
+
+    def add(self, spec: ToolSpec) -> None:
+        """Registers a tool under its tool_name."""
+        self._specs[spec.name] = spec
+
+    def spec(self, tool_call) -> ToolSpec | None:
+        """Returns the spec of the tool a call is for, or None if it is unknown."""
+        return self._specs.get(getattr(tool_call, "tool_name", None))
+
+    def register_provider(
+        self, name: str, module: str, class_name: str, *args, **kwargs
+    ):
+        """
+        Registers a provider without importing it.
+
+        Args:
+            name: The name the provider is looked up by.
+            module: The dotted path of the module defining the provider.
+            class_name: The provider class in that module.
+            *args: Positional arguments for the provider's constructor.
+            **kwargs: Keyword arguments for the provider's constructor.
+        """
+        self._factories[name] = (module, class_name, args, kwargs)
+
+    def provider(self, name: str):
+        """Returns the provider, importing and creating it on first use."""
+        instance = self._instances.get(name)
+        if instance is None:
+            module, class_name, args, kwargs = self._factories[name]
+            provider = getattr(importlib.import_module(module), class_name)
+            instance = provider(*args, **kwargs)
+            self._instances[name] = instance
+        return instance
+
+    def loaded_providers(self) -> list:
+        """Returns the providers created so far."""
+        return list(self._instances.values())
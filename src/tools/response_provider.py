@@ -1,4 +1,5 @@
 from rich.console import Console
+from rich.live import Live
 from rich.markdown import Markdown
 from rich.panel import Panel
 
@@ -11,6 +12,15 @@ class ResponseProviderTools:
     def __init__(self):
         """Initializes the ResponseProviderTools."""
         self.console = Console()
+        self._live = None
+
+    def _answer_panel(self, answer: str) -> Panel:
+        return Panel(
+            Markdown(answer),
+            title="[bold green]Final Answer[/bold green]",
+            border_style="green",
+            expand=False,
+        )
 
     def final_answer(self, answer: str) -> str:
         """
@@ -22,12 +32,34 @@ class ResponseProviderTools:
         Returns:
             The final answer.
         """
-        self.console.print(
-            Panel(
-                Markdown(answer),
-                title="[bold green]Final Answer[/bold green]",
-                border_style="green",
-                expand=False,
-            )
-        )
+        self.console.print(self._answer_panel(answer))
         return answer
+
+    def start_final_answer_stream(self) -> None:
+        """
+        Opens a live panel that renders the final answer as it is streamed.
+        """
+        self._live = Live(
+            self._answer_panel(""),
+            console=self.console,
+            refresh_per_second=12,
+        )
+        self._live.start()
+
+    def update_final_answer_stream(self, partial_answer: str) -> None:
+        """
+        Re-renders the live panel with the answer received so far.
+
+        Args:
+            partial_answer: The partial final answer streamed by the model.
+        """
+        if self._live is not None:
+            self._live.update(self._answer_panel(partial_answer))
+
+    def end_final_answer_stream(self) -> None:
+        """
+        Stops the live panel, leaving the last rendered answer on screen.
+        """
+        if self._live is not None:
+            self._live.stop()
+            self._live = None
@@ -0,0 +1,300 @@
+import fnmatch
+import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
+from .file_manager import IGNORED_DIRS
+
+# Bytes inspected to decide whether a file is binary.
+BINARY_SNIFF_SIZE = 8192
+# Files larger than this are skipped by the search.
+MAX_SEARCH_FILE_SIZE = 10 * 1024 * 1024
+# Characters that end a run of literal text in a regular expression.
+_REGEX_SPECIAL = set(".^$*+?{}[]()|\\")
+# Escapes that stand for a class or an assertion rather than a character.
+_CLASS_ESCAPES = set("dDwWsSbBAZ")
+
+
+def _matches_any(relative_path: str, patterns: list[str]) -> bool:
+    name = os.path.basename(relative_path)
+    return any(
+        fnmatch.fnmatch(relative_path, pattern) or fnmatch.fnmatch(name, pattern)
+        for pattern in patterns
+    )
+
+
+def iter_workspace_files(
+    directory_path: str = ".",
+    include: Optional[list[str]] = None,
+    exclude: Optional[list[str]] = None,
+) -> Iterator[str]:
+    """
+    Yields the paths of all non-hidden files under a directory, skipping the
+    same directories as `FileManagerTools.list_directory_contents`.
+
+    Args:
+        directory_path: The directory to walk.
+        include: Glob patterns a file must match (by name or relative path).
+        exclude: Glob patterns of files or directories to skip.
+    """
+    include = include or []
+    exclude = exclude or []
+    for root, dirs, files in os.walk(directory_path):
+        relative_root = os.path.relpath(root, directory_path)
+        if relative_root == ".":
+            relative_root = ""
+        dirs[:] = sorted(
+            d
+            for d in dirs
+            if not d.startswith(".")
+            and d not in IGNORED_DIRS
+            and not _matches_any(os.path.join(relative_root, d), exclude)
+        )
+        for name in sorted(files):
+            if name.startswith("."):
+                continue
+            relative_path = os.path.join(relative_root, name)
+            if include and not _matches_any(relative_path, include):
+                continue
+            if _matches_any(relative_path, exclude):
+                continue
+            yield os.path.join(root, name)
+
+
+def required_literals(query: str, is_regex: bool) -> list[str]:
+    """
+    Returns substrings that every match of the query must contain.
+
+    Regular expressions are read conservatively: only literal text outside
+    groups and character classes counts, and alternations yield nothing.
+    """
+    if not is_regex:
+        return [query]
+
+    literals = []
+    run = []
+    depth = 0
+    i = 0
+    while i < len(query):
+        char = query[i]
+        if char == "\\" and i + 1 < len(query):
+            escaped = query[i + 1]
+            i += 2
+            if escaped in _CLASS_ESCAPES:
+                literals.append("".join(run))
+                run = []
+            elif escaped.isalnum():
+                # Character codes such as \x41, \u00e9, \N{...} or octal, and
+                # backreferences; not worth decoding, so nothing is required.
+                return []
+            elif depth == 0:
+                run.append(escaped)
+            continue
+        if char == "|":
+            return []
+        if char not in _REGEX_SPECIAL:
+            if depth == 0:
+                run.append(char)
+            i += 1
+            continue
+
+        if char in "*?{" and run:
+            # The previous character is optional or repeated a variable number
+            # of times.
+            run.pop()
+        literals.append("".join(run))
+        run = []
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth = max(depth - 1, 0)
+        elif char == "[":
+            # Skip the whole character class.
+            i = query.find("]", i + 2)
+            if i == -1:
+                return []
+        elif char == "{":
+            i = query.find("}", i)
+            if i == -1:
+                return []
+        i += 1
+    literals.append("".join(run))
+    return [literal for literal in literals if len(literal) >= 3]
+
+
+def compile_query(query: str, is_regex: bool, case_sensitive: bool) -> re.Pattern:
+    """Compiles a search query into a pattern for literal or regex mode."""
+    flags = 0 if case_sensitive else re.IGNORECASE
+    return re.compile(query if is_regex else re.escape(query), flags | re.MULTILINE)
+
+
+def search_file(
+    file_path: str,
+    pattern: re.Pattern,
+    context_lines: int = 0,
+    max_results: int = 20,
+) -> list[str]:
+    """
+    Searches one file, returning grep-style `path:line: text` matches and
+    `path-line- text` context lines. Hunks are separated by `--`.
+    Binary, unreadable and very large files yield no results.
+    """
+    try:
+        if os.path.getsize(file_path) > MAX_SEARCH_FILE_SIZE:
+            return []
+        with open(file_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return []
+    if b"\0" in data[:BINARY_SNIFF_SIZE]:
+        return []
+    text = data.decode("utf-8", errors="replace")
+    # One pass over the whole file rules out most files cheaply.
+    if pattern.search(text) is None:
+        return []
+
+    lines = text.splitlines()
+    matched = []
+    for number, line in enumerate(lines):
+        if pattern.search(line):
+            matched.append(number)
+            if len(matched) >= max_results:
+                break
+
+    matched_set = set(matched)
+    results = []
+    last_shown = -1
+    for number in matched:
+        start = max(number - context_lines, last_shown + 1)
+        if results and start > last_shown + 1:
+            results.append("--")
+        for shown in range(start, min(number + context_lines, len(lines) - 1) + 1):
+            if shown <= last_shown:
+                continue
+            separator = ":" if shown in matched_set else "-"
+            results.append(
+                f"{file_path}{separator}{shown + 1}{separator} {lines[shown]}"
+            )
+            last_shown = shown
+    return results
+
+
+class WorkspaceSearchTools:
+    """
+    A class for searching the content of every file in a workspace.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, index=None):
+        """
+        Initializes the WorkspaceSearchTools.
+
+        Args:
+            max_workers: The number of threads files are read and searched
+                with. Threads overlap file reads; regex matching holds the
+                GIL, so CPU-bound searches do not scale with them.
+            index: An optional TrigramIndex used to skip files that cannot
+                match before reading them.
+        """
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.index = index
+
+    def search_workspace(
+        self,
+        query: str,
+        directory_path: str = ".",
+        is_regex: bool = False,
+        case_sensitive: bool = False,
+        include: Optional[list[str]] = None,
+        exclude: Optional[list[str]] = None,
+        context_lines: int = 0,
+        max_results_per_file: int = 20,
+        max_total_results: int = 500,
+    ) -> list[str]:
+        """
+        Searches all files under a directory for a literal string or regex.
+
+        Args:
+            query: The text or regular expression to search for.
+            directory_path: The directory to search. Defaults to ".".
+            is_regex: If true, `query` is a regular expression.
+            case_sensitive: If true, matching is case-sensitive.
+            include: Glob patterns of files to search; empty searches all files.
+            exclude: Glob patterns of files or directories to skip.
+            context_lines: The number of lines shown around each match.
+            max_results_per_file: The maximum number of matches per file.
+            max_total_results: The maximum number of output lines overall.
+
+        Returns:
+            A list of `path:line: text` results, or a list with an error message.
+        """
+        if not os.path.isdir(directory_path):
+            return [f"ERROR: Path '{directory_path}' is not a directory."]
+        try:
+            pattern = compile_query(query, is_regex, case_sensitive)
+        except re.error as e:
+            return [f"ERROR: Invalid regular expression '{query}': {e}"]
+
+        files = iter_workspace_files(directory_path, include, exclude)
+        if self.index is not None:
+            files = self.index.filter_files(files, required_literals(query, is_regex))
+        return self._search_files(
+            files,
+            pattern,
+            max(context_lines or 0, 0),
+            max_results_per_file or 20,
+            max_total_results,
+        )
+
+    def _search_files(
+        self,
+        files,
+        pattern: re.Pattern,
+        context_lines: int,
+        max_results_per_file: int,
+        max_total_results: int,
+    ) -> list[str]:
+        files = iter(files)
+        # Only a few files per worker are in flight, so hitting the result
+        # limit stops the walk and the reads instead of just the output.
+        window = self.max_workers * 2
+        pending = deque()
+        results = []
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for path in files:
+                pending.append(
+                    executor.submit(
+                        search_file, path, pattern, context_lines, max_results_per_file
+                    )
+                )
+                if len(pending) < window:
+                    continue
+                if self._collect(
+                    pending.popleft().result(), results, max_total_results
+                ):
+                    return results
+            while pending:
+                if self._collect(
+                    pending.popleft().result(), results, max_total_results
+                ):
+                    return results
+        finally:
+            executor.shutdown(cancel_futures=True)
+        return results
+
+    @staticmethod
+    def _collect(file_result: list[str], results: list[str], limit: int) -> bool:
+        """Appends one file's matches; returns True once the limit is reached."""
+        if not file_result:
+            return False
+        if results:
+            results.append("--")
+        results.extend(file_result)
+        if len(results) < limit:
+            return False
+        del results[limit:]
+        results.append(
+            "INFO: Result limit reached; narrow the query or the include patterns."
+        )
+        return True
@@ -0,0 +1,209 @@
+import re
+
+# The header of a unified diff hunk: @@ -start[,length] +start[,length] @@
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@")
+# A line with its newline, or the last line of a file that does not end in one.
+# Only "\n" ends a line, as when line numbers are counted for the model.
+_LINE = re.compile(r"[^\n]*\n|[^\n]+\Z")
+
+
+def replace_text(
+    content: str, old_text: str, new_text: str, replace_all: bool = False
+) -> str:
+    """
+    Replaces exact occurrences of a text.
+
+    Args:
+        content: The current content of the file.
+        old_text: The text to replace, matched exactly.
+        new_text: The replacement text.
+        replace_all: If True, every occurrence is replaced; otherwise the text
+            must occur exactly once.
+
+    Returns:
+        The new content.
+
+    Raises:
+        ValueError: If old_text is empty, missing, or ambiguous.
+    """
+    if not old_text:
+        raise ValueError("old_text is empty; use ReplaceLines to insert text.")
+    count = content.count(old_text)
+    if count == 0:
+        raise ValueError(
+            "old_text was not found. It must match the file exactly, including "
+            "whitespace and indentation; read the file again and copy the text."
+        )
+    if count > 1 and not replace_all:
+        raise ValueError(
+            f"old_text occurs {count} times. Include more surrounding lines to "
+            "make it unique, or set replace_all to replace every occurrence."
+        )
+    return content.replace(old_text, new_text)
+
+
+def replace_lines(
+    content: str,
+    start_line: int,
+    end_line: int,
+    new_text: str,
+    expected_text: str | None = None,
+) -> str:
+    """
+    Replaces a range of lines.
+
+    Args:
+        content: The current content of the file.
+        start_line: The first line replaced, counting from 1.
+        end_line: The last line replaced, inclusive. start_line - 1 inserts
+            before start_line without replacing anything.
+        new_text: The text the lines are replaced with.
+        expected_text: If given, the current text of the range; the edit is
+            rejected unless it matches exactly.
+
+    Returns:
+        The new content.
+
+    Raises:
+        ValueError: If the range is invalid or does not hold expected_text.
+    """
+    lines = _LINE.findall(content)
+    if not 1 <= start_line <= len(lines) + 1:
+        raise ValueError(
+            f"start_line {start_line} is outside the file, which has {len(lines)} lines."
+        )
+    if not start_line - 1 <= end_line <= len(lines):
+        raise ValueError(
+            f"end_line {end_line} must be between start_line - 1 ({start_line - 1}) "
+            f"and the last line ({len(lines)})."
+        )
+    current = "".join(lines[start_line - 1 : end_line])
+    if expected_text is not None and expected_text not in (
+        current,
+        current.removesuffix("\n"),
+    ):
+        raise ValueError(
+            f"Lines {start_line}-{end_line} do not match expected_text; the file "
+            f"has changed. They currently are:\n{current}"
+        )
+    # Lines after the range, or the file's final newline, are kept intact.
+    if new_text and not new_text.endswith("\n"):
+        if end_line < len(lines) or content.endswith("\n"):
+            new_text += "\n"
+    return "".join(lines[: start_line - 1]) + new_text + "".join(lines[end_line:])
+
+
+def _parse_patch(patch: str) -> list[dict]:
+    patch_lines = patch.splitlines()
+    file_headers = sum(
+        1
+        for line, next_line in zip(patch_lines, patch_lines[1:])
+        if line.startswith("--- ") and next_line.startswith("+++ ")
+    )
+    if file_headers > 1:
+        raise ValueError(
+            "The patch changes more than one file; use one ApplyPatch call per file."
+        )
+
+    hunks = []
+    hunk = None
+    last_kind = None
+    for line in patch_lines:
+        match = _HUNK_HEADER.match(line)
+        if match:
+            hunk = {
+                "start": int(match.group(1)),
+                "old": [],
+                "new": [],
+                "new_no_newline": False,
+            }
+            hunks.append(hunk)
+            last_kind = None
+            continue
+        if hunk is None:
+            # File headers such as ---, +++, diff and index lines.
+            continue
+        kind, text = (line[0], line[1:]) if line else (" ", "")
+        if kind == " ":
+            hunk["old"].append(text)
+            hunk["new"].append(text)
+        elif kind == "-":
+            hunk["old"].append(text)
+        elif kind == "+":
+            hunk["new"].append(text)
+        elif kind == "\\":
+            # "\ No newline at end of file" applies to the line before it.
+            if last_kind in (" ", "+"):
+                hunk["new_no_newline"] = True
+            continue
+        else:
+            raise ValueError(f"Invalid patch line: {line!r}")
+        last_kind = kind
+    if not hunks:
+        raise ValueError("The patch has no hunks; each starts with an @@ header.")
+    return hunks
+
+
+def apply_patch(content: str, patch: str) -> str:
+    """
+    Applies a unified diff of one file.
+
+    Context and removed lines must match the file exactly. Hunks are matched
+    at the line numbers in their headers, or at the nearest place after the
+    previous hunk where they match, since line numbers are easy to get wrong.
+
+    Args:
+        content: The current content of the file.
+        patch: The unified diff.
+
+    Returns:
+        The new content.
+
+    Raises:
+        ValueError: If the patch is malformed or a hunk does not match.
+    """
+    lines = content.split("\n")
+    trailing_newline = content.endswith("\n") or not content
+    if trailing_newline:
+        lines.pop()
+    replacements = []
+    position = 0
+    for number, hunk in enumerate(_parse_patch(patch), start=1):
+        old, new = hunk["old"], hunk["new"]
+        if not old:
+            # A pure insertion after line `start`.
+            index = hunk["start"]
+            if not position <= index <= len(lines):
+                raise ValueError(
+                    f"Hunk {number} inserts after line {index}, outside the file "
+                    f"or before an earlier hunk."
+                )
+        else:
+            expected = max(hunk["start"] - 1, 0)
+            matches = [
+                i
+                for i in range(position, len(lines) - len(old) + 1)
+                if lines[i] == old[0] and lines[i : i + len(old)] == old
+            ]
+            if not matches:
+                raise ValueError(
+                    f"Hunk {number} does not match the file near line {expected + 1}. "
+                    "Context and removed lines must match exactly; read the file "
+                    "again and regenerate the patch."
+                )
+            index = min(matches, key=lambda i: abs(i - expected))
+        replacements.append((index, len(old), new))
+        position = index + len(old)
+        if position == len(lines) and (old or hunk["new_no_newline"]):
+            trailing_newline = not hunk["new_no_newline"]
+
+    result = []
+    previous_end = 0
+    for index, length, new in replacements:
+        result.extend(lines[previous_end:index])
+        result.extend(new)
+        previous_end = index + length
+    result.extend(lines[previous_end:])
+    if not result:
+        return ""
+    return "\n".join(result) + ("\n" if trailing_newline else "")
@@ -0,0 +1,273 @@
+import os
+import sqlite3
+from contextlib import closing
+from typing import Iterable, Iterator, Optional
+
+DEFAULT_INDEX_PATH = "data/search_index.sqlite3"
+# Trigrams looked up per query; stays below SQLite's limit on the number of
+# parameters in one statement.
+MAX_TRIGRAMS_PER_QUERY = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    trigram INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    PRIMARY KEY (trigram, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_by_file ON postings (file_id);
+"""
+
+
+def _trigrams(data: bytes) -> set[int]:
+    """Returns the case-folded byte trigrams of `data`, packed into integers."""
+    data = data.lower()
+    return {
+        data[i] << 16 | data[i + 1] << 8 | data[i + 2] for i in range(len(data) - 2)
+    }
+
+
+def _literal_trigrams(literal: str) -> set[int]:
+    # bytes.lower() only folds ASCII, so trigrams with other bytes could miss
+    # case-insensitive matches and are left out of the query.
+    return {
+        trigram
+        for trigram in _trigrams(literal.encode("utf-8"))
+        if trigram & 0x808080 == 0
+    }
+
+
+class TrigramIndex:
+    """
+    A persistent trigram index of the files in a workspace, stored in SQLite.
+
+    Files are re-indexed only when their mtime or size changes. Queries use
+    the index to rule out files that cannot match; files that changed since
+    the last update are never ruled out.
+    """
+
+    def __init__(self, index_path: str = DEFAULT_INDEX_PATH):
+        """
+        Initializes the TrigramIndex.
+
+        Args:
+            index_path: The path of the SQLite database holding the index.
+        """
+        self.index_path = index_path
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.index_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        # Searches run on worker threads, so each call opens its own connection.
+        connection = sqlite3.connect(self.index_path)
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def _root(self, connection: sqlite3.Connection) -> Optional[str]:
+        row = connection.execute("SELECT value FROM meta WHERE key = 'root'").fetchone()
+        return row[0] if row else None
+
+    def update(self, directory_path: str = ".") -> dict:
+        """
+        Indexes new and changed files under a directory and drops deleted ones.
+
+        Args:
+            directory_path: The root of the workspace to index.
+
+        Returns:
+            Counts of `added`, `updated`, `removed` and `unchanged` files.
+        """
+        # Imported here so loading the index does not load the search tool.
+        from .search_tool import iter_workspace_files
+
+        os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+        root = os.path.abspath(directory_path)
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        with closing(self._connect()) as connection, connection:
+            if self._root(connection) != root:
+                connection.execute("DELETE FROM postings")
+                connection.execute("DELETE FROM files")
+                connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('root', ?)",
+                    (root,),
+                )
+            known = {
+                path: (file_id, mtime_ns, size)
+                for file_id, path, mtime_ns, size in connection.execute(
+                    "SELECT id, path, mtime_ns, size FROM files"
+                )
+            }
+
+            for file_path in iter_workspace_files(root):
+                relative_path = os.path.relpath(file_path, root)
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+                entry = known.pop(relative_path, None)
+                if entry is not None and entry[1:] == (stat.st_mtime_ns, stat.st_size):
+                    stats["unchanged"] += 1
+                    continue
+
+                if entry is None:
+                    file_id = connection.execute(
+                        "INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                        (relative_path, stat.st_mtime_ns, stat.st_size),
+                    ).lastrowid
+                    stats["added"] += 1
+                else:
+                    file_id = entry[0]
+                    connection.execute(
+                        "UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?",
+                        (stat.st_mtime_ns, stat.st_size, file_id),
+                    )
+                    connection.execute(
+                        "DELETE FROM postings WHERE file_id = ?", (file_id,)
+                    )
+                    stats["updated"] += 1
+                connection.executemany(
+                    "INSERT INTO postings (trigram, file_id) VALUES (?, ?)",
+                    ((trigram, file_id) for trigram in self._file_trigrams(file_path)),
+                )
+
+            for file_id, _, _ in known.values():
+                connection.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+                connection.execute("DELETE FROM files WHERE id = ?", (file_id,))
+                stats["removed"] += 1
+        return stats
+
+    def _file_trigrams(self, file_path: str) -> set[int]:
+        from .search_tool import BINARY_SNIFF_SIZE, MAX_SEARCH_FILE_SIZE
+
+        # Files the search skips anyway are recorded without postings, so
+        # they are never candidates.
+        try:
+            if os.path.getsize(file_path) > MAX_SEARCH_FILE_SIZE:
+                return set()
+            with open(file_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return set()
+        if b"\0" in data[:BINARY_SNIFF_SIZE]:
+            return set()
+        return _trigrams(data)
+
+    def _query_trigrams(self, literals: list[str]) -> list[int]:
+        trigrams = set()
+        for literal in literals:
+            trigrams |= _literal_trigrams(literal)
+        return sorted(trigrams)
+
+    def _candidates(
+        self,
+        connection: sqlite3.Connection,
+        trigrams: list[int],
+        file_id: Optional[int] = None,
+    ) -> set[int]:
+        """
+        Returns the ids of the indexed files that have every trigram, or only
+        checks `file_id` if given.
+        """
+        candidates = None
+        # Long queries are looked up in chunks; a candidate has every trigram
+        # of every chunk.
+        for start in range(0, len(trigrams), MAX_TRIGRAMS_PER_QUERY):
+            chunk = trigrams[start : start + MAX_TRIGRAMS_PER_QUERY]
+            query = (
+                f"SELECT file_id FROM postings WHERE trigram IN "
+                f"({','.join('?' * len(chunk))})"
+            )
+            parameters = list(chunk)
+            if file_id is not None:
+                query += " AND file_id = ?"
+                parameters.append(file_id)
+            query += " GROUP BY file_id HAVING COUNT(*) = ?"
+            parameters.append(len(chunk))
+            matches = {row[0] for row in connection.execute(query, parameters)}
+            candidates = matches if candidates is None else candidates & matches
+            if not candidates:
+                break
+        return candidates or set()
+
+    def _entry(
+        self, connection: sqlite3.Connection, root: str, file_path: str
+    ) -> Optional[tuple[int, int, int]]:
+        """Returns the id, mtime and size a file was indexed with, if it was."""
+        absolute_path = os.path.abspath(file_path)
+        prefix = os.path.join(root, "")
+        # Stripping the root is much cheaper than relpath on every walked file.
+        if absolute_path.startswith(prefix):
+            relative_path = absolute_path[len(prefix) :]
+        else:
+            relative_path = os.path.relpath(absolute_path, root)
+        return connection.execute(
+            "SELECT id, mtime_ns, size FROM files WHERE path = ?", (relative_path,)
+        ).fetchone()
+
+    def _may_match(self, entry, file_path: str, candidates: set[int]) -> bool:
+        # Files that are not indexed or changed since are never ruled out.
+        if entry is None or entry[0] in candidates:
+            return True
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return False
+        return tuple(entry[1:]) != (stat.st_mtime_ns, stat.st_size)
+
+    def filter_files(
+        self, file_paths: Iterable[str], literals: list[str]
+    ) -> Iterator[str]:
+        """
+        Yields the files that may contain every literal. Files that are not in
+        the index or changed since it was updated are always yielded.
+
+        Only the ids of candidate files are loaded up front; each walked file
+        is then looked up by path.
+
+        Args:
+            file_paths: The files to filter.
+            literals: Substrings every match must contain (case-insensitive).
+        """
+        trigrams = self._query_trigrams(literals)
+        if not trigrams or not self.exists():
+            yield from file_paths
+            return
+
+        with closing(self._connect()) as connection:
+            root = self._root(connection)
+            if root is None:
+                yield from file_paths
+                return
+            candidates = self._candidates(connection, trigrams)
+            for file_path in file_paths:
+                entry = self._entry(connection, root, file_path)
+                if self._may_match(entry, file_path, candidates):
+                    yield file_path
+
+    def may_contain(self, file_path: str, literals: list[str]) -> bool:
+        """
+        Checks one file like filter_files, reading only that file's postings.
+
+        Args:
+            file_path: The file to check.
+            literals: Substrings every match must contain (case-insensitive).
+        """
+        trigrams = self._query_trigrams(literals)
+        if not trigrams or not self.exists():
+            return True
+        with closing(self._connect()) as connection:
+            root = self._root(connection)
+            if root is None:
+                return True
+            entry = self._entry(connection, root, file_path)
+            if entry is None:
+                return True
+            candidates = self._candidates(connection, trigrams, entry[0])
+            return self._may_match(entry, file_path, candidates)
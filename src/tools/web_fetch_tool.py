@@ -1,3 +1,4 @@
+import asyncio
 from playwright.async_api import async_playwright
 from html2text import html2text
 
@@ -5,11 +6,80 @@ from html2text import html2text
 class WebFetchTools:
     """
     A class for fetching web content using a headless browser.
+
+    The browser is started lazily on the first fetch and kept alive, together
+    with a bounded pool of reusable pages, until `aclose` is called.
     """
 
-    def __init__(self):
-        """Initializes the WebFetchTools."""
-        pass
+    def __init__(self, max_pages: int = 4):
+        """
+        Initializes the WebFetchTools.
+
+        Args:
+            max_pages: The maximum number of pages (each in its own browser
+                context) open at the same time.
+        """
+        self.max_pages = max_pages
+        self._playwright = None
+        self._browser = None
+        self._loop = None
+        self._start_lock = None
+        # Limits the pages in use; idle pages are only reused, so there are
+        # never more than max_pages open.
+        self._slots = None
+        self._idle_pages = []
+
+    async def _ensure_browser(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Playwright objects are bound to the loop they were created on, so
+            # anything left over from a previous loop cannot be reused.
+            self._playwright = None
+            self._browser = None
+            self._loop = loop
+            self._start_lock = asyncio.Lock()
+            self._slots = asyncio.Semaphore(self.max_pages)
+            self._idle_pages = []
+
+        async with self._start_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            # Pages of a crashed browser are dropped as they come back; the
+            # slots and their waiters carry over to the new browser.
+            self._browser = await self._playwright.chromium.launch()
+
+    def _is_usable(self, page) -> bool:
+        return (
+            not page.is_closed()
+            and page.context.browser is self._browser
+            and self._browser.is_connected()
+        )
+
+    async def _acquire_page(self):
+        await self._ensure_browser()
+        await self._slots.acquire()
+        try:
+            while self._idle_pages:
+                page = self._idle_pages.pop()
+                if self._is_usable(page):
+                    return page
+            await self._ensure_browser()
+            context = await self._browser.new_context()
+            return await context.new_page()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def _release_page(self, page) -> None:
+        try:
+            if self._is_usable(page):
+                self._idle_pages.append(page)
+            elif page.context.browser.is_connected():
+                await page.context.close()
+        finally:
+            self._slots.release()
 
     async def fetch_page_content(
         self, url: str, limit: int = -1, offset: int = 0, convert_to_text: bool = False
@@ -24,18 +94,32 @@ class WebFetchTools:
             The HTML content of the page as a string, or an error message.
         """
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch()
-                page = await browser.new_page()
+            page = await self._acquire_page()
+            try:
                 await page.goto(url)
                 content = await page.content()
-                await browser.close()
-                if convert_to_text:
-                    content = html2text(content)
-                if offset > 0:
-                    content = content[offset:]
-                if limit > -1:
-                    content = content[:limit]
-                return content
+            finally:
+                await self._release_page(page)
+            if convert_to_text:
+                content = html2text(content)
+            if offset > 0:
+                content = content[offset:]
+            if limit > -1:
+                content = content[:limit]
+            return content
         except Exception as e:
             return f"Error fetching URL {url} with headless browser: {e}"
+
+    async def aclose(self) -> None:
+        """
+        Closes the browser and stops Playwright. A later fetch starts them again.
+        """
+        if self._loop is not asyncio.get_running_loop():
+            return
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._browser = None
+        self._playwright = None
+        self._idle_pages = []
@@ -0,0 +1,323 @@
+import json
+import os
+import shutil
+import threading
+import uuid
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+DEFAULT_JOURNAL_DIR = "data/journal"
+
+
+def _fsync_file(path: str) -> None:
+    with open(path, "rb") as f:
+        os.fsync(f.fileno())
+
+
+def _fsync_directory(path: str) -> None:
+    # Makes renames in the directory durable; not every platform allows it.
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _remove(path: str | None) -> None:
+    if path is None:
+        return
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _try_lock(fd: int) -> bool:
+    # The OS drops the lock when the process holding it dies, so unlike a pid
+    # it cannot be mistaken for a live process after a restart.
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+class TransactionalWriter:
+    """
+    Writes files all-or-nothing. Every write goes through a transaction:
+    content is staged in a temporary file next to its target, the previous
+    version is kept as a backup, and the targets are replaced by atomic
+    renames once everything is on disk. A crash therefore never leaves a
+    file truncated.
+
+    Between begin() and commit(), writes are only staged and reads through
+    the writer see them, so a batch of edits to several files lands
+    together or not at all.
+
+    Each transaction has a journal in `journal_dir` listing its files and a
+    lock file it holds locked until it ends. A journal whose lock is free was
+    left behind by a process that died; it is rolled back when the next
+    writer is created, unless it records that the transaction committed; then
+    only its leftover files are removed.
+
+    Paths are resolved before writing, so writing a symlink replaces the file
+    it points to and the link is kept.
+    """
+
+    def __init__(self, journal_dir: str = DEFAULT_JOURNAL_DIR):
+        """
+        Initializes the TransactionalWriter and rolls back transactions
+        interrupted by a crash.
+
+        Args:
+            journal_dir: The directory holding the journals.
+        """
+        self.journal_dir = journal_dir
+        # Absolute path -> staged content, while a batch is open.
+        self._staged = None
+        self._lock = threading.Lock()
+        self.recovered = self.recover()
+
+    @property
+    def in_batch(self) -> bool:
+        return self._staged is not None
+
+    def begin(self) -> None:
+        """Starts staging writes until commit() or rollback()."""
+        with self._lock:
+            self._staged = {}
+
+    def rollback(self) -> None:
+        """Discards the writes staged since begin()."""
+        with self._lock:
+            self._staged = None
+
+    def staged_paths(self) -> list[str]:
+        """Returns the resolved paths staged since begin()."""
+        with self._lock:
+            return list(self._staged or ())
+
+    def read_text(self, file_path: str) -> str:
+        """
+        Reads a file as it will be after the staged writes.
+
+        Raises:
+            FileNotFoundError: If the file neither exists nor is staged.
+        """
+        with self._lock:
+            if self._staged is not None:
+                staged = self._staged.get(os.path.realpath(file_path))
+                if staged is not None:
+                    return staged
+        with open(file_path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def write_text(self, file_path: str, content: str) -> None:
+        """
+        Writes a file, staging it if a batch is open and committing it in a
+        transaction of its own otherwise.
+        """
+        with self._lock:
+            if self._staged is not None:
+                self._staged[os.path.realpath(file_path)] = content
+                return
+        self._commit({os.path.realpath(file_path): content})
+
+    def commit(self) -> list[str]:
+        """
+        Writes the staged files in one transaction and ends the batch.
+
+        Returns:
+            The paths written.
+
+        Raises:
+            OSError: If the transaction failed; it was rolled back and no
+                file was changed.
+        """
+        with self._lock:
+            staged, self._staged = self._staged or {}, None
+        if staged:
+            self._commit(staged)
+        return list(staged)
+
+    def _journal_path(self, transaction_id: str) -> str:
+        return os.path.join(self.journal_dir, f"{transaction_id}.json")
+
+    def _lock_path(self, transaction_id: str) -> str:
+        return os.path.join(self.journal_dir, f"{transaction_id}.lock")
+
+    def _lock_transaction(self, transaction_id: str) -> int | None:
+        """
+        Locks a transaction's lock file.
+
+        Returns:
+            The locked file descriptor, or None if another writer holds it.
+        """
+        fd = os.open(self._lock_path(transaction_id), os.O_RDWR | os.O_CREAT, 0o600)
+        if _try_lock(fd):
+            return fd
+        os.close(fd)
+        return None
+
+    def _unlock_transaction(self, transaction_id: str, fd: int) -> None:
+        os.close(fd)
+        if not os.path.exists(self._journal_path(transaction_id)):
+            _remove(self._lock_path(transaction_id))
+
+    def _write_journal(self, journal: dict) -> None:
+        path = self._journal_path(journal["id"])
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(journal, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        _fsync_directory(self.journal_dir)
+
+    def _commit(self, staged: dict) -> None:
+        transaction_id = uuid.uuid4().hex
+        files = []
+        for path in staged:
+            directory, name = os.path.split(path)
+            files.append(
+                {
+                    "path": path,
+                    "temp": os.path.join(directory, f".{name}.{transaction_id}.tmp"),
+                    "backup": os.path.join(directory, f".{name}.{transaction_id}.bak"),
+                }
+            )
+        journal = {
+            "id": transaction_id,
+            "pid": os.getpid(),
+            "state": "staging",
+            "files": files,
+        }
+        os.makedirs(self.journal_dir, exist_ok=True)
+        lock_fd = self._lock_transaction(transaction_id)
+        try:
+            self._commit_locked(journal, staged)
+        finally:
+            self._unlock_transaction(transaction_id, lock_fd)
+
+    def _commit_locked(self, journal: dict, staged: dict) -> None:
+        files = journal["files"]
+        # The journal names every file before any exists, so recovery can
+        # always clean up after a crash.
+        self._write_journal(journal)
+        try:
+            for file in files:
+                os.makedirs(os.path.dirname(file["path"]), exist_ok=True)
+                with open(file["temp"], "w", encoding="utf-8") as f:
+                    f.write(staged[file["path"]])
+            for file in files:
+                _fsync_file(file["temp"])
+                if os.path.exists(file["path"]):
+                    shutil.copymode(file["path"], file["temp"])
+                    try:
+                        os.link(file["path"], file["backup"])
+                    except OSError:
+                        shutil.copy2(file["path"], file["backup"])
+                else:
+                    file["backup"] = None
+            # From here a crash rolls the targets back to their backups.
+            journal["state"] = "committing"
+            self._write_journal(journal)
+            for file in files:
+                os.replace(file["temp"], file["path"])
+            for directory in {os.path.dirname(file["path"]) for file in files}:
+                _fsync_directory(directory)
+            # The commit point: from here recovery keeps the new files and
+            # only removes the backups.
+            self._write_journal({**journal, "state": "committed"})
+        except BaseException:
+            self._roll_back(journal)
+            raise
+        journal["state"] = "committed"
+        self._clean_up(journal)
+
+    def _clean_up(self, journal: dict) -> None:
+        """Removes the leftover files and the journal of a committed transaction."""
+        for file in journal["files"]:
+            _remove(file["temp"])
+            _remove(file["backup"])
+        _remove(self._journal_path(journal["id"]))
+
+    def _roll_back(self, journal: dict) -> None:
+        """
+        Restores the files of a transaction and removes its journal. If a file
+        cannot be restored, the journal is kept so recovery can retry.
+        """
+        complete = True
+        for file in journal["files"]:
+            try:
+                _remove(file["temp"])
+                if journal["state"] != "committing":
+                    _remove(file["backup"])
+                elif file["backup"] is None:
+                    # The file did not exist before the transaction.
+                    _remove(file["path"])
+                elif os.path.exists(file["backup"]):
+                    os.replace(file["backup"], file["path"])
+                    # Renaming a hard link onto the same file is a no-op that
+                    # leaves the backup in place.
+                    _remove(file["backup"])
+            except OSError:
+                complete = False
+        if complete:
+            _remove(self._journal_path(journal["id"]))
+
+    def recover(self) -> list[str]:
+        """
+        Rolls back the transactions of processes that died mid-commit.
+
+        Returns:
+            The paths restored to their previous version.
+        """
+        try:
+            names = os.listdir(self.journal_dir)
+        except FileNotFoundError:
+            return []
+        restored = []
+        transaction_ids = {
+            os.path.splitext(name)[0]
+            for name in names
+            if name.endswith((".json", ".lock"))
+        }
+        for transaction_id in sorted(transaction_ids):
+            lock_fd = self._lock_transaction(transaction_id)
+            if lock_fd is None:
+                # Its writer is still running.
+                continue
+            try:
+                restored.extend(self._recover_locked(transaction_id))
+            finally:
+                self._unlock_transaction(transaction_id, lock_fd)
+        return restored
+
+    def _recover_locked(self, transaction_id: str) -> list[str]:
+        # Read only once the lock is held, so a journal another writer just
+        # recovered is not rolled back twice.
+        try:
+            with open(self._journal_path(transaction_id), "r", encoding="utf-8") as f:
+                journal = json.load(f)
+        except (OSError, ValueError):
+            return []
+        if journal["state"] == "committed":
+            self._clean_up(journal)
+            return []
+        self._roll_back(journal)
+        if journal["state"] == "committing":
+            return [file["path"] for file in journal["files"]]
+        return []
@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.tools.file_manager import FileManagerTools
+from src.tools.write_transaction import TransactionalWriter
+
+
+class ListDirectoryTreeTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+        self.file_manager = FileManagerTools(
+            writer=TransactionalWriter(os.path.join(self.directory, "journal"))
+        )
+        self.workspace = os.path.join(self.directory, "workspace")
+        os.makedirs(os.path.join(self.workspace, "sub"))
+        with open(os.path.join(self.workspace, "a.txt"), "w") as f:
+            f.write("abc")
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_dangling_symlinks_are_listed(self):
+        missing = os.path.join(self.directory, "missing")
+        os.symlink(missing, os.path.join(self.workspace, "dangling"))
+        os.symlink(missing, os.path.join(self.workspace, "sub", "broken"))
+        lines = self.file_manager.list_directory_tree(self.workspace)
+        self.assertEqual(lines[0], "a.txt (3 B)")
+        self.assertTrue(lines[1].startswith("dangling ("))
+        self.assertEqual(lines[2], "sub/")
+        self.assertTrue(lines[3].startswith("  broken ("))
+
+    def test_scan_errors_are_reported(self):
+        error = OSError(5, "Input/output error")
+        with mock.patch.object(self.file_manager, "_scan_directory", side_effect=error):
+            lines = self.file_manager.list_directory_tree(self.workspace)
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].startswith("ERROR: Could not list"))
+
+
+if __name__ == "__main__":
+    unittest.main()
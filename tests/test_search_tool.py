@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+
+from src.tools.search_tool import WorkspaceSearchTools, required_literals
+from src.tools.trigram_index import TrigramIndex
+
+
+class RequiredLiteralsTest(unittest.TestCase):
+    def test_literal_query_is_required_whole(self):
+        self.assertEqual(required_literals("a.b(c", False), ["a.b(c"])
+
+    def test_class_escapes_end_a_literal(self):
+        self.assertEqual(required_literals(r"foo\d+barbaz", True), ["foo", "barbaz"])
+
+    def test_character_code_escapes_require_nothing(self):
+        for query in (
+            r"\x41BCDEF",
+            r"\u00e9tude",
+            r"\U000000e9tude",
+            r"\N{LATIN SMALL LETTER E WITH ACUTE}tude",
+            r"\101BCDEF",
+            r"(abc)\1def",
+        ):
+            with self.subTest(query=query):
+                self.assertEqual(required_literals(query, True), [])
+
+
+class IndexedSearchTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.workspace = os.path.join(self._directory.name, "workspace")
+        os.mkdir(self.workspace)
+        with open(os.path.join(self.workspace, "a.txt"), "w", encoding="utf-8") as f:
+            f.write("xx ABCDEF yy\nétude\n")
+        with open(os.path.join(self.workspace, "b.txt"), "w", encoding="utf-8") as f:
+            f.write("nothing here\n")
+        self.index = TrigramIndex(os.path.join(self._directory.name, "index.sqlite3"))
+        self.index.update(self.workspace)
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_index_never_hides_a_match(self):
+        plain = WorkspaceSearchTools()
+        indexed = WorkspaceSearchTools(index=self.index)
+        for query in (r"\x41BCDEF", r"\u00e9tude", r"\101BCDEF", "ABCDEF"):
+            with self.subTest(query=query):
+                expected = plain.search_workspace(query, self.workspace, is_regex=True)
+                self.assertEqual(len(expected), 1)
+                self.assertEqual(
+                    indexed.search_workspace(query, self.workspace, is_regex=True),
+                    expected,
+                )
+
+    def test_index_skips_files_without_the_literal(self):
+        files = [os.path.join(self.workspace, name) for name in ("a.txt", "b.txt")]
+        self.assertEqual(list(self.index.filter_files(files, ["ABCDEF"])), files[:1])
+
+    def test_may_contain_checks_one_file(self):
+        a, b = (os.path.join(self.workspace, name) for name in ("a.txt", "b.txt"))
+        self.assertTrue(self.index.may_contain(a, ["abcdef"]))
+        self.assertFalse(self.index.may_contain(b, ["abcdef"]))
+        with open(b, "a", encoding="utf-8") as f:
+            f.write("ABCDEF\n")
+        # Files changed since the index was updated are never ruled out.
+        self.assertTrue(self.index.may_contain(b, ["abcdef"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,168 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.tools.write_transaction import TransactionalWriter, _try_lock
+
+
+class TransactionalWriterTest(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+        self.journal_dir = os.path.join(self.directory, "journal")
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def write(self, name: str, content: str) -> None:
+        with open(self.path(name), "w", encoding="utf-8") as f:
+            f.write(content)
+
+    def read(self, name: str) -> str:
+        with open(self.path(name), "r", encoding="utf-8") as f:
+            return f.read()
+
+    def leftovers(self) -> list[str]:
+        """The journals and temporary or backup files left behind."""
+        names = [name for name in os.listdir(self.directory) if name.startswith(".")]
+        if os.path.isdir(self.journal_dir):
+            names += os.listdir(self.journal_dir)
+        return names
+
+    def recover(self) -> TransactionalWriter:
+        return TransactionalWriter(self.journal_dir)
+
+    def crash_while_committing(self) -> str:
+        """Leaves a.txt replaced and b.txt created by a transaction that crashed."""
+        self.write("a.txt", "a1")
+        writer = TransactionalWriter(self.journal_dir)
+        writer.begin()
+        writer.write_text(self.path("a.txt"), "a2")
+        writer.write_text(self.path("b.txt"), "b2")
+        write_journal = writer._write_journal
+
+        def crash_at_commit_point(journal):
+            if journal["state"] == "committed":
+                raise KeyboardInterrupt
+            write_journal(journal)
+
+        with mock.patch.object(writer, "_write_journal", crash_at_commit_point):
+            with mock.patch.object(writer, "_roll_back"):
+                with self.assertRaises(KeyboardInterrupt):
+                    writer.commit()
+        self.assertEqual(self.read("a.txt"), "a2")
+        (name,) = [
+            name for name in os.listdir(self.journal_dir) if name.endswith(".json")
+        ]
+        return os.path.splitext(name)[0]
+
+    def test_batch_writes_every_file(self):
+        self.write("a.txt", "a1")
+        writer = TransactionalWriter(self.journal_dir)
+        writer.begin()
+        writer.write_text(self.path("a.txt"), "a2")
+        writer.write_text(self.path("b.txt"), "b2")
+        self.assertEqual(writer.read_text(self.path("a.txt")), "a2")
+        self.assertEqual(self.read("a.txt"), "a1")
+        writer.commit()
+        self.assertEqual((self.read("a.txt"), self.read("b.txt")), ("a2", "b2"))
+        self.assertEqual(self.leftovers(), [])
+
+    def test_write_through_symlink_keeps_link(self):
+        self.write("target.txt", "old")
+        os.symlink(self.path("target.txt"), self.path("link.txt"))
+        writer = TransactionalWriter(self.journal_dir)
+        writer.write_text(self.path("link.txt"), "new")
+        self.assertTrue(os.path.islink(self.path("link.txt")))
+        self.assertEqual(self.read("target.txt"), "new")
+
+        writer.begin()
+        writer.write_text(self.path("link.txt"), "staged")
+        self.assertEqual(writer.read_text(self.path("target.txt")), "staged")
+        self.assertEqual(
+            writer.staged_paths(), [os.path.realpath(self.path("target.txt"))]
+        )
+        writer.commit()
+        self.assertTrue(os.path.islink(self.path("link.txt")))
+        self.assertEqual(self.read("target.txt"), "staged")
+
+    def test_failed_commit_changes_nothing(self):
+        self.write("a.txt", "a1")
+        writer = TransactionalWriter(self.journal_dir)
+        writer.begin()
+        writer.write_text(self.path("a.txt"), "a2")
+        writer.write_text(self.path("b.txt"), "b2")
+        replace = os.replace
+
+        def fail_on_second_target(source, destination):
+            if destination == self.path("b.txt"):
+                raise OSError("disk full")
+            replace(source, destination)
+
+        with mock.patch.object(os, "replace", side_effect=fail_on_second_target):
+            with self.assertRaises(OSError):
+                writer.commit()
+        self.assertEqual(self.read("a.txt"), "a1")
+        self.assertFalse(os.path.exists(self.path("b.txt")))
+        self.assertEqual(self.leftovers(), [])
+
+    def test_recovery_rolls_back_before_commit_point(self):
+        self.crash_while_committing()
+        recovered = self.recover().recovered
+        self.assertEqual(sorted(recovered), [self.path("a.txt"), self.path("b.txt")])
+        self.assertEqual(self.read("a.txt"), "a1")
+        self.assertFalse(os.path.exists(self.path("b.txt")))
+        self.assertEqual(self.leftovers(), [])
+
+    def test_recovery_keeps_committed_files(self):
+        self.write("a.txt", "a1")
+        writer = TransactionalWriter(self.journal_dir)
+        writer.begin()
+        writer.write_text(self.path("a.txt"), "a2")
+        writer.write_text(self.path("b.txt"), "b2")
+        # A crash after the commit point leaves the journal and the backups.
+        with mock.patch.object(writer, "_clean_up"):
+            writer.commit()
+        (name,) = [
+            name for name in os.listdir(self.journal_dir) if name.endswith(".json")
+        ]
+        with open(os.path.join(self.journal_dir, name), encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["state"], "committed")
+
+        self.assertEqual(self.recover().recovered, [])
+        self.assertEqual((self.read("a.txt"), self.read("b.txt")), ("a2", "b2"))
+        self.assertEqual(self.leftovers(), [])
+
+    def test_recovery_rolls_back_journal_of_same_pid(self):
+        # A restarted process can get the crashed one's pid, as PID 1 does in
+        # a container; the free lock still marks the journal as abandoned.
+        transaction_id = self.crash_while_committing()
+        with open(os.path.join(self.journal_dir, f"{transaction_id}.json")) as f:
+            self.assertEqual(json.load(f)["pid"], os.getpid())
+
+        self.assertEqual(len(self.recover().recovered), 2)
+        self.assertEqual(self.read("a.txt"), "a1")
+        self.assertEqual(self.leftovers(), [])
+
+    def test_recovery_skips_transaction_still_running(self):
+        transaction_id = self.crash_while_committing()
+        fd = os.open(
+            os.path.join(self.journal_dir, f"{transaction_id}.lock"), os.O_RDWR
+        )
+        try:
+            self.assertTrue(_try_lock(fd))
+            self.assertEqual(self.recover().recovered, [])
+            self.assertEqual(self.read("a.txt"), "a2")
+        finally:
+            os.close(fd)
+        self.assertEqual(len(self.recover().recovered), 2)
+        self.assertEqual(self.read("a.txt"), "a1")
+
+
+if __name__ == "__main__":
+    unittest.main()